@@ -1,15 +1,57 @@
 import os
 import logging
-import json
+import platform
 import time
-import uuid
 import secrets
+import threading
+from collections import deque
+from typing import Any
 from flask import Flask, request, g, Response
 from .config import get_config
 from .web import register_routes
-from .services import build_services
+from .services import build_services, get_cache_metrics, get_cache_policy
 from .security import SecurityHeaders, setup_cors
-from .logging_utils import setup_logging, RequestLogger
+from .logging_utils import setup_logging, RequestLogger, snapshot_request_context, start_queue_logging
+from .json_utils import dumps as _dumps, dumps_str as _dumps_str
+from .error_handler import json_error_response, PAYLOAD_TOO_LARGE_BODY, RATE_LIMITED_BODY
+from .middleware import ObservabilityMiddleware, ENV_REQUEST_ID, ENV_TRACE_ID, ENV_SPAN_ID, ENV_ROUTE
+
+try:
+    from .version import __version__ as _VERSION
+except Exception:
+    _VERSION = "unknown"
+# Runtime constants, resolved once at import
+_PY_VER = platform.python_version()
+
+# Number of rate-limited requests (per shard) between sweeps of idle limiter keys
+_RATE_LIMIT_SWEEP_EVERY = 1024
+# Lock shards for rate-limiter state; must be a power of two
+_RATE_LIMIT_SHARDS = 16
+_RATE_LIMITED_PATHS = frozenset({"/api/price", "/api/solve"})
+# High-frequency probe and scrape endpoints: no auth, no trace parsing, no access log
+_PROBE_PATHS = frozenset({"/live", "/ready", "/health", "/metrics"})
+_LIVE_BODY = b'{"status":"ok"}'
+
+# LogRecord attributes (set via logger extra=) copied into JSON log lines
+_LOG_EXTRA_KEYS = ("request_id", "method", "path", "status", "duration_ms", "env", "version", "trace_id", "span_id")
+
+# Security headers that do not depend on configuration, applied in one update per response
+_STATIC_SEC_HEADERS = (
+    ("X-Content-Type-Options", "nosniff"),
+    ("X-Frame-Options", "DENY"),
+    ("Referrer-Policy", "no-referrer"),
+)
+
+# Plotly-friendly safe default CSP applied in production when none is configured
+_PROD_DEFAULT_CSP = (
+    "default-src 'none'; "
+    "script-src 'self' https://cdn.plot.ly; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data:; "
+    "connect-src 'self'; "
+    "font-src 'self' data:; "
+    "frame-ancestors 'none'"
+)
 
 
 def create_app(env: str | None = None) -> Flask:
@@ -17,7 +59,9 @@ def create_app(env: str | None = None) -> Flask:
     # Point templates to the project-root templates directory
     template_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir, 'templates'))
     app = Flask(__name__, template_folder=template_dir)
-    app.config.from_mapping(cfg.model_dump())
+    # Dump the settings once; the same mapping feeds app.config, security headers and CORS
+    cfg_dict = cfg.model_dump()
+    app.config.from_mapping(cfg_dict)
     # Enforce request size limits for safety
     try:
         mcl = int(app.config.get("MAX_CONTENT_LENGTH", cfg.MAX_CONTENT_LENGTH))
@@ -28,16 +72,7 @@ def create_app(env: str | None = None) -> Flask:
     # Default a conservative CSP in production if not explicitly configured
     try:
         if str(app.config.get("ENV", "")).lower().startswith("prod") and not app.config.get("CONTENT_SECURITY_POLICY"):
-            # Plotly-friendly safe default CSP
-            app.config["CONTENT_SECURITY_POLICY"] = (
-                "default-src 'none'; "
-                "script-src 'self' https://cdn.plot.ly; "
-                "style-src 'self' 'unsafe-inline'; "
-                "img-src 'self' data:; "
-                "connect-src 'self'; "
-                "font-src 'self' data:; "
-                "frame-ancestors 'none'"
-            )
+            app.config["CONTENT_SECURITY_POLICY"] = _PROD_DEFAULT_CSP
     except Exception:
         # Do not fail app startup due to config inspection
         pass
@@ -45,35 +80,28 @@ def create_app(env: str | None = None) -> Flask:
     # Configure logging
     log_level = getattr(logging, app.config.get("LOG_LEVEL", "INFO"), logging.INFO)
     class JsonFormatter(logging.Formatter):
+        def __init__(self, env: str | None, version: str) -> None:
+            super().__init__()
+            # Static per-process fields, resolved once instead of per record
+            self._env = env
+            self._version = version
+            self._dumps = _dumps_str
+
         def format(self, record: logging.LogRecord) -> str:
-            payload = {
+            payload: dict[str, Any] = {
                 "ts": self.formatTime(record, self.datefmt),
                 "level": record.levelname,
                 "logger": record.name,
                 "msg": record.getMessage(),
             }
-            # Attach contextual fields if present
-            try:
-                from flask import g, request
-                payload.update({
-                    "request_id": getattr(g, "request_id", ""),
-                    "method": getattr(request, "method", None),
-                    "path": getattr(request, "path", None),
-                    "trace_id": getattr(g, "trace_id", ""),
-                    "span_id": getattr(g, "span_id", ""),
-                })
-            except Exception:
-                pass
-            # Include environment and version if available
-            try:
-                payload["env"] = app.config.get("ENV")
-            except Exception:
-                pass
-            try:
-                from .version import __version__ as _ver
-                payload["version"] = _ver
-            except Exception:
-                pass
+            # Attach contextual fields if present (snapshotted when the record was queued)
+            rd = record.__dict__
+            ctx = rd["_request_ctx"] if "_request_ctx" in rd else snapshot_request_context()
+            if ctx:
+                payload.update(ctx)
+            # Include environment and version
+            payload["env"] = self._env
+            payload["version"] = self._version
             # Include exception info if present
             if getattr(record, "exc_info", None):
                 try:
@@ -84,25 +112,26 @@ def create_app(env: str | None = None) -> Flask:
                 except Exception:
                     pass
             # Also include any extra fields passed via logger.extra
-            payload.update({k: v for k, v in record.__dict__.items() if k in {"request_id","method","path","status","duration_ms","env","version","trace_id","span_id"}})
-            import json as _json
-            return _json.dumps(payload)
+            for k in _LOG_EXTRA_KEYS:
+                if k in rd:
+                    payload[k] = rd[k]
+            return self._dumps(payload)
     if app.config.get("LOG_FORMAT") == "json":
+        json_formatter = JsonFormatter(app.config.get("ENV"), _VERSION)
+        # Format and write on a background listener thread; request threads only enqueue
+        stream_handler = logging.StreamHandler()
+        stream_handler.setFormatter(json_formatter)
+        queue_handler, listener = start_queue_logging(stream_handler)
+        app.extensions["log_listener"] = listener
         # Configure root logger with JSON formatter so all module logs are consistent
         root = logging.getLogger()
-        root.handlers = []
-        root_handler = logging.StreamHandler()
-        root_handler.setFormatter(JsonFormatter())
-        root.addHandler(root_handler)
+        root.handlers = [queue_handler]
         root.setLevel(log_level)
         
         # Configure app and access loggers explicitly (do not propagate to avoid double logs)
         for logger_name in (app.logger.name, "flask.access"):
             logger = logging.getLogger(logger_name)
-            logger.handlers = []
-            handler = logging.StreamHandler()
-            handler.setFormatter(JsonFormatter())
-            logger.addHandler(handler)
+            logger.handlers = [queue_handler]
             logger.setLevel(log_level)
             logger.propagate = False
     else:
@@ -113,10 +142,10 @@ def create_app(env: str | None = None) -> Flask:
         app.logger.setLevel(log_level)
 
     # Setup security headers
-    security_headers = SecurityHeaders(app, cfg.model_dump())
+    security_headers = SecurityHeaders(app, cfg_dict)
     
     # Setup CORS
-    setup_cors(app, cfg.model_dump())
+    setup_cors(app, cfg_dict)
 
     # Startup auth configuration warning (log at startup, fail closed at request time)
     try:
@@ -173,23 +202,18 @@ def create_app(env: str | None = None) -> Flask:
             def metrics():
                 # Update gauges at scrape time
                 try:
-                    from .services import get_cache_metrics as _gcm, get_cache_policy as _gcp
-                    m = _gcm()
+                    m = get_cache_metrics()
                     CACHE_HITS.set(float(m.get("hits", 0)))
                     CACHE_MISSES.set(float(m.get("misses", 0)))
                     CACHE_EVICTIONS.set(float(m.get("evictions", 0)))
-                    p = _gcp()
+                    p = get_cache_policy()
                     CACHE_SIZE.set(float(p.get("size", 0)))
                     CACHE_TTL.set(float(p.get("ttl_seconds", 0)))
                 except Exception:
                     pass
                 # Build info gauge with labels
                 try:
-                    from .version import __version__ as _ver
-                except Exception:
-                    _ver = "unknown"
-                try:
-                    BUILD_INFO.labels(version=str(_ver), env=str(app.config.get("ENV"))).set(1)
+                    BUILD_INFO.labels(version=str(_VERSION), env=str(app.config.get("ENV"))).set(1)
                 except Exception:
                     pass
                 resp = Response(generate_latest(registry), mimetype=CONTENT_TYPE_LATEST)
@@ -204,197 +228,173 @@ def create_app(env: str | None = None) -> Flask:
         REQ_COUNT = None
         REQ_LATENCY = None
 
+    # Resolve per-request settings once; the request hooks below only read closure locals.
+    # CONTENT_SECURITY_POLICY, ENV and TESTING stay dynamic since they are commonly
+    # adjusted on app.config after the factory returns (e.g. in tests).
+    _req_id_hdr = app.config.get("REQUEST_ID_HEADER", "X-Request-ID")
+    _enable_rl = bool(app.config.get("ENABLE_RATE_LIMIT", False))
+    _enable_auth = bool(app.config.get("ENABLE_AUTH", False))
+    # Credentials are read from the environment once; rotating them requires a restart.
+    _expected_user = os.getenv(app.config.get("AUTH_USER_ENV", "API_USER"), "").encode("utf-8")
+    _expected_pass = os.getenv(app.config.get("AUTH_PASS_ENV", "API_PASS"), "").encode("utf-8")
+    _auth_configured = bool(_expected_user and _expected_pass)
+    _sec_enabled = bool(app.config.get("SECURITY_HEADERS_ENABLED", True))
+    _rl_init_lock = threading.Lock()
+
     @app.before_request
     def _before():
-        g._start = time.time()
-        header_name = app.config.get("REQUEST_ID_HEADER", "X-Request-ID")
-        g.request_id = request.headers.get(header_name) or str(uuid.uuid4())
-        # Optional trace context from W3C traceparent or custom headers
-        try:
-            tp = request.headers.get("traceparent") or request.headers.get("Traceparent")
-            trace_id = ""
-            span_id = ""
-            if tp:
-                # Format: version-traceid-spanid-flags
-                parts = tp.split("-")
-                if len(parts) >= 4:
-                    trace_id = parts[1]
-                    span_id = parts[2]
-            # Fallback custom headers
-            trace_id = trace_id or request.headers.get("X-Trace-Id", "")
-            span_id = span_id or request.headers.get("X-Span-Id", "")
-            g.trace_id = trace_id
-            g.span_id = span_id
-        except Exception:
-            pass
+        # Bind request attributes once; each request.* access goes through the LocalProxy
+        environ = request.environ
+        path = request.path
+        # Request id and trace context are assigned by ObservabilityMiddleware
+        g.request_id = environ.get(ENV_REQUEST_ID) or secrets.token_hex(16)
+        g.trace_id = environ.get(ENV_TRACE_ID, "")
+        g.span_id = environ.get(ENV_SPAN_ID, "")
+        # Publish the matched URL rule for the metrics path label
+        rule = request.url_rule
+        if rule is not None:
+            environ[ENV_ROUTE] = rule.rule
+        # Probe/metrics endpoints are never rate limited or authenticated
+        if path in _PROBE_PATHS:
+            return None
         # Optional simple rate limiting for POST API endpoints
         try:
-            if app.config.get("ENABLE_RATE_LIMIT", False) and request.method.upper() == "POST" and request.path in {"/api/price", "/api/solve"}:
-                # Initialize limiter state lazily
+            if _enable_rl and request.method == "POST" and path in _RATE_LIMITED_PATHS:
+                # Initialize limiter state lazily (once, even under threaded servers)
                 rl = app.extensions.get("rate_limit")
                 if rl is None:
-                    from collections import defaultdict
-                    rl = {
-                        "counters": defaultdict(list),  # key -> [timestamps]
-                        "limit": int(app.config.get("RATE_LIMIT_PER_MIN", 60)),
-                        "window": int(app.config.get("RATE_LIMIT_WINDOW_SECONDS", 60)),
-                    }
-                    app.extensions["rate_limit"] = rl
-                key = f"{request.remote_addr or 'unknown'}|{request.path}"
-                now_ts = time.time()
-                window = int(rl.get("window", 60))
-                limit = int(rl.get("limit", 60))
-                buf = rl["counters"][key]
-                # Drop old entries
-                cutoff = now_ts - float(window)
-                i = 0
-                for t in buf:
-                    if t >= cutoff:
-                        break
-                    i += 1
-                if i > 0:
-                    del buf[:i]
+                    with _rl_init_lock:
+                        rl = app.extensions.get("rate_limit")
+                        if rl is None:
+                            rl = {
+                                "limit": int(app.config.get("RATE_LIMIT_PER_MIN", 60)),
+                                "window": int(app.config.get("RATE_LIMIT_WINDOW_SECONDS", 60)),
+                                # Keys are spread over independently locked shards to limit contention;
+                                # each shard maps key -> monotonic ns timestamps, oldest first (bounded by limit)
+                                "shards": [
+                                    {"lock": threading.Lock(), "counters": {}, "calls": 0}
+                                    for _ in range(_RATE_LIMIT_SHARDS)
+                                ],
+                            }
+                            app.extensions["rate_limit"] = rl
+                key = f"{request.remote_addr or 'unknown'}|{path}"
+                window = rl["window"]
+                limit = rl["limit"]
+                shard = rl["shards"][hash(key) & (_RATE_LIMIT_SHARDS - 1)]
+                now_ts = time.monotonic_ns()
+                cutoff = now_ts - window * 1_000_000_000
+                with shard["lock"]:
+                    counters = shard["counters"]
+                    # Periodically drop idle keys so one-shot clients don't grow the shard
+                    shard["calls"] += 1
+                    if shard["calls"] % _RATE_LIMIT_SWEEP_EVERY == 0:
+                        for k in [k for k, b in counters.items() if not b or b[-1] < cutoff]:
+                            del counters[k]
+                    buf = counters.get(key)
+                    if buf is None:
+                        buf = counters[key] = deque(maxlen=limit)
+                    # Drop old entries
+                    while buf and buf[0] < cutoff:
+                        buf.popleft()
+                    limited = len(buf) >= limit
+                    if not limited:
+                        # Record this request
+                        buf.append(now_ts)
                 # Check limit
-                if len(buf) >= limit:
+                if limited:
                     # Return 429 Too Many Requests
                     retry_after = max(1, int(window))
-                    from flask import jsonify
-                    if request.path.startswith("/api/"):
-                        resp = jsonify({"error": {"type": "rate_limited", "message": "Too many requests. Please retry later."}})
-                        resp.status_code = 429
+                    if path.startswith("/api/"):
+                        resp = json_error_response(RATE_LIMITED_BODY, 429)
                     else:
                         resp = Response("Too Many Requests", 429)
                     resp.headers["Retry-After"] = str(retry_after)
                     return resp
-                # Record this request
-                buf.append(now_ts)
         except Exception:
             # Do not fail request on limiter errors
             pass
         # Enforce auth in production if enabled, except for safe endpoints and when TESTING
-        if app.config.get("ENABLE_AUTH", False):
-            # Allow unauthenticated access to health/metrics endpoints
-            if request.path in ("/metrics", "/health", "/live", "/ready"):
-                return None
-            user_env = app.config.get("AUTH_USER_ENV", "API_USER")
-            pass_env = app.config.get("AUTH_PASS_ENV", "API_PASS")
-            expected_user = os.getenv(user_env, "")
-            expected_pass = os.getenv(pass_env, "")
-            # In TESTING mode, bypass auth only if credentials are not configured
-            if app.config.get("TESTING", False) and (not expected_user or not expected_pass):
-                return None
-            if not expected_user or not expected_pass:
+        if _enable_auth:
+            if not _auth_configured:
+                # In TESTING mode, bypass auth only if credentials are not configured
+                if app.config.get("TESTING", False):
+                    return None
                 return ("Service not configured for auth", 503)
             auth = request.authorization
-            if not auth or not (secrets.compare_digest(auth.username or "", expected_user) and secrets.compare_digest(auth.password or "", expected_pass)):
+            if not auth or not (
+                secrets.compare_digest((auth.username or "").encode("utf-8"), _expected_user)
+                and secrets.compare_digest((auth.password or "").encode("utf-8"), _expected_pass)
+            ):
                 resp = Response("Authentication required", 401)
                 resp.headers["WWW-Authenticate"] = "Basic realm=Restricted"
                 return resp
 
     @app.after_request
     def _after(response):
-        # Request ID header
-        header_name = app.config.get("REQUEST_ID_HEADER", "X-Request-ID")
-        response.headers.setdefault(header_name, getattr(g, "request_id", ""))
         # Security headers
-        if app.config.get("SECURITY_HEADERS_ENABLED", True):
-            response.headers["X-Content-Type-Options"] = "nosniff"
-            response.headers["X-Frame-Options"] = "DENY"
-            response.headers["Referrer-Policy"] = "no-referrer"
+        if _sec_enabled:
+            response.headers.update(_STATIC_SEC_HEADERS)
             csp = app.config.get("CONTENT_SECURITY_POLICY", "")
             # Apply default CSP in production if not set (handles late config changes in tests)
             if (not csp) and str(app.config.get("ENV", "")).lower().startswith("prod"):
-                csp = (
-                    "default-src 'none'; "
-                    "script-src 'self' https://cdn.plot.ly; "
-                    "style-src 'self' 'unsafe-inline'; "
-                    "img-src 'self' data:; "
-                    "connect-src 'self'; "
-                    "font-src 'self' data:; "
-                    "frame-ancestors 'none'"
-                )
+                csp = _PROD_DEFAULT_CSP
             if csp:
                 response.headers["Content-Security-Policy"] = csp
-        # Metrics
-        try:
-            dur = max(time.time() - getattr(g, "_start", time.time()), 0.0)
-            if 'REQ_COUNT' in locals() and REQ_COUNT is not None and 'REQ_LATENCY' in locals() and REQ_LATENCY is not None:
-                # Avoid high cardinality by trimming long paths a bit (still simplistic)
-                path_label = request.path[:100]
-                REQ_COUNT.labels(method=request.method, path=path_label, status=str(response.status_code)).inc()
-                REQ_LATENCY.labels(method=request.method, path=path_label).observe(dur)
-            # Access log
-            access_logger = logging.getLogger("flask.access")
-            if app.config.get("LOG_FORMAT") == "json":
-                access_logger.info(
-                    "request",
-                    extra={
-                        "request_id": getattr(g, "request_id", ""),
-                        "method": request.method,
-                        "path": request.path,
-                        "status": response.status_code,
-                        "duration_ms": int(dur * 1000),
-                        "trace_id": getattr(g, "trace_id", ""),
-                        "span_id": getattr(g, "span_id", ""),
-                    },
-                )
-            else:
-                access_logger.info(f"{request.method} {request.path} -> {response.status_code} ({dur*1000:.1f} ms) req_id={getattr(g, 'request_id', '')}")
-        except Exception:
-            pass
         return response
 
+    # Probe payloads are fixed for the lifetime of the process; serialize them once
+    try:
+        _status_body = _dumps({
+            "status": "ok",
+            "service": "Gemini IRD Pricer Flask",
+            "version": _VERSION,
+            "python": _PY_VER,
+            "env": app.config.get("ENV", "development"),
+        })
+    except Exception:
+        _status_body = _LIVE_BODY
+
     @app.route("/live", methods=["GET"]) 
     def live():
-        try:
-            payload = {"status": "ok"}
-            return Response(json.dumps(payload), mimetype="application/json")
-        except Exception:
-            return Response(json.dumps({"status": "ok"}), mimetype="application/json")
+        return Response(_LIVE_BODY, mimetype="application/json")
 
     @app.route("/ready", methods=["GET"]) 
     def ready():
-        try:
-            # Hook for future dependency checks; currently always ok
-            import platform
-            from .version import __version__ as _ver
-            payload = {
-                "status": "ok",
-                "service": "Gemini IRD Pricer Flask",
-                "version": _ver,
-                "python": platform.python_version(),
-                "env": app.config.get("ENV", "development"),
-            }
-            return Response(json.dumps(payload), mimetype="application/json")
-        except Exception:
-            return Response(json.dumps({"status": "ok"}), mimetype="application/json")
+        # Hook for future dependency checks; currently always ok
+        return Response(_status_body, mimetype="application/json")
 
     @app.route("/health", methods=["GET"]) 
     def health():
-        try:
-            import platform
-            from .version import __version__ as _ver
-            payload = {
-                "status": "ok",
-                "service": "Gemini IRD Pricer Flask",
-                "version": _ver,
-                "python": platform.python_version(),
-                "env": app.config.get("ENV", "development"),
-            }
-            return Response(json.dumps(payload), mimetype="application/json")
-        except Exception:
-            return Response(json.dumps({"status": "ok"}), mimetype="application/json")
+        return Response(_status_body, mimetype="application/json")
 
     # Payload too large handler (413)
     @app.errorhandler(413)
     def payload_too_large(e):
         try:
-            from flask import jsonify, request as _req
-            if str(getattr(_req, "path", "")).startswith("/api/"):
-                return jsonify({"error": {"type": "payload_too_large", "message": "Request payload too large."}}), 413
+            if str(getattr(request, "path", "")).startswith("/api/"):
+                return json_error_response(PAYLOAD_TOO_LARGE_BODY, 413)
         except Exception:
             pass
         return Response("Request entity too large", 413)
 
     register_routes(app, services)
+
+    # Request id, metrics and access logging run as one WSGI layer around the Flask app
+    # (Flask documents replacing the wsgi_app method for middleware)
+    app.wsgi_app = ObservabilityMiddleware(  # type: ignore[method-assign]
+        app.wsgi_app,
+        request_id_header=_req_id_hdr,
+        probe_paths=_PROBE_PATHS,
+        req_count=REQ_COUNT,
+        req_latency=REQ_LATENCY,
+        log_json=app.config.get("LOG_FORMAT") == "json",
+        logger=logging.getLogger("flask.access"),
+    )
+
+    # Pre-create per-route metric children so steady-state requests hit cached label sets
+    if REQ_COUNT is not None and REQ_LATENCY is not None:
+        for rule in app.url_map.iter_rules():
+            for method in (rule.methods or set()) - {"HEAD", "OPTIONS"}:
+                REQ_LATENCY.labels(method=method, path=rule.rule)
+                REQ_COUNT.labels(method=method, path=rule.rule, status="200")
     return app
@@ -1,38 +1,84 @@
 """Enhanced authentication with JWT support."""
 
 from __future__ import annotations
+import hashlib
 import jwt
+import threading
 import time
+from collections import OrderedDict
 from typing import Optional, Dict, Any
 from functools import wraps
-from flask import request, current_app, jsonify
+from flask import request, current_app
+from .error_handler import json_error_response
+from .json_utils import dumps as _dumps
 
 
 class JWTAuth:
-    """JWT-based authentication handler."""
+    """JWT-based authentication handler.
+
+    Verified payloads are cached per instance, keyed by a digest of the token, until
+    the earlier of the token's ``exp`` and ``cache_ttl`` seconds from verification.
+    """
+
+    # Tokens longer than this are rejected before hashing or signature checks
+    MAX_TOKEN_LENGTH = 4096
+    _DECODE_OPTIONS = {'require': ['exp', 'iat'], 'verify_exp': True, 'verify_signature': True}
     
-    def __init__(self, secret_key: str, algorithm: str = 'HS256'):
+    def __init__(self, secret_key: str, algorithm: str = 'HS256', cache_ttl: float = 5.0, cache_maxsize: int = 4096):
         self.secret_key = secret_key
         self.algorithm = algorithm
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        # token digest -> (valid_until, payload), least recently used first
+        self._verified: OrderedDict[bytes, tuple[float, Dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
     
     def generate_token(self, user_id: str, expires_in: int = 3600) -> str:
         """Generate JWT token for user."""
+        now = time.time()
         payload = {
             'user_id': user_id,
-            'exp': time.time() + expires_in,
-            'iat': time.time()
+            'exp': now + expires_in,
+            'iat': now
         }
         return jwt.encode(payload, self.secret_key, algorithm=self.algorithm)
     
     def validate_token(self, token: str) -> Optional[Dict[str, Any]]:
         """Validate JWT token and return payload."""
-        try:
-            payload = jwt.decode(token, self.secret_key, algorithms=[self.algorithm])
-            return payload
-        except jwt.ExpiredSignatureError:
+        if len(token) > self.MAX_TOKEN_LENGTH:
             return None
-        except jwt.InvalidTokenError:
+        key = hashlib.blake2b(token.encode('utf-8'), digest_size=16).digest()
+        now = time.time()
+        with self._lock:
+            hit = self._verified.get(key)
+            if hit is not None:
+                if hit[0] > now:
+                    self._verified.move_to_end(key)
+                    return dict(hit[1])
+                del self._verified[key]
+        try:
+            payload = jwt.decode(
+                token,
+                self.secret_key,
+                algorithms=[self.algorithm],
+                options=self._DECODE_OPTIONS,
+            )
+        except jwt.InvalidTokenError:  # includes ExpiredSignatureError and missing claims
             return None
+        valid_until = min(float(payload['exp']), now + self.cache_ttl)
+        with self._lock:
+            self._verified[key] = (valid_until, payload)
+            self._verified.move_to_end(key)
+            while len(self._verified) > self.cache_maxsize:
+                self._verified.popitem(last=False)
+        return dict(payload)
+
+
+# Rejection bodies are constant, so serialize them once at import
+_ERR_NO_TOKEN = _dumps({'error': {'type': 'unauthorized', 'message': 'JWT token required'}})
+_ERR_BAD_TOKEN = _dumps({'error': {'type': 'unauthorized', 'message': 'Invalid or expired token'}})
+_ERR_NO_JWT_CONFIG = _dumps({'error': {'type': 'server_error', 'message': 'JWT not configured'}})
+_ERR_RATE_LIMITED = _dumps({'error': {'type': 'rate_limited', 'message': 'Rate limit exceeded'}})
 
 
 def require_jwt_auth(f):
@@ -41,34 +87,23 @@ def require_jwt_auth(f):
     def decorated_function(*args, **kwargs):
         auth_header = request.headers.get('Authorization')
         if not auth_header or not auth_header.startswith('Bearer '):
-            return jsonify({
-                'error': {
-                    'type': 'unauthorized',
-                    'message': 'JWT token required'
-                }
-            }), 401
+            return json_error_response(_ERR_NO_TOKEN, 401)
         
         token = auth_header.split(' ')[1]
         jwt_secret = current_app.config.get('JWT_SECRET_KEY')
         
         if not jwt_secret:
-            return jsonify({
-                'error': {
-                    'type': 'server_error',
-                    'message': 'JWT not configured'
-                }
-            }), 500
+            return json_error_response(_ERR_NO_JWT_CONFIG, 500)
         
-        jwt_auth = JWTAuth(jwt_secret)
+        # Reuse one handler (and its verified-token cache) per app and secret
+        jwt_auth = getattr(current_app, '_jwt_auth', None)
+        if jwt_auth is None or jwt_auth.secret_key != jwt_secret:
+            jwt_auth = JWTAuth(jwt_secret)
+            current_app._jwt_auth = jwt_auth
         payload = jwt_auth.validate_token(token)
         
         if not payload:
-            return jsonify({
-                'error': {
-                    'type': 'unauthorized',
-                    'message': 'Invalid or expired token'
-                }
-            }), 401
+            return json_error_response(_ERR_BAD_TOKEN, 401)
         
         request.jwt_payload = payload
         return f(*args, **kwargs)
@@ -76,34 +111,75 @@ def require_jwt_auth(f):
     return decorated_function
 
 
+class _Shard:
+    """One independently locked slice of a RateLimiter's buckets."""
+
+    __slots__ = ("lock", "buckets", "calls")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.buckets: dict[str, int] = {}  # identifier -> theoretical arrival time (ns)
+        self.calls = 0  # drives the periodic idle sweep
+
+
 class RateLimiter:
-    """Enhanced rate limiting with per-user tracking."""
+    """Enhanced rate limiting with per-user tracking.
+
+    Token bucket per identifier: ``limit`` tokens refill continuously over
+    ``window_size`` seconds. The bucket is tracked in its equivalent GCRA form, a
+    single integer "theoretical arrival time" (monotonic nanoseconds) per user, so
+    the allow/deny decision is pure integer arithmetic. Buckets are spread over
+    independently locked shards so concurrent requests for unrelated identifiers
+    do not contend.
+    """
+
+    _SWEEP_EVERY = 10_000
+    _SHARDS = 16  # power of two
     
-    def __init__(self):
-        self.requests = {}
+    def __init__(self) -> None:
         self.window_size = 60  # 1 minute window
+        self.shards = [_Shard() for _ in range(self._SHARDS)]
     
     def is_allowed(self, identifier: str, limit: int) -> bool:
         """Check if request is within rate limit."""
-        now = time.time()
-        window_start = now - self.window_size
-        
-        if identifier not in self.requests:
-            self.requests[identifier] = []
-        
-        # Clean old requests
-        self.requests[identifier] = [
-            req_time for req_time in self.requests[identifier] 
-            if req_time > window_start
-        ]
-        
-        # Check limit
-        if len(self.requests[identifier]) >= limit:
-            return False
-        
-        # Add current request
-        self.requests[identifier].append(now)
-        return True
+        if limit <= 0:
+            return False  # an empty bucket never admits a request
+        window_ns = self.window_size * 1_000_000_000
+        interval_ns = window_ns // limit  # time for one token to refill
+        shard = self.shards[hash(identifier) & (self._SHARDS - 1)]
+        with shard.lock:
+            buckets = shard.buckets
+            now = time.monotonic_ns()
+            shard.calls += 1
+            if shard.calls % self._SWEEP_EVERY == 0:
+                self._sweep(buckets, now)
+
+            # A bucket whose TAT is in the past is full
+            tat = max(buckets.get(identifier, now), now) + interval_ns
+            if tat - now > window_ns:
+                return False
+            buckets[identifier] = tat
+            return True
+
+    def _sweep(self, buckets: dict[str, int], now: int) -> None:
+        """Drop idle buckets; a bucket whose TAT has passed is back at capacity."""
+        for key in [k for k, tat in buckets.items() if tat <= now]:
+            del buckets[key]
+
+
+# Serializes installing the per-app limiter so concurrent first requests share one
+_LIMITER_INSTALL_LOCK = threading.Lock()
+
+
+def _app_rate_limiter() -> RateLimiter:
+    limiter = getattr(current_app, '_rate_limiter', None)
+    if limiter is None:
+        with _LIMITER_INSTALL_LOCK:
+            limiter = getattr(current_app, '_rate_limiter', None)
+            if limiter is None:
+                limiter = RateLimiter()
+                current_app._rate_limiter = limiter
+    return limiter
 
 
 def rate_limit(limit: int = 100):
@@ -114,18 +190,8 @@ def rate_limit(limit: int = 100):
             # Use JWT user_id if available, otherwise IP
             identifier = getattr(request, 'jwt_payload', {}).get('user_id') or request.remote_addr
             
-            limiter = getattr(current_app, '_rate_limiter', None)
-            if not limiter:
-                limiter = RateLimiter()
-                current_app._rate_limiter = limiter
-            
-            if not limiter.is_allowed(identifier, limit):
-                return jsonify({
-                    'error': {
-                        'type': 'rate_limited',
-                        'message': 'Rate limit exceeded'
-                    }
-                }), 429
+            if not _app_rate_limiter().is_allowed(identifier, limit):
+                return json_error_response(_ERR_RATE_LIMITED, 429)
             
             return f(*args, **kwargs)
         return decorated_function
@@ -1,14 +1,21 @@
 from __future__ import annotations
 import argparse
-import json
-from .parsing import parse_maturity_date, load_yield_curve
+import sys
+from .parsing import parse_notional, parse_maturity_date, load_yield_curve
 from .pricer import price_swap, solve_par_rate
 from .utils import find_curve_file
 from .config import get_config
 
+try:
+    from .version import __version__
+except ImportError:
+    __version__ = "0.1.0"
 
-def main() -> int:
-    """CLI entry point for Gemini IRD Pricer."""
+
+_PARSER: argparse.ArgumentParser | None = None
+
+
+def _build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Gemini IRD Pricer CLI - Price interest rate swaps"
     )
@@ -18,21 +25,32 @@ def main() -> int:
     parser.add_argument("--data-dir", type=str, help="Override data directory")
     parser.add_argument("--config", action="store_true", help="Print configuration")
     parser.add_argument("--version", action="store_true", help="Print version")
+    return parser
+
+
+def _get_parser() -> argparse.ArgumentParser:
+    """Return the argument parser, built once per process."""
+    global _PARSER
+    if _PARSER is None:
+        _PARSER = _build_parser()
+    return _PARSER
+
 
-    args = parser.parse_args()
+def main(argv: list[str] | None = None) -> int:
+    """CLI entry point for Gemini IRD Pricer.
+
+    ``argv`` defaults to ``sys.argv[1:]``; pass a list to call the CLI in-process.
+    """
+    parser = _get_parser()
+    args = parser.parse_args(argv)
 
     try:
         if args.version:
-            try:
-                from .version import __version__
-                print(f"Gemini IRD Pricer v{__version__}")
-            except ImportError:
-                print("Gemini IRD Pricer v0.1.0")
+            print(f"Gemini IRD Pricer v{__version__}")
             return 0
         
         if args.config:
-            cfg = get_config()
-            print(json.dumps(cfg.model_dump(), indent=2))
+            print(get_config().model_dump_json(indent=2))
             return 0
 
         if not args.notional or not args.maturity:
@@ -40,19 +58,19 @@ def main() -> int:
             return 1
 
         try:
+            notional = parse_notional(args.notional)
+            maturity_date = parse_maturity_date(args.maturity)
             cfg = get_config()
-            config_dict = cfg.model_dump()
-            
             if args.data_dir:
-                config_dict["DATA_DIR"] = args.data_dir
+                # get_config() returns a shared instance; override on a copy
+                cfg = cfg.model_copy(update={"DATA_DIR": args.data_dir})
+            config_dict = cfg.model_dump()
 
-            file_path = find_curve_file(config_dict)
-            yield_curve = load_yield_curve(file_path)
+            file_path = find_curve_file(cfg)
+            yield_curve = load_yield_curve(file_path, data_dir=cfg.DATA_DIR)
 
             if args.fixed is not None:
                 # Price the swap
-                notional = float(args.notional.replace('m', '000000').replace('k', '000'))
-                maturity_date = parse_maturity_date(args.maturity)
                 fixed_rate = args.fixed / 100.0
                 
                 npv, schedule = price_swap(notional, fixed_rate, maturity_date, yield_curve, config_dict)
@@ -63,9 +81,6 @@ def main() -> int:
                 print(f"Maturity: {args.maturity}")
             else:
                 # Solve for par rate
-                notional = float(args.notional.replace('m', '000000').replace('k', '000'))
-                maturity_date = parse_maturity_date(args.maturity)
-                
                 par_rate = solve_par_rate(notional, maturity_date, yield_curve, config_dict)
                 
                 print(f"Par Rate: {par_rate * 100:.4f}%")
@@ -84,4 +99,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    exit(main())
+    sys.exit(main())
@@ -1,8 +1,19 @@
 import os
-from typing import List
-from pydantic import Field, field_validator
+from functools import lru_cache
+from typing import Any, List, Self
+from pydantic import Field, PrivateAttr, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
+# Allowed values for enumerated settings (ordered tuples are kept for error messages)
+_DAY_COUNTS = ("ACT/365F", "ACT/360", "30/360", "ACT/ACT")
+_DISCOUNTING_STRATEGIES = ("exp_cont", "simple", "comp_1", "comp_2", "comp_4", "comp_12")
+_VALID_DAY_COUNTS = frozenset(_DAY_COUNTS)
+_VALID_DISCOUNTING = frozenset(_DISCOUNTING_STRATEGIES)
+_VALID_INTERP = frozenset({"linear_zero", "log_linear_df"})
+_VALID_EXTRAP = frozenset({"clamp", "error"})
+_VALID_LOG_FORMATS = frozenset({"plain", "json"})
+_VALID_FREQS = frozenset({1, 2, 4, 12})
+
 
 class Config(BaseSettings):
     model_config = SettingsConfigDict(
@@ -33,16 +44,15 @@ class Config(BaseSettings):
     @field_validator('FIXED_FREQUENCY', 'DEFAULT_FREQUENCY')
     @classmethod
     def validate_frequency(cls, v: int) -> int:
-        if v not in [1, 2, 4, 12]:
+        if v not in _VALID_FREQS:
             raise ValueError(f"Frequency {v} must be 1, 2, 4, or 12 payments per year")
         return v
     
     @field_validator('DAY_COUNT')
     @classmethod
     def validate_day_count(cls, v: str) -> str:
-        valid_conventions = ["ACT/365F", "ACT/360", "30/360", "ACT/ACT"]
-        if v not in valid_conventions:
-            raise ValueError(f"Day count {v} must be one of {valid_conventions}")
+        if v not in _VALID_DAY_COUNTS:
+            raise ValueError(f"Day count {v} must be one of {list(_DAY_COUNTS)}")
         return v
     NUM_PRECISION: int = Field(default=4, ge=0, le=10, description="Numerical precision")
     VALUATION_TIME: str = Field(default="00:00:00", description="Valuation time")
@@ -56,6 +66,8 @@ class Config(BaseSettings):
     CURVE_CACHE_MAXSIZE: int = Field(default=4, ge=1, le=1024, description="Cache max size")
     CURVE_CACHE_TTL_SECONDS: int = Field(default=300, ge=1, le=86400, description="Cache TTL")
     CURVE_CACHE_ENABLED: bool = Field(default=True, description="Enable caching")
+    CURVE_CACHE_SWR_ENABLED: bool = Field(default=False, description="Serve expired curves up to 2x TTL while reloading in the background")
+    CURVE_STAT_COALESCE_SECONDS: float = Field(default=0.0, ge=0, le=60, description="Reuse a curve file's stat result for this long")
     
     # Limits and safety
     CURVE_MAX_POINTS: int = Field(default=200, ge=10, le=10000, description="Max curve points")
@@ -105,33 +117,55 @@ class Config(BaseSettings):
     ENABLE_RATE_LIMIT: bool = Field(default=False, description="Enable rate limiting")
     RATE_LIMIT_PER_MIN: int = Field(default=60, ge=1, le=100000, description="Rate limit per minute")
     RATE_LIMIT_WINDOW_SECONDS: int = Field(default=60, ge=1, le=3600, description="Rate limit window")
+
+    # Set on the instances get_config() hands out, which are shared between callers
+    _read_only: bool = PrivateAttr(default=False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._read_only and name in type(self).model_fields:
+            raise AttributeError(
+                f"Config from get_config() is shared and read-only; use model_copy(update={{{name!r}: ...}})"
+            )
+        super().__setattr__(name, value)
+
+    def model_copy(
+        self, *, update: dict[str, Any] | None = None, deep: bool = False
+    ) -> Self:
+        # Copies are private to the caller, so they start out writable
+        copy = super().model_copy(update=update, deep=deep)
+        copy._read_only = False
+        return copy
+
+    @property
+    def is_production(self) -> bool:
+        """True when ENV names a production environment."""
+        return self.ENV.lower().startswith("prod")
     
     @field_validator("EXTRAPOLATION_POLICY")
     @classmethod
     def validate_extrapolation_policy(cls, v: str) -> str:
-        if v not in ["clamp", "error"]:
+        if v not in _VALID_EXTRAP:
             raise ValueError("EXTRAPOLATION_POLICY must be 'clamp' or 'error'")
         return v
     
     @field_validator("INTERP_STRATEGY")
     @classmethod
     def validate_interp_strategy(cls, v: str) -> str:
-        if v not in ["linear_zero", "log_linear_df"]:
+        if v not in _VALID_INTERP:
             raise ValueError("INTERP_STRATEGY must be 'linear_zero' or 'log_linear_df'")
         return v
     
     @field_validator("DISCOUNTING_STRATEGY")
     @classmethod
     def validate_discounting_strategy(cls, v: str) -> str:
-        valid = ["exp_cont", "simple", "comp_1", "comp_2", "comp_4", "comp_12"]
-        if v not in valid:
-            raise ValueError(f"DISCOUNTING_STRATEGY must be one of {valid}")
+        if v not in _VALID_DISCOUNTING:
+            raise ValueError(f"DISCOUNTING_STRATEGY must be one of {list(_DISCOUNTING_STRATEGIES)}")
         return v
     
     @field_validator("LOG_FORMAT")
     @classmethod
     def validate_log_format(cls, v: str) -> str:
-        if v not in ["plain", "json"]:
+        if v not in _VALID_LOG_FORMATS:
             raise ValueError("LOG_FORMAT must be 'plain' or 'json'")
         return v
 
@@ -146,9 +180,34 @@ class ProductionConfig(Config):
     LOG_FORMAT: str = "json"
 
 
+# Environment variables that can influence a settings instance (case-sensitive field names)
+_CONFIG_ENV_KEYS = frozenset(Config.model_fields)
+
+
+@lru_cache(maxsize=8)
+def _load_config(cls: type[Config], env_snapshot: frozenset[tuple[str, str]]) -> Config:
+    cfg = cls()
+    cfg._read_only = True
+    return cfg
+
+
 def get_config(env: str | None = None) -> Config:
-    """Get configuration based on environment."""
+    """Get configuration based on environment.
+
+    Instances are memoized per settings class and snapshot of the relevant environment
+    variables, so repeated calls are cheap while environment changes still take effect.
+    Edits to the .env file are not detected; call ``clear_config_cache()`` to reload.
+    The returned object is shared, so assigning to its fields raises ``AttributeError``;
+    use ``model_copy(update=...)`` for a private variant.
+    """
     env_name = env or os.getenv("FLASK_ENV") or os.getenv("ENV") or "development"
-    if env_name.lower().startswith("prod"):
-        return ProductionConfig()
-    return Config()
+    cls = ProductionConfig if env_name.lower().startswith("prod") else Config
+    environ = os.environ
+    # Only set variables are looked up: os.environ.get() is slow for unset keys
+    snapshot = frozenset((k, environ[k]) for k in _CONFIG_ENV_KEYS.intersection(environ))
+    return _load_config(cls, snapshot)
+
+
+def clear_config_cache() -> None:
+    """Drop memoized instances so get_config() re-reads the environment and .env."""
+    _load_config.cache_clear()
@@ -1,25 +1,35 @@
 """Configuration validation and runtime checks."""
 from __future__ import annotations
 import os
+import stat
 import logging
+from importlib.util import find_spec
 from pathlib import Path
 from typing import Any, Dict, List
 from .config import Config
 from .error_handler import ConfigurationError
+from .utils import list_curve_files
 
 
 logger = logging.getLogger(__name__)
 
+# Packages checked for presence (via find_spec, without importing them)
+_REQUIRED = ("pandas", "numpy", "plotly", "pydantic", "flask")
+_VALIDATED = False
+
 
 def validate_config(config: Config) -> None:
     """Validate configuration at startup."""
     errors: List[str] = []
     
-    # Validate data directory
-    if not os.path.exists(config.DATA_DIR):
+    # Validate data directory (one stat call covers both checks)
+    try:
+        data_dir_mode = os.stat(config.DATA_DIR).st_mode
+    except OSError:
         errors.append(f"DATA_DIR does not exist: {config.DATA_DIR}")
-    elif not os.path.isdir(config.DATA_DIR):
-        errors.append(f"DATA_DIR is not a directory: {config.DATA_DIR}")
+    else:
+        if not stat.S_ISDIR(data_dir_mode):
+            errors.append(f"DATA_DIR is not a directory: {config.DATA_DIR}")
     
     # Validate financial parameters
     if config.NOTIONAL_MAX <= 0:
@@ -39,7 +49,7 @@ def validate_config(config: Config) -> None:
         errors.append("CURVE_CACHE_TTL_SECONDS must be positive")
     
     # Validate authentication in production
-    if config.ENV.lower().startswith("prod") and config.ENABLE_AUTH:
+    if config.is_production and config.ENABLE_AUTH:
         user_env = config.AUTH_USER_ENV
         pass_env = config.AUTH_PASS_ENV
         
@@ -58,7 +68,7 @@ def validate_config(config: Config) -> None:
             errors.append("RATE_LIMIT_WINDOW_SECONDS must be positive")
     
     if errors:
-        error_msg = "Configuration validation failed:\n" + "\n".join(f"- {error}" for error in errors)
+        error_msg = "Configuration validation failed:\n- " + "\n- ".join(errors)
         logger.error(error_msg)
         raise ConfigurationError(error_msg)
     
@@ -66,26 +76,22 @@ def validate_config(config: Config) -> None:
 
 
 def validate_runtime_dependencies() -> None:
-    """Validate runtime dependencies are available."""
-    try:
-        import pandas
-        import numpy
-        import plotly
-        import pydantic
-        import flask
-    except ImportError as e:
-        raise ConfigurationError(f"Missing required dependency: {e}")
+    """Validate runtime dependencies are available (checked once per process)."""
+    global _VALIDATED
+    if _VALIDATED:
+        return
+    for name in _REQUIRED:
+        if find_spec(name) is None:
+            raise ConfigurationError(f"Missing required dependency: No module named '{name}'")
     
+    _VALIDATED = True
     logger.info("Runtime dependencies validated")
 
 
 def check_curve_files(data_dir: str, curve_glob: str) -> bool:
     """Check if curve files are available."""
     try:
-        from glob import glob
-        pattern = os.path.join(data_dir, curve_glob)
-        files = glob(pattern)
-        return len(files) > 0
+        return len(list_curve_files(data_dir, curve_glob)) > 0
     except Exception as e:
         logger.warning(f"Error checking curve files: {e}")
         return False
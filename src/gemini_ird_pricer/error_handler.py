@@ -2,8 +2,9 @@
 from __future__ import annotations
 import logging
 from typing import Any, Dict, Optional
-from flask import Flask, jsonify, request, g
+from flask import Flask, Response, request, g, has_request_context
 from pydantic import ValidationError
+from .json_utils import dumps as _dumps
 
 
 class ConfigurationError(Exception):
@@ -21,6 +22,40 @@ class BusinessLogicError(Exception):
     pass
 
 
+def _error_body(err_type: str, message: str) -> bytes:
+    return _dumps({"error": {"type": err_type, "message": message}})
+
+
+# Constant error payloads, serialized once at import
+PAYLOAD_TOO_LARGE_BODY = _error_body("payload_too_large", "Request payload too large.")
+RATE_LIMITED_BODY = _error_body("rate_limited", "Too many requests. Please retry later.")
+_CONFIG_ERROR_BODY = _error_body("configuration_error", "Service configuration error")
+_NOT_FOUND_BODY = _error_body("not_found", "Required file not found")
+_SERVER_ERROR_BODY = _error_body("server_error", "An unexpected error occurred")
+
+
+def json_error_response(body: bytes, status: int) -> Response:
+    """Wrap a prebuilt JSON error body in a response."""
+    return Response(body, status=status, mimetype="application/json")
+
+
+def _request_context() -> Dict[str, Any]:
+    """Request fields attached to error logs, resolved once per request."""
+    if not has_request_context():
+        return {"request_path": "", "request_id": ""}
+    ctx = g.get('_err_ctx')
+    if ctx is None:
+        ctx = g._err_ctx = {
+            "request_path": request.path,
+            "request_id": g.get('request_id', ''),
+        }
+    return ctx
+
+
+def _log_extra(error_type: str, error: BaseException, **fields: Any) -> Dict[str, Any]:
+    return {"error_type": error_type, "error_message": str(error), **fields, **_request_context()}
+
+
 class ErrorHandler:
     """Centralized error handling with structured logging."""
     
@@ -42,121 +77,61 @@ class ErrorHandler:
         """Handle validation errors with structured response."""
         self.logger.warning(
             "validation_error",
-            extra={
-                "error_type": "validation_error",
-                "error_message": str(error),
-                "request_path": getattr(request, 'path', ''),
-                "request_id": getattr(g, 'request_id', ''),
-            }
+            extra=_log_extra("validation_error", error),
         )
-        return jsonify({
-            "error": {
-                "type": "validation_error",
-                "message": str(error)
-            }
-        }), 400
+        return json_error_response(_error_body("validation_error", str(error)), 400), 400
     
     def handle_business_error(self, error: BusinessLogicError) -> tuple[Any, int]:
         """Handle business logic errors."""
         self.logger.warning(
             "business_logic_error",
-            extra={
-                "error_type": "business_logic_error",
-                "error_message": str(error),
-                "request_path": getattr(request, 'path', ''),
-                "request_id": getattr(g, 'request_id', ''),
-            }
+            extra=_log_extra("business_logic_error", error),
         )
-        return jsonify({
-            "error": {
-                "type": "business_logic_error",
-                "message": str(error)
-            }
-        }), 422
+        return json_error_response(_error_body("business_logic_error", str(error)), 422), 422
     
     def handle_config_error(self, error: ConfigurationError) -> tuple[Any, int]:
         """Handle configuration errors."""
         self.logger.error(
             "configuration_error",
-            extra={
-                "error_type": "configuration_error",
-                "error_message": str(error),
-                "request_path": getattr(request, 'path', ''),
-                "request_id": getattr(g, 'request_id', ''),
-            }
+            extra=_log_extra("configuration_error", error),
         )
-        return jsonify({
-            "error": {
-                "type": "configuration_error",
-                "message": "Service configuration error"
-            }
-        }), 503
+        return json_error_response(_CONFIG_ERROR_BODY, 503), 503
     
     def handle_value_error(self, error: ValueError) -> tuple[Any, int]:
         """Handle value errors from input parsing."""
         self.logger.info(
             "input_error",
-            extra={
-                "error_type": "input_error",
-                "error_message": str(error),
-                "request_path": getattr(request, 'path', ''),
-                "request_id": getattr(g, 'request_id', ''),
-            }
+            extra=_log_extra("input_error", error),
         )
-        return jsonify({
-            "error": {
-                "type": "input_error",
-                "message": str(error)
-            }
-        }), 400
+        return json_error_response(_error_body("input_error", str(error)), 400), 400
     
     def handle_file_not_found(self, error: FileNotFoundError) -> tuple[Any, int]:
         """Handle file not found errors."""
         self.logger.warning(
             "file_not_found",
-            extra={
-                "error_type": "not_found",
-                "error_message": str(error),
-                "request_path": getattr(request, 'path', ''),
-                "request_id": getattr(g, 'request_id', ''),
-            }
+            extra=_log_extra("not_found", error),
         )
-        return jsonify({
-            "error": {
-                "type": "not_found",
-                "message": "Required file not found"
-            }
-        }), 404
+        return json_error_response(_NOT_FOUND_BODY, 404), 404
     
     def handle_generic_error(self, error: Exception) -> tuple[Any, int]:
         """Handle unexpected errors with full logging."""
         self.logger.exception(
             "unexpected_error",
-            extra={
-                "error_type": "server_error",
-                "error_class": error.__class__.__name__,
-                "error_message": str(error),
-                "request_path": getattr(request, 'path', ''),
-                "request_id": getattr(g, 'request_id', ''),
-            }
+            extra=_log_extra("server_error", error, error_class=error.__class__.__name__),
         )
-        return jsonify({
-            "error": {
-                "type": "server_error",
-                "message": "An unexpected error occurred"
-            }
-        }), 500
+        return json_error_response(_SERVER_ERROR_BODY, 500), 500
 
 
 def safe_config_get(config: Dict[str, Any], key: str, default: Any, expected_type: type = str) -> Any:
     """Safely get configuration value with type checking."""
-    try:
-        value = config.get(key, default)
-        if not isinstance(value, expected_type):
-            if expected_type in (int, float):
-                return expected_type(value)
-            return default
+    value = config.get(key, default)
+    if isinstance(value, expected_type):
         return value
+    if expected_type not in (int, float):
+        return default
+    # Only numeric coercion can fail; keep the exception handling on this branch
+    try:
+        return expected_type(value)
     except (ValueError, TypeError) as e:
         logging.getLogger(__name__).warning(f"Invalid config value for {key}: {e}, using default {default}")
         return default
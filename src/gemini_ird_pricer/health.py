@@ -3,33 +3,46 @@
 from __future__ import annotations
 import os
 import time
-from typing import Dict, Any, List
+from typing import Callable, Dict, Any, List
 from flask import Flask, jsonify, current_app
-import pandas as pd
-import numpy as np
+
+# Pricing dependencies are checked once, at import; readiness probes only read the result
+try:
+    import pandas  # noqa: F401
+    import numpy  # noqa: F401
+    _DEPS_ERROR: str | None = None
+except ImportError as e:  # pragma: no cover - the package itself requires both
+    _DEPS_ERROR = str(e)
+
+
+_LIVENESS_TEMPLATE = {'status': 'ok', 'service': 'gemini-ird-pricer'}
 
 
 class HealthChecker:
-    """Comprehensive health check implementation."""
+    """Comprehensive health check implementation.
+
+    Individual readiness check results are reused for ``HEALTH_CACHE_TTL`` seconds
+    (default 2), so frequent probes do not repeat the same filesystem checks.
+    """
     
-    def __init__(self, app: Flask = None):
+    def __init__(self, app: Flask = None, cache_ttl: float = 2.0):
         self.app = app
+        self.cache_ttl = cache_ttl
+        # (check name, DATA_DIR) -> (expires_at monotonic, result)
+        self._check_cache: Dict[tuple, tuple[float, Dict[str, Any]]] = {}
         if app:
             self.init_app(app)
     
     def init_app(self, app: Flask) -> None:
         """Initialize health checker with Flask app."""
+        self.cache_ttl = float(app.config.get('HEALTH_CACHE_TTL', self.cache_ttl))
         app.add_url_rule('/health', 'health', self.health_check)
         app.add_url_rule('/ready', 'ready', self.readiness_check)
         app.add_url_rule('/live', 'live', self.liveness_check)
     
     def liveness_check(self) -> tuple[Dict[str, Any], int]:
         """Basic liveness probe - always returns OK if service is running."""
-        return jsonify({
-            'status': 'ok',
-            'timestamp': time.time(),
-            'service': 'gemini-ird-pricer'
-        }), 200
+        return jsonify({**_LIVENESS_TEMPLATE, 'timestamp': time.time()}), 200
     
     def readiness_check(self) -> tuple[Dict[str, Any], int]:
         """Readiness probe - checks if service can handle requests."""
@@ -37,19 +50,19 @@ class HealthChecker:
         overall_status = 'ok'
         
         # Check data directory
-        data_dir_status = self._check_data_directory()
+        data_dir_status = self._cached_check('data_directory', self._check_data_directory)
         checks.append(data_dir_status)
         if data_dir_status['status'] != 'ok':
             overall_status = 'degraded'
         
         # Check dependencies
-        deps_status = self._check_dependencies()
+        deps_status = self._cached_check('dependencies', self._check_dependencies)
         checks.append(deps_status)
         if deps_status['status'] != 'ok':
             overall_status = 'error'
         
         # Check curve files
-        curve_status = self._check_curve_files()
+        curve_status = self._cached_check('curve_files', self._check_curve_files)
         checks.append(curve_status)
         if curve_status['status'] != 'ok':
             overall_status = 'degraded'
@@ -66,6 +79,17 @@ class HealthChecker:
         """Comprehensive health check with detailed diagnostics."""
         return self.readiness_check()
     
+    def _cached_check(self, name: str, check: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+        """Return a recent result for ``check`` or run it; keyed by DATA_DIR so config changes apply."""
+        key = (name, current_app.config.get('DATA_DIR'))
+        now = time.monotonic()
+        hit = self._check_cache.get(key)
+        if hit is not None and hit[0] > now:
+            return hit[1]
+        result = check()
+        self._check_cache[key] = (now + self.cache_ttl, result)
+        return result
+    
     def _check_data_directory(self) -> Dict[str, Any]:
         """Check if data directory exists and is accessible."""
         try:
@@ -91,24 +115,17 @@ class HealthChecker:
     
     def _check_dependencies(self) -> Dict[str, Any]:
         """Check critical dependencies are available."""
-        try:
-            # Test pandas
-            pd.DataFrame({'test': [1, 2, 3]})
-            
-            # Test numpy
-            np.array([1, 2, 3])
-            
+        if _DEPS_ERROR is None:
             return {
                 'name': 'dependencies',
                 'status': 'ok',
                 'message': 'All dependencies available'
             }
-        except Exception as e:
-            return {
-                'name': 'dependencies',
-                'status': 'error',
-                'message': f'Dependency check failed: {str(e)}'
-            }
+        return {
+            'name': 'dependencies',
+            'status': 'error',
+            'message': f'Dependency check failed: {_DEPS_ERROR}'
+        }
     
     def _check_curve_files(self) -> Dict[str, Any]:
         """Check if curve files are available."""
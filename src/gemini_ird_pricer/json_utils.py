@@ -0,0 +1,32 @@
+"""JSON serialization helpers with an optional orjson fast path."""
+from __future__ import annotations
+import json
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError:  # optional dependency: pip install gemini-ird-pricer[speedups]
+    orjson = None  # type: ignore[assignment]
+
+# Whether the orjson fast path is active (other modules pick their JSON engine from this)
+HAS_ORJSON: bool = orjson is not None
+
+
+if orjson is not None:
+    _ORJSON_OPTS: int = orjson.OPT_SERIALIZE_NUMPY
+
+    def dumps(obj: Any, _impl: Callable[..., bytes] = orjson.dumps, _opts: int = _ORJSON_OPTS) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (orjson, C extension)."""
+        return _impl(obj, default=str, option=_opts)
+
+    def dumps_str(obj: Any, _impl: Callable[..., bytes] = orjson.dumps, _opts: int = _ORJSON_OPTS) -> str:
+        """Serialize obj to a JSON str (e.g. for logging, which requires str)."""
+        return _impl(obj, default=str, option=_opts).decode("utf-8")
+else:
+    def dumps(obj: Any, _impl: Callable[..., str] = json.dumps) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes (stdlib fallback)."""
+        return _impl(obj, default=str).encode("utf-8")
+
+    def dumps_str(obj: Any, _impl: Callable[..., str] = json.dumps) -> str:
+        """Serialize obj to a JSON str (e.g. for logging, which requires str)."""
+        return _impl(obj, default=str)
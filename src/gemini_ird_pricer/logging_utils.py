@@ -1,31 +1,144 @@
 from __future__ import annotations
+import atexit
+import copy
 import logging
 import json
+import queue
 import sys
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from datetime import datetime
 from typing import Any, Dict, Optional
 from flask import request, g, has_request_context
+from .json_utils import dumps_str as _dumps_str
+
+# Keys (lower-cased) whose values are redacted from log entries
+_SENSITIVE_KEYS = frozenset({
+    'notional', 'fixed_rate', 'rate', 'password', 'token',
+    'api_key', 'authorization', 'user_id', 'email'
+})
+
+# Standard LogRecord attributes; anything else on a record is an ``extra`` field
+_LOGRECORD_STD_ATTRS = frozenset({
+    'name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
+    'filename', 'module', 'lineno', 'funcName', 'created',
+    'msecs', 'relativeCreated', 'thread', 'threadName',
+    'processName', 'process', 'getMessage', 'exc_info',
+    'exc_text', 'stack_info'
+})
+
+# Leaf types that sanitize_log_data returns as-is without isinstance probes
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None)})
 
 
 def sanitize_log_data(data: Dict[str, Any]) -> Dict[str, Any]:
-    """Sanitize sensitive data from log entries."""
-    sensitive_keys = {
-        'notional', 'fixed_rate', 'rate', 'password', 'token', 
-        'api_key', 'authorization', 'user_id', 'email'
+    """Sanitize sensitive data from log entries.
+
+    Copy-on-write: the input is never mutated, and dicts/lists that contain nothing
+    to redact are returned as-is rather than copied.
+    """
+    return _redact(data)
+
+
+def _redact(value: Any) -> Any:
+    if type(value) in _SCALAR_TYPES:
+        return value
+    if isinstance(value, dict):
+        out = None
+        for key, item in value.items():
+            # Most keys are already lowercase; skip allocating a lowered copy for them
+            if isinstance(key, str) and (key if key.islower() else key.lower()) in _SENSITIVE_KEYS:
+                new = '***REDACTED***'
+            else:
+                new = _redact(item)
+                if new is item:
+                    continue
+            if out is None:
+                out = dict(value)
+            out[key] = new
+        return value if out is None else out
+    if isinstance(value, list):
+        out_list = None
+        for i, item in enumerate(value):
+            new = _redact(item)
+            if new is not item:
+                if out_list is None:
+                    out_list = list(value)
+                out_list[i] = new
+        return value if out_list is None else out_list
+    return value
+
+
+def snapshot_request_context() -> Optional[Dict[str, Any]]:
+    """Capture the request fields log formatters attach, or None outside a request."""
+    if not has_request_context():
+        return None
+    return {
+        'request_id': getattr(g, 'request_id', ''),
+        'method': request.method,
+        'path': request.path,
+        'trace_id': getattr(g, 'trace_id', ''),
+        'span_id': getattr(g, 'span_id', ''),
     }
-    
-    sanitized = {}
-    for key, value in data.items():
-        if key.lower() in sensitive_keys:
-            sanitized[key] = '***REDACTED***'
-        elif isinstance(value, dict):
-            sanitized[key] = sanitize_log_data(value)
-        elif isinstance(value, list):
-            sanitized[key] = [sanitize_log_data(item) if isinstance(item, dict) else item for item in value]
+
+
+class ContextQueueHandler(QueueHandler):
+    """Queue records for a background listener, keeping what formatting needs.
+
+    The message is resolved and the Flask request context snapshotted (as
+    ``record._request_ctx``) on the logging thread, since neither is available
+    once the record reaches the listener. ``exc_info`` is kept because the queue
+    is in-process.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        record._request_ctx = snapshot_request_context()
+        return record
+
+
+# The process-wide listener; drained at interpreter exit
+_log_listener: Optional[QueueListener] = None
+_log_listener_lock = threading.Lock()
+
+
+def start_queue_logging(handler: logging.Handler) -> tuple[ContextQueueHandler, QueueListener]:
+    """Run ``handler`` on a background thread and return the queue handler that feeds it.
+
+    The process has one queue and listener thread. A later call (e.g. another
+    create_app()) swaps ``handler`` in on the running listener, so no thread is
+    left behind and queue handlers handed out earlier keep being drained.
+    """
+    global _log_listener
+    with _log_listener_lock:
+        listener = _log_listener
+        if listener is None:
+            q: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(q, handler, respect_handler_level=True)
+            listener.start()
+            _log_listener = listener
         else:
-            sanitized[key] = value
-    
-    return sanitized
+            listener.handlers = (handler,)
+        return ContextQueueHandler(listener.queue), listener
+
+
+def stop_queue_logging(listener: Optional[QueueListener] = None) -> None:
+    """Flush and stop the listener started by start_queue_logging.
+
+    Passing a ``listener`` that is no longer running is a no-op.
+    """
+    global _log_listener
+    with _log_listener_lock:
+        target = _log_listener
+        if target is None or (listener is not None and listener is not target):
+            return
+        _log_listener = None
+    target.stop()
+
+
+atexit.register(stop_queue_logging)
 
 
 class StructuredFormatter(logging.Formatter):
@@ -68,14 +181,14 @@ class StructuredFormatter(logging.Formatter):
         
         # Add extra fields
         for key, value in record.__dict__.items():
-            if key not in ('name', 'msg', 'args', 'levelname', 'levelno', 'pathname',
-                          'filename', 'module', 'lineno', 'funcName', 'created',
-                          'msecs', 'relativeCreated', 'thread', 'threadName',
-                          'processName', 'process', 'getMessage', 'exc_info',
-                          'exc_text', 'stack_info'):
+            if key not in _LOGRECORD_STD_ATTRS:
                 log_data[key] = value
         
-        return json.dumps(log_data, default=str)
+        try:
+            return _dumps_str(log_data)
+        except TypeError:
+            # orjson rejects a few values stdlib json accepts (e.g. ints beyond 64 bits)
+            return json.dumps(log_data, default=str)
 
 
 class PlainFormatter(logging.Formatter):
@@ -137,6 +250,9 @@ def get_logger(name: str) -> logging.Logger:
     return logging.getLogger(name)
 
 
+_rlog = get_logger(__name__)
+
+
 class RequestLogger:
     """Middleware for logging HTTP requests."""
     
@@ -157,7 +273,7 @@ class RequestLogger:
         # Generate request ID
         request_id = request.headers.get('X-Request-ID') or str(uuid.uuid4())
         g.request_id = request_id
-        g.start_time = time.time()
+        g.start_time = time.perf_counter()
         
         # Extract trace information from headers
         traceparent = request.headers.get('traceparent')
@@ -177,26 +293,28 @@ class RequestLogger:
         if not hasattr(g, 'span_id'):
             g.span_id = request.headers.get('X-Span-Id')
         
-        # Log request start
-        logger = get_logger(__name__)
-        logger.info(
-            "Request started",
-            extra={
-                'method': request.method,
-                'path': request.path,
-                'remote_addr': request.remote_addr,
-                'user_agent': request.headers.get('User-Agent', ''),
-            }
-        )
+        # Log request start (skip building extras when INFO is filtered out)
+        if _rlog.isEnabledFor(logging.INFO):
+            _rlog.info(
+                "Request started",
+                extra={
+                    'method': request.method,
+                    'path': request.path,
+                    'remote_addr': request.remote_addr,
+                    'user_agent': request.headers.get('User-Agent', ''),
+                }
+            )
     
     def after_request(self, response):
         """Log request completion."""
+        if not _rlog.isEnabledFor(logging.INFO):
+            return response
+        
         import time
         
-        duration_ms = (time.time() - g.start_time) * 1000 if hasattr(g, 'start_time') else 0
+        duration_ms = (time.perf_counter() - g.start_time) * 1000 if hasattr(g, 'start_time') else 0
         
-        logger = get_logger(__name__)
-        logger.info(
+        _rlog.info(
             "Request completed",
             extra={
                 'method': request.method,
@@ -0,0 +1,216 @@
+"""WSGI middleware for per-request observability (request id, metrics, access log)."""
+from __future__ import annotations
+
+import logging
+import secrets
+import time
+from collections.abc import Callable, Iterable, Iterator
+from types import TracebackType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from _typeshed.wsgi import StartResponse, WSGIApplication, WSGIEnvironment
+
+# WSGI environ keys shared with the Flask request hooks
+ENV_REQUEST_ID = "gemini_ird_pricer.request_id"
+ENV_TRACE_ID = "gemini_ird_pricer.trace_id"
+ENV_SPAN_ID = "gemini_ird_pricer.span_id"
+ENV_ROUTE = "gemini_ird_pricer.route"
+
+
+class _ObservedResponse:
+    """Response iterable that reports to ``on_close`` after the body has been consumed.
+
+    ``close`` is forwarded to the wrapped iterable first, as PEP 3333 requires.
+    """
+
+    __slots__ = ("_app_iter", "_on_close", "_failed")
+
+    def __init__(
+        self, app_iter: Iterable[bytes], on_close: Callable[[bool], None]
+    ) -> None:
+        self._app_iter = app_iter
+        self._on_close = on_close
+        self._failed = False
+
+    def __iter__(self) -> Iterator[bytes]:
+        try:
+            yield from self._app_iter
+        except Exception:
+            self._failed = True
+            raise
+
+    def close(self) -> None:
+        try:
+            close = getattr(self._app_iter, "close", None)
+            if close is not None:
+                close()
+        finally:
+            self._on_close(self._failed)
+
+
+def _observe_file_wrapper(
+    app_iter: Any, on_close: Callable[[bool], None]
+) -> Iterable[bytes] | None:
+    """Hook ``on_close`` into a ``wsgi.file_wrapper`` response, returning it unwrapped.
+
+    Servers only take their sendfile fast path for their own wrapper type, so the
+    object is passed through with its ``close`` chained instead of being wrapped.
+    Returns None when ``close`` cannot be replaced.
+    """
+    inner_close = getattr(app_iter, "close", None)
+
+    def close() -> None:
+        try:
+            if inner_close is not None:
+                inner_close()
+        finally:
+            on_close(False)
+
+    try:
+        app_iter.close = close
+    except AttributeError:
+        return None
+    return app_iter  # type: ignore[no-any-return]
+
+
+class ObservabilityMiddleware:
+    """Assign request ids, record Prometheus metrics and emit access logs in one pass.
+
+    Running these concerns around ``app.wsgi_app`` keeps them out of Flask's
+    before/after_request callback chain. The matched URL rule (used as the metrics
+    path label) is published into the environ by the app under ``ENV_ROUTE``.
+    Requests to ``probe_paths`` still get a request id and metrics, but skip trace
+    parsing and the access log.
+    Metrics and the access log are recorded when the server closes the response, so
+    the latency covers the whole body and a failure while streaming counts as a 500.
+    An exception raised by the wrapped app is recorded as a 500 and re-raised.
+    """
+
+    def __init__(
+        self,
+        wsgi_app: WSGIApplication,
+        request_id_header: str = "X-Request-ID",
+        req_count: Any = None,
+        req_latency: Any = None,
+        log_json: bool = False,
+        logger: logging.Logger | None = None,
+        probe_paths: frozenset[str] = frozenset(),
+    ) -> None:
+        self.wsgi_app = wsgi_app
+        self._hdr = request_id_header
+        self._hdr_lower = request_id_header.lower()
+        self._environ_hdr = "HTTP_" + request_id_header.upper().replace("-", "_")
+        self._req_count = req_count
+        self._req_latency = req_latency
+        self._log_json = log_json
+        self._logger = logger or logging.getLogger("flask.access")
+        self._probe_paths = probe_paths
+
+    def __call__(
+        self, environ: WSGIEnvironment, start_response: StartResponse
+    ) -> Iterable[bytes]:
+        start = time.perf_counter()
+        rid = environ.get(self._environ_hdr) or secrets.token_hex(16)
+        environ[ENV_REQUEST_ID] = rid
+        path = environ.get("PATH_INFO", "")
+        probe = path in self._probe_paths
+        if not probe:
+            self._parse_trace(environ)
+
+        captured: list[str] = []
+
+        def _start_response(
+            status: str,
+            headers: list[tuple[str, str]],
+            exc_info: (
+                tuple[type[BaseException], BaseException, TracebackType]
+                | tuple[None, None, None]
+                | None
+            ) = None,
+        ) -> Callable[[bytes], object]:
+            captured.append(status)
+            if not any(k.lower() == self._hdr_lower for k, _ in headers):
+                headers.append((self._hdr, rid))
+            return start_response(status, headers, exc_info)
+
+        def _on_close(failed: bool) -> None:
+            # Runs once the server has drained (or abandoned) the body, so streamed
+            # responses are timed in full and errors raised mid-body are counted
+            if failed:
+                status_line = "500 INTERNAL SERVER ERROR"
+            elif captured:
+                status_line = captured[-1]
+            else:
+                self._logger.debug(
+                    f"No response status for {path}; skipping request metrics"
+                )
+                return
+            try:
+                dur = time.perf_counter() - start
+                self._observe(environ, path, probe, status_line, dur)
+            except Exception:
+                # Observability must never fail the request
+                pass
+
+        try:
+            app_iter = self.wsgi_app(environ, _start_response)
+        except Exception:
+            _on_close(True)
+            raise
+        file_wrapper = environ.get("wsgi.file_wrapper")
+        if isinstance(file_wrapper, type) and isinstance(app_iter, file_wrapper):
+            passthrough = _observe_file_wrapper(app_iter, _on_close)
+            if passthrough is not None:
+                return passthrough
+        return _ObservedResponse(app_iter, _on_close)
+
+    @staticmethod
+    def _parse_trace(environ: WSGIEnvironment) -> None:
+        # Optional trace context from W3C traceparent (version-traceid-spanid-flags)
+        # or custom headers
+        trace_id = ""
+        span_id = ""
+        tp = environ.get("HTTP_TRACEPARENT")
+        if tp:
+            parts = tp.split("-")
+            if len(parts) >= 4:
+                trace_id = parts[1]
+                span_id = parts[2]
+        environ[ENV_TRACE_ID] = trace_id or environ.get("HTTP_X_TRACE_ID", "")
+        environ[ENV_SPAN_ID] = span_id or environ.get("HTTP_X_SPAN_ID", "")
+
+    def _observe(
+        self,
+        environ: WSGIEnvironment,
+        path: str,
+        probe: bool,
+        status_line: str,
+        dur: float,
+    ) -> None:
+        method = environ.get("REQUEST_METHOD", "")
+        status = status_line.split(" ", 1)[0]
+        if self._req_count is not None and self._req_latency is not None:
+            path_label = environ.get(ENV_ROUTE) or "__unknown__"
+            self._req_count.labels(method=method, path=path_label, status=status).inc()
+            self._req_latency.labels(method=method, path=path_label).observe(dur)
+        if probe or not self._logger.isEnabledFor(logging.INFO):
+            return
+        if self._log_json:
+            self._logger.info(
+                "request",
+                extra={
+                    "request_id": environ[ENV_REQUEST_ID],
+                    "method": method,
+                    "path": path,
+                    "status": int(status),
+                    "duration_ms": int(dur * 1000),
+                    "trace_id": environ[ENV_TRACE_ID],
+                    "span_id": environ[ENV_SPAN_ID],
+                },
+            )
+        else:
+            rid = environ[ENV_REQUEST_ID]
+            self._logger.info(
+                f"{method} {path} -> {status} ({dur*1000:.1f} ms) req_id={rid}"
+            )
@@ -1,16 +1,50 @@
 from __future__ import annotations
 import os
 import re
-import math
+import logging
+import warnings
 from datetime import datetime, timedelta
+from typing import NamedTuple
+import numpy as np
+import numpy.typing as npt
 import pandas as pd
 from .utils import parse_valuation_date_from_filename, ensure_in_data_dir, apply_valuation_time
 from .config import get_config
 from .error_handler import ValidationError, BusinessLogicError
 from .performance import performance_monitor
 
+_FloatArray = npt.NDArray[np.float64]
 
-@performance_monitor("parse_notional")
+
+_NOTIONAL_RE = re.compile(r"^(\d+\.?\d*)\s*([mkb])?$")
+_NOTIONAL_MULT = {None: 1, "k": 1_000, "m": 1_000_000, "b": 1_000_000_000}
+_TENOR_RE = re.compile(r"^(\d+)\s*(y|m|d)?$")
+# Tenor unit -> (days per unit, units per year); a bare number means years
+_TENOR_UNITS = {None: (365, 1), "y": (365, 1), "m": (30, 12), "d": (1, 365)}
+
+
+class _Bounds(NamedTuple):
+    notional_max: float
+    maturity_max_years: int
+    curve_max_points: int
+
+
+def _bounds() -> _Bounds:
+    """Input safety limits from the current (memoized) configuration."""
+    try:
+        cfg = get_config()
+        return _Bounds(
+            float(getattr(cfg, "NOTIONAL_MAX", 1e11)),
+            getattr(cfg, "MATURITY_MAX_YEARS", 100),
+            getattr(cfg, "CURVE_MAX_POINTS", 200),
+        )
+    except Exception as e:
+        # Log config error but don't fail parsing; fall back to the defaults
+        logging.getLogger(__name__).warning(f"Config error reading parse limits: {e}")
+        return _Bounds(1e11, 100, 200)
+
+
+@performance_monitor("parse_notional", optional=True)
 def parse_notional(notional_str: str) -> float:
     """Parse notional amount with enhanced validation."""
     if not isinstance(notional_str, str):
@@ -20,7 +54,7 @@ def parse_notional(notional_str: str) -> float:
     if not s:
         raise ValidationError("Notional cannot be empty")
     
-    match = re.match(r"^(\d+\.?\d*)\s*([mkb])?$", s)
+    match = _NOTIONAL_RE.match(s)
     if not match:
         raise ValidationError("Invalid notional format. Examples: 1000000, 10m, 250k.")
     
@@ -31,31 +65,20 @@ def parse_notional(notional_str: str) -> float:
     except ValueError:
         raise ValidationError(f"Invalid numeric value: {value_str}")
     
-    if suffix == "m":
-        v *= 1_000_000
-    elif suffix == "k":
-        v *= 1_000
-    elif suffix == "b":
-        v *= 1_000_000_000
+    v *= _NOTIONAL_MULT[suffix]
     
     if v <= 0:
         raise BusinessLogicError("Notional must be positive.")
     
     # Safety cap from configuration
-    try:
-        cfg = get_config()
-        notional_max = float(getattr(cfg, "NOTIONAL_MAX", 1e11))
-        if v > notional_max:
-            raise BusinessLogicError(f"Notional exceeds maximum of {notional_max:,.0f}.")
-    except Exception as e:
-        # Log config error but don't fail parsing
-        import logging
-        logging.getLogger(__name__).warning(f"Config error checking notional max: {e}")
+    notional_max = _bounds().notional_max
+    if v > notional_max:
+        raise BusinessLogicError(f"Notional exceeds maximum of {notional_max:,.0f}.")
     
     return v
 
 
-@performance_monitor("parse_maturity_date")
+@performance_monitor("parse_maturity_date", optional=True)
 def parse_maturity_date(maturity_str: str) -> datetime:
     """Parse maturity date with enhanced validation."""
     if not isinstance(maturity_str, str):
@@ -65,17 +88,17 @@ def parse_maturity_date(maturity_str: str) -> datetime:
     if not s:
         raise ValidationError("Maturity date cannot be empty")
     
+    now = datetime.now()
+    
     # Try parsing as ISO date first
-    try:
-        dt = datetime.strptime(s, "%Y-%m-%d")
-        if dt <= datetime.today():
+    dt = _parse_iso_date(s)
+    if dt is not None:
+        if dt <= now:
             raise BusinessLogicError("Maturity date must be in the future")
         return apply_valuation_time(dt)
-    except ValueError:
-        pass
     
     # Parse tenor format (e.g., "5y", "18m", "30d")
-    match = re.match(r"^(\d+)\s*(y|m|d)?$", s)
+    match = _TENOR_RE.match(s)
     if not match:
         raise ValidationError("Invalid maturity date format. Examples: 2028-12-31, 5y, 18m, 30d.")
     
@@ -89,39 +112,46 @@ def parse_maturity_date(maturity_str: str) -> datetime:
     if value_i <= 0:
         raise BusinessLogicError("Maturity tenor must be positive.")
     
-    try:
-        cfg = get_config()
-        max_years = getattr(cfg, "MATURITY_MAX_YEARS", 100)
-    except Exception:
-        max_years = 100
-    
-    today = datetime.today()
+    max_years = _bounds().maturity_max_years
     
     # Calculate maturity date and validate bounds
-    if unit == "y" or unit is None:
-        if value_i > max_years:
-            raise BusinessLogicError(f"Maturity exceeds maximum of {max_years} years.")
-        dt = today + timedelta(days=value_i * 365)
-    elif unit == "m":
-        if (value_i / 12) > max_years:
-            raise BusinessLogicError(f"Maturity exceeds maximum of {max_years} years.")
-        dt = today + timedelta(days=value_i * 30)
-    elif unit == "d":
-        if (value_i / 365) > max_years:
-            raise BusinessLogicError(f"Maturity exceeds maximum of {max_years} years.")
-        dt = today + timedelta(days=value_i)
-    else:
-        raise ValidationError(f"Invalid maturity unit: {unit}")
-    
-    return apply_valuation_time(dt)
-
-
-@performance_monitor("load_yield_curve")
-def load_yield_curve(file_path: str, form_data=None, valuation_date: datetime | None = None) -> pd.DataFrame:
-    """Load a yield curve CSV with enhanced validation and error handling."""
+    days_per_unit, units_per_year = _TENOR_UNITS[unit]
+    if value_i / units_per_year > max_years:
+        raise BusinessLogicError(f"Maturity exceeds maximum of {max_years} years.")
+    
+    return apply_valuation_time(now + timedelta(days=value_i * days_per_unit))
+
+
+def _parse_iso_date(s: str) -> datetime | None:
+    """Parse a YYYY-MM-DD date, or return None if s is not one."""
+    if len(s) == 10 and s[4] == "-" and s[7] == "-":
+        try:
+            return datetime.fromisoformat(s)
+        except ValueError:
+            return None
+    if "-" not in s:
+        return None  # tenor such as "5y"; skip the slow strptime failure
+    try:
+        # Non-zero-padded forms such as 2028-1-5
+        return datetime.strptime(s, "%Y-%m-%d")
+    except ValueError:
+        return None
+
+
+@performance_monitor("load_yield_curve", optional=True)
+def load_yield_curve(
+    file_path: str,
+    form_data=None,
+    valuation_date: datetime | None = None,
+    data_dir: str | None = None,
+) -> pd.DataFrame:
+    """Load a yield curve CSV with enhanced validation and error handling.
+
+    ``data_dir`` overrides the configured DATA_DIR for the path check.
+    """
     # Security: ensure file access is limited to the configured data directory
     try:
-        ensure_in_data_dir(file_path)
+        ensure_in_data_dir(file_path, data_dir)
     except Exception as e:
         raise ValidationError(f"Invalid file path: {e}")
 
@@ -139,11 +169,7 @@ def _load_curve_from_form_data(form_data, file_path: str, valuation_date: dateti
     if len(form_maturities) == 0 and len(form_rates) == 0:
         return _load_curve_from_csv(file_path, valuation_date)
     
-    try:
-        cfg = get_config()
-        max_points = getattr(cfg, "CURVE_MAX_POINTS", 200)
-    except Exception:
-        max_points = 200
+    max_points = _bounds().curve_max_points
     
     # Validate input lengths
     if len(form_maturities) != len(form_rates):
@@ -157,23 +183,19 @@ def _load_curve_from_form_data(form_data, file_path: str, valuation_date: dateti
     
     # Parse and validate data
     try:
-        maturities = [float(m) for m in form_maturities]
-        rates = [float(r) / 100 for r in form_rates]  # Convert from percentage
+        maturities = np.asarray(form_maturities, dtype=np.float64)
+        rates = np.asarray(form_rates, dtype=np.float64)
     except ValueError as e:
         raise ValidationError(f"Invalid numeric data in curve: {e}")
     
-    # Validate data quality
+    # Validate data quality (bounds are in percent, as for CSV input)
     _validate_curve_data(maturities, rates)
+    rates = rates / 100  # Convert from percentage
     
     if valuation_date is None:
         valuation_date = parse_valuation_date_from_filename(file_path)
     
-    # Build DataFrame
-    dates = [valuation_date + timedelta(days=int(y * 365)) for y in maturities]
-    df = pd.DataFrame({"Maturity (Years)": maturities, "Rate": rates, "Date": dates})
-    df = df.set_index("Date")
-    
-    return df
+    return _curve_frame(valuation_date, maturities, rates)
 
 
 def _load_curve_from_csv(file_path: str, valuation_date: datetime | None) -> pd.DataFrame:
@@ -187,6 +209,38 @@ def _load_curve_from_csv(file_path: str, valuation_date: datetime | None) -> pd.
         except Exception as e:
             raise ValidationError(f"Cannot parse valuation date from filename: {e}")
     
+    maturities, rates = _read_curve_columns(file_path)
+    
+    max_points = _bounds().curve_max_points
+    
+    if len(maturities) > max_points:
+        raise ValidationError(f"CSV has too many rows; maximum is {max_points}.")
+    
+    if len(maturities) == 0:
+        raise ValidationError("CSV file is empty.")
+    
+    # Validate data quality
+    _validate_curve_data(maturities, rates)
+    
+    # Convert rates from percentage to decimal
+    return _curve_frame(valuation_date, maturities, rates / 100)
+
+
+def _read_curve_columns(file_path: str) -> tuple[_FloatArray, _FloatArray]:
+    """Read the maturity and rate columns of a curve CSV as float64 arrays.
+
+    Well-formed numeric files take a lightweight ``np.loadtxt`` path; anything it
+    cannot parse falls back to ``pd.read_csv`` for its structure and type checks.
+    """
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")  # loadtxt warns on header-only files
+            arr = np.loadtxt(file_path, delimiter=",", skiprows=1, dtype=np.float64, ndmin=2)
+        if arr.shape[0] > 0 and arr.shape[1] >= 2:
+            return arr[:, 0], arr[:, 1]
+    except Exception:
+        pass
+    
     try:
         df = pd.read_csv(file_path)
     except Exception as e:
@@ -207,48 +261,50 @@ def _load_curve_from_csv(file_path: str, valuation_date: datetime | None) -> pd.
     if not pd.api.types.is_numeric_dtype(df["Rate"]):
         raise ValidationError("Second column must be numeric rates in percent.")
     
-    try:
-        cfg = get_config()
-        max_points = getattr(cfg, "CURVE_MAX_POINTS", 200)
-    except Exception:
-        max_points = 200
-    
-    if df.shape[0] > max_points:
-        raise ValidationError(f"CSV has too many rows; maximum is {max_points}.")
-    
-    if df.shape[0] == 0:
-        raise ValidationError("CSV file is empty.")
-    
-    # Validate data quality
-    maturities = df["Maturity (Years)"].astype(float).tolist()
-    rates = df["Rate"].astype(float).tolist()
-    
-    _validate_curve_data(maturities, rates)
-    
-    # Convert rates from percentage to decimal
-    df["Rate"] = df["Rate"] / 100
-    df["Date"] = df["Maturity (Years)"].apply(lambda y: valuation_date + timedelta(days=int(float(y) * 365)))
-    df = df.set_index("Date")
-    
-    return df
+    return df["Maturity (Years)"].to_numpy(np.float64), df["Rate"].to_numpy(np.float64)
+
+
+def _curve_frame(valuation_date: datetime, maturities: _FloatArray, rates: _FloatArray) -> pd.DataFrame:
+    """Build the Date-indexed curve frame in one step (no set_index copy)."""
+    return pd.DataFrame(
+        {"Maturity (Years)": maturities, "Rate": rates},
+        index=_maturity_dates(valuation_date, maturities).rename("Date"),
+    )
+
+
+def _maturity_dates(valuation_date: datetime, maturities: _FloatArray) -> pd.DatetimeIndex:
+    """Pillar dates as valuation_date + int(years * 365) days, computed in one vectorized step."""
+    days = (np.asarray(maturities, dtype=np.float64) * 365).astype(np.int64)  # truncates like int()
+    return pd.Timestamp(valuation_date) + pd.to_timedelta(days, unit="D")
 
 
-def _validate_curve_data(maturities: list[float], rates: list[float]) -> None:
-    """Validate curve data quality."""
+def _validate_curve_data(maturities: _FloatArray, rates: _FloatArray) -> None:
+    """Validate curve data quality (vectorized over float64 arrays)."""
+    mat = np.asarray(maturities, dtype=np.float64)
+    rt = np.asarray(rates, dtype=np.float64)
+    # Fused fast path: the range comparisons are False for NaN, and the bounds exclude inf
+    if (
+        ((mat >= 0.0) & (mat < np.inf)).all()
+        and ((rt >= -10.0) & (rt <= 50.0)).all()
+        and (np.diff(mat) > 0).all()
+    ):
+        return
+    
+    # Something failed; re-check in order to report the specific problem
     # Check for finite values
-    if any(not math.isfinite(m) for m in maturities):
+    if not np.isfinite(mat).all():
         raise ValidationError("Maturities must be finite numbers.")
     
-    if any(not math.isfinite(r) for r in rates):
+    if not np.isfinite(rt).all():
         raise ValidationError("Rates must be finite numbers.")
     
     # Check bounds
-    if any(m < 0 for m in maturities):
+    if (mat < 0).any():
         raise ValidationError("Maturity years must be non-negative.")
     
-    if any(r < -10.0 or r > 50.0 for r in rates):
+    if ((rt < -10.0) | (rt > 50.0)).any():
         raise ValidationError("Rates must be between -10% and 50%.")
     
     # Check ordering
-    if any(m2 <= m1 for m1, m2 in zip(maturities, maturities[1:])):
+    if (np.diff(mat) <= 0).any():
         raise ValidationError("Maturities must be strictly increasing.")
@@ -1,28 +1,41 @@
 """Performance monitoring and optimization utilities."""
 from __future__ import annotations
+import os
 import time
 import logging
 import functools
-from typing import Any, Callable, Dict, Optional
+from collections import deque
+from typing import Any, Callable, Deque, Dict, Optional
 from contextlib import contextmanager
+import numpy as np
 
 
 logger = logging.getLogger(__name__)
 
+# Decorators are applied at import time, so this is read once per process
+_INSTRUMENT = os.environ.get("PERF_INSTRUMENT") == "1"
 
-def performance_monitor(operation_name: str, log_threshold_ms: float = 100.0):
-    """Decorator to monitor function performance."""
+
+def performance_monitor(operation_name: str, log_threshold_ms: float = 100.0, optional: bool = False):
+    """Decorator to monitor function performance.
+
+    ``optional`` marks hot, cheap functions (e.g. the parsers) that are only timed
+    when PERF_INSTRUMENT=1; otherwise they are returned unwrapped.
+    """
     def decorator(func: Callable) -> Callable:
+        if optional and not _INSTRUMENT:
+            return func
+
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_ns = time.perf_counter_ns()
             try:
                 result = func(*args, **kwargs)
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
                 
                 if duration_ms > log_threshold_ms:
                     logger.warning(
-                        f"slow_operation",
+                        "slow_operation",
                         extra={
                             "operation": operation_name,
                             "duration_ms": round(duration_ms, 2),
@@ -30,9 +43,9 @@ def performance_monitor(operation_name: str, log_threshold_ms: float = 100.0):
                             "threshold_ms": log_threshold_ms,
                         }
                     )
-                else:
+                elif logger.isEnabledFor(logging.DEBUG):
                     logger.debug(
-                        f"operation_completed",
+                        "operation_completed",
                         extra={
                             "operation": operation_name,
                             "duration_ms": round(duration_ms, 2),
@@ -42,9 +55,9 @@ def performance_monitor(operation_name: str, log_threshold_ms: float = 100.0):
                 
                 return result
             except Exception as e:
-                duration_ms = (time.time() - start_time) * 1000
+                duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
                 logger.error(
-                    f"operation_failed",
+                    "operation_failed",
                     extra={
                         "operation": operation_name,
                         "duration_ms": round(duration_ms, 2),
@@ -60,54 +73,60 @@ def performance_monitor(operation_name: str, log_threshold_ms: float = 100.0):
 @contextmanager
 def timer(operation_name: str):
     """Context manager for timing operations."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
         yield
     finally:
-        duration_ms = (time.time() - start_time) * 1000
-        logger.info(
-            f"timed_operation",
-            extra={
-                "operation": operation_name,
-                "duration_ms": round(duration_ms, 2),
-            }
-        )
+        if logger.isEnabledFor(logging.INFO):
+            duration_ms = (time.perf_counter_ns() - start_ns) / 1e6
+            logger.info(
+                "timed_operation",
+                extra={
+                    "operation": operation_name,
+                    "duration_ms": round(duration_ms, 2),
+                }
+            )
 
 
 class PerformanceTracker:
-    """Track performance metrics across requests."""
+    """Track performance metrics across requests (last ``window`` samples per operation)."""
     
-    def __init__(self):
-        self.metrics: Dict[str, list] = {}
+    def __init__(self, window: int = 1000):
+        self._window = window
+        self.metrics: Dict[str, Deque[float]] = {}
     
     def record(self, operation: str, duration_ms: float) -> None:
         """Record a performance metric."""
-        if operation not in self.metrics:
-            self.metrics[operation] = []
-        
-        self.metrics[operation].append(duration_ms)
-        
-        # Keep only last 1000 measurements
-        if len(self.metrics[operation]) > 1000:
-            self.metrics[operation] = self.metrics[operation][-1000:]
+        samples = self.metrics.get(operation)
+        if samples is None:
+            samples = self.metrics.setdefault(operation, deque(maxlen=self._window))
+        samples.append(duration_ms)
     
     def get_stats(self, operation: str) -> Optional[Dict[str, float]]:
         """Get statistics for an operation."""
-        if operation not in self.metrics or not self.metrics[operation]:
+        values = self.metrics.get(operation)
+        if not values:
             return None
         
-        values = self.metrics[operation]
+        arr = np.fromiter(values, dtype=np.float64, count=len(values))
+        n = len(arr)
+        if n > 20:
+            k = int(n * 0.95)
+            p95 = float(np.partition(arr, k)[k])  # O(n) selection instead of a full sort
+        else:
+            p95 = float(arr.max())
         return {
-            "count": len(values),
-            "avg_ms": sum(values) / len(values),
-            "min_ms": min(values),
-            "max_ms": max(values),
-            "p95_ms": sorted(values)[int(len(values) * 0.95)] if len(values) > 20 else max(values),
+            "count": n,
+            "avg_ms": float(arr.mean()),
+            "min_ms": float(arr.min()),
+            "max_ms": float(arr.max()),
+            "p95_ms": p95,
         }
     
     def get_all_stats(self) -> Dict[str, Dict[str, float]]:
         """Get statistics for all operations."""
-        return {op: self.get_stats(op) for op in self.metrics if self.get_stats(op)}
+        stats = {op: self.get_stats(op) for op in list(self.metrics)}
+        return {op: s for op, s in stats.items() if s}
 
 
 # Global performance tracker instance
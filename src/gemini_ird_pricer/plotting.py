@@ -1,11 +1,35 @@
 from __future__ import annotations
-import json
-import plotly.graph_objects as go
 import pandas as pd
+from .json_utils import HAS_ORJSON
+
+# Same switch as json_utils: the optional 'speedups' extra enables orjson everywhere
+_PLOTLY_JSON_ENGINE = "orjson" if HAS_ORJSON else "json"
+
+# Rendered chart JSON for recently plotted curves, keyed by (id(index), rate bytes). Entries
+# hold the index itself, so an id cannot be reused while cached; rates are part of the key,
+# so in-place edits to the Rate column miss rather than serve a stale chart.
+_PLOT_CACHE: dict[tuple[int, bytes], tuple[pd.Index, str]] = {}
+_PLOT_CACHE_SIZE = 8
 
 
 def plot_yield_curve(yield_curve: pd.DataFrame) -> str:
-    fig = go.Figure(data=go.Scatter(x=yield_curve.index.tolist(), y=yield_curve["Rate"].tolist(), mode="lines+markers"))
+    index = yield_curve.index
+    rates = yield_curve["Rate"].to_numpy()
+    key = (id(index), rates.tobytes())
+    hit = _PLOT_CACHE.get(key)
+    if hit is not None and hit[0] is index:
+        return hit[1]
+
+    # plotly is heavy to import; load it on first chart render rather than at app start
+    import plotly.graph_objects as go
+
+    # Arrays are passed as-is; plotly serializes them without intermediate Python lists
+    fig = go.Figure(data=go.Scatter(x=index, y=rates, mode="lines+markers"))
     fig.update_layout(title="Yield Curve", xaxis_title="Date", yaxis_title="Rate")
-    # Return a single-encoded JSON string (fix double-encoding)
-    return fig.to_json()
+    # Return a single-encoded JSON string (fix double-encoding). The figure was already
+    # validated by its constructors, so serialization skips a second validation pass.
+    plot_json: str = fig.to_json(validate=False, engine=_PLOTLY_JSON_ENGINE)
+    if len(_PLOT_CACHE) >= _PLOT_CACHE_SIZE:
+        _PLOT_CACHE.clear()
+    _PLOT_CACHE[key] = (index, plot_json)
+    return plot_json
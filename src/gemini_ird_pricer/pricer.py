@@ -1,9 +1,13 @@
 from __future__ import annotations
+from calendar import monthrange
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import numpy as np
+import numpy.typing as npt
 import pandas as pd
-from typing import Mapping, Any
-from .utils import year_fraction, build_discount_function, apply_valuation_time
+from typing import Any, Callable, Mapping, NamedTuple
+from .kernels import exp_cont_legs
+from .utils import DiscountFunction, DiscountFunctionVec, year_fraction_array, build_discount_function, build_discount_function_vec, apply_valuation_time
 
 # Default configuration used when no explicit mapping is provided (keeps domain pure)
 _DEFAULT_CFG: dict[str, Any] = {
@@ -15,6 +19,54 @@ _DEFAULT_CFG: dict[str, Any] = {
 }
 
 
+_FloatArray = npt.NDArray[np.float64]
+_IntArray = npt.NDArray[np.int64]
+
+
+# Upper bound on schedule length (guards against degenerate frequencies)
+_MAX_SCHEDULE_PERIODS = 10000
+
+
+def _add_months(dt: datetime, n: int) -> datetime:
+    """Add n months, clamping the day to the last valid day of the target month."""
+    y = dt.year + (dt.month - 1 + n) // 12
+    m = (dt.month - 1 + n) % 12 + 1
+    return dt.replace(year=y, month=m, day=min(dt.day, monthrange(y, m)[1]))
+
+
+class _PricingSettings(NamedTuple):
+    freq: int
+    dc: str
+    disc_strategy: str
+    disc: DiscountFunction
+    disc_vec: DiscountFunctionVec
+    policy: str
+    interp: str
+
+
+def _settings_from(get: Callable[[str, Any], Any]) -> _PricingSettings:
+    disc_strategy = str(get("DISCOUNTING_STRATEGY", _DEFAULT_CFG["DISCOUNTING_STRATEGY"]))
+    return _PricingSettings(
+        int(get("FIXED_FREQUENCY", _DEFAULT_CFG["FIXED_FREQUENCY"])),
+        str(get("DAY_COUNT", _DEFAULT_CFG["DAY_COUNT"])),
+        disc_strategy,
+        build_discount_function(disc_strategy),
+        build_discount_function_vec(disc_strategy),
+        str(get("EXTRAPOLATION_POLICY", _DEFAULT_CFG["EXTRAPOLATION_POLICY"])),
+        str(get("INTERP_STRATEGY", _DEFAULT_CFG["INTERP_STRATEGY"])),
+    )
+
+
+_DEFAULT_SETTINGS = _settings_from(_DEFAULT_CFG.get)
+
+
+def _resolve_settings(config: Mapping[str, Any] | None) -> _PricingSettings:
+    """Pricing settings from config (missing keys fall back to _DEFAULT_CFG) without copying it."""
+    if config is None:
+        return _DEFAULT_SETTINGS
+    return _settings_from(config.get)
+
+
 def generate_payment_schedule(start_date: datetime, maturity_date: datetime, frequency: int) -> list[datetime]:
     """Generate a payment schedule with guards and optional month-based stepping.
 
@@ -26,56 +78,76 @@ def generate_payment_schedule(start_date: datetime, maturity_date: datetime, fre
     if maturity_date <= start_date:
         return []
 
-    schedule: list[datetime] = []
-    current_date = start_date
-
-    def _add_months(dt: datetime, n: int) -> datetime:
-        # Minimal month adder: increases month while clamping day to last valid day
-        y = dt.year + (dt.month - 1 + n) // 12
-        m = (dt.month - 1 + n) % 12 + 1
-        # Clamp day to 28-31 depending on month
-        from calendar import monthrange
-        last_day = monthrange(y, m)[1]
-        d = min(dt.day, last_day)
-        return dt.replace(year=y, month=m, day=d)
-
     use_months = frequency > 0 and (12 % max(1, frequency) == 0)
     step_months = int(12 / max(1, frequency)) if use_months else None
-    step_days = int(365.0 / max(1, frequency))
 
-    max_iters = 10000
-    iters = 0
-    while current_date < maturity_date and iters < max_iters:
-        if use_months and step_months:
+    if use_months and step_months:
+        if start_date.day <= 28:
+            # No month is shorter than 28 days, so no date is ever clamped and the schedule
+            # is plain arithmetic from start_date
+            months = (maturity_date.year - start_date.year) * 12 + (maturity_date.month - start_date.month)
+            periods = max(-(-months // step_months), 1)
+            if _add_months(start_date, periods * step_months) < maturity_date:
+                periods += 1
+            if periods <= _MAX_SCHEDULE_PERIODS:
+                base = start_date.year * 12 + start_date.month - 1
+                replace = start_date.replace
+                schedule: list[datetime] = [
+                    replace(year=(base + k * step_months) // 12, month=(base + k * step_months) % 12 + 1)
+                    for k in range(1, periods)
+                ]
+                schedule.append(maturity_date)
+                return schedule
+        # Months are stepped from the previous date, so an end-of-month clamp carries forward
+        schedule = []
+        current_date = start_date
+        for _ in range(_MAX_SCHEDULE_PERIODS):
             current_date = _add_months(current_date, step_months)
-        else:
-            current_date = current_date + timedelta(days=step_days)
-        if current_date > maturity_date:
-            current_date = maturity_date
-        if current_date > start_date:
+            if current_date >= maturity_date:
+                schedule.append(maturity_date)
+                break
             schedule.append(current_date)
-        iters += 1
+        return schedule
+
+    step_days = int(365.0 / max(1, frequency))
+    if step_days <= 0:
+        return []
+    # Fixed day steps: compute the period count directly; the last date is clamped to maturity
+    step = timedelta(days=step_days)
+    periods = -(-(maturity_date - start_date) // step)
+    schedule = [start_date + step * k for k in range(1, min(periods, _MAX_SCHEDULE_PERIODS) + 1)]
+    if periods <= _MAX_SCHEDULE_PERIODS:
+        schedule[-1] = maturity_date
     return schedule
 
 
-def _interp_market_rate(target_days: int, dates: np.ndarray, rates: np.ndarray, policy: str, strategy: str, disc_func) -> float:
-    """Interpolate a market rate according to strategy and extrapolation policy.
+def _interp_market_rates(
+    target_days: _IntArray,
+    dates: _IntArray,
+    rates: _FloatArray,
+    policy: str,
+    strategy: str,
+    disc_func: DiscountFunction | None,
+    disc_vec: DiscountFunctionVec | None = None,
+) -> _FloatArray:
+    """Interpolate market rates for an array of day offsets in one vectorized pass.
 
     - strategy: 'linear_zero' | 'log_linear_df'
     - policy: 'clamp' | 'error'
-    disc_func: discount function D(r, t) used to compute discount factors
+    disc_func: discount function D(r, t) used to compute node discount factors
+    disc_vec: optional array form of disc_func, applied to all nodes in one call
     """
-    days = int(target_days)
+    days = np.asarray(target_days, dtype=np.int64)
+    if days.size == 0:
+        return np.empty(0, dtype=float)
     dmin = int(dates.min())
     dmax = int(dates.max())
-    if days < dmin:
-        if policy == "error":
+    if policy == "error":
+        if int(days.min()) < dmin:
             raise ValueError("Maturity before curve start; extrapolation forbidden")
-        days = dmin
-    if days > dmax:
-        if policy == "error":
+        if int(days.max()) > dmax:
             raise ValueError("Maturity beyond curve end; extrapolation forbidden")
-        days = dmax
+    days = np.clip(days, dmin, dmax)
 
     if strategy == "log_linear_df":
         # Interpolate ln(DF) over year time to reduce arbitrage-like bumps
@@ -83,20 +155,148 @@ def _interp_market_rate(target_days: int, dates: np.ndarray, rates: np.ndarray,
         # Convert node rates to discount factors using provided discount function
         # Avoid t=0 by replacing with a small epsilon
         eps = 1e-9
-        dfs = np.array([disc_func(r, max(t, eps)) for r, t in zip(rates, t_nodes)], dtype=float)
+        if disc_vec is not None:
+            dfs = np.asarray(disc_vec(np.asarray(rates, dtype=float), np.maximum(t_nodes, eps)), dtype=float)
+        else:
+            assert disc_func is not None
+            dfs = np.array([disc_func(r, max(t, eps)) for r, t in zip(rates, t_nodes)], dtype=float)
         ln_dfs = np.log(dfs)
-        t = max(days / 365.0, eps)
-        ln_df_t = float(np.interp(t, t_nodes, ln_dfs))
-        df_t = float(np.exp(ln_df_t))
+        t = np.maximum(days / 365.0, eps)
+        df_t = np.exp(np.interp(t, t_nodes, ln_dfs))
         # Convert back to equivalent continuously-compounded rate
-        r_t = -np.log(max(df_t, eps)) / t
-        return float(r_t)
+        zero: _FloatArray = -np.log(np.maximum(df_t, eps)) / t
+        return zero
 
     # Default: linear interpolation on zero/market rates vs days
-    return float(np.interp(days, dates, rates))
+    return np.interp(days, dates, rates).astype(float)
+
+
+def _interp_market_rate(target_days: int, dates: _IntArray, rates: _FloatArray, policy: str, strategy: str, disc_func: DiscountFunction) -> float:
+    """Interpolate a single market rate; see _interp_market_rates."""
+    return float(_interp_market_rates(np.array([int(target_days)]), dates, rates, policy, strategy, disc_func)[0])
+
+
+# Day offsets of recently priced curve indexes, keyed by (id(index), valuation date). Entries
+# hold the index itself, so an id cannot be reused while cached; indexes are immutable, so
+# entries never go stale (a curve with a replaced index simply misses).
+_CURVE_DAYS_CACHE: dict[tuple[int, datetime], tuple[pd.Index, _IntArray]] = {}
+_CURVE_DAYS_CACHE_SIZE = 16
+
+
+def _curve_days(index: pd.Index, valuation_date: datetime) -> _IntArray:
+    """Whole days from valuation_date to each curve date (floored, as timedelta.days)."""
+    key = (id(index), valuation_date)
+    hit = _CURVE_DAYS_CACHE.get(key)
+    if hit is not None and hit[0] is index:
+        return hit[1]
+    if isinstance(index, pd.DatetimeIndex):
+        days = np.asarray((index - pd.Timestamp(valuation_date)).days, dtype=np.int64)
+    else:
+        days = np.array([(d - valuation_date).days for d in index], dtype=np.int64)
+    days.flags.writeable = False
+    if len(_CURVE_DAYS_CACHE) >= _CURVE_DAYS_CACHE_SIZE:
+        _CURVE_DAYS_CACHE.clear()
+    _CURVE_DAYS_CACHE[key] = (index, days)
+    return days
+
+
+_ONE_DAY = np.timedelta64(1, "D")
+
+
+def _day_offsets(dates: list[datetime], origin: datetime) -> _IntArray:
+    """Whole days from origin to each date (floored, as timedelta.days) in one array subtract."""
+    return (np.array(dates, dtype="datetime64[us]") - np.datetime64(origin, "us")) // _ONE_DAY
+
 
+def _is_act365(dc: str) -> bool:
+    return dc.upper().strip() in ("ACT/365F", "ACT/365")
 
-def price_swap(notional: float, fixed_rate: float, maturity_date: datetime, yield_curve: pd.DataFrame, config: Mapping[str, Any] | None = None, valuation_date: datetime | None = None) -> tuple[float, list[dict]]:
+
+def _payment_rates(valuation_date: datetime, payment_dates: list[datetime], yield_curve: pd.DataFrame, dc: str, policy: str, strategy: str, disc_vec: DiscountFunctionVec) -> tuple[_FloatArray, _IntArray, _FloatArray]:
+    """Return (year fractions, day offsets, market rates) arrays for each payment date.
+
+    Rates are interpolated in one call for all payments with a positive year fraction;
+    the rest (skipped by the pricing loops) get 0.0.
+    """
+    pay_days = _day_offsets(payment_dates, valuation_date)
+    if _is_act365(dc):
+        times = pay_days / 365.0
+    else:
+        times = year_fraction_array(valuation_date, payment_dates, dc)
+    live = times > 0
+    market_rates = np.zeros(len(payment_dates), dtype=float)
+    if live.any():
+        dates = _curve_days(yield_curve.index, valuation_date)
+        rates = yield_curve["Rate"].to_numpy(dtype=np.float64)
+        market_rates[live] = _interp_market_rates(pay_days[live], dates, rates, policy, strategy, None, disc_vec)
+    return times, pay_days, market_rates
+
+
+def _vector_legs(notional: float, fixed_rate: float, valuation_date: datetime, payment_dates: list[datetime], times: _FloatArray, market_rates: _FloatArray) -> tuple[npt.NDArray[np.bool_], _FloatArray]:
+    """Fast path for ACT/365F with continuous discounting: (live mask, leg values).
+
+    Leg values (see kernels.exp_cont_legs) cover live payments (t > 0) only; accrual
+    periods still start at the previous payment date, skipped ones included, as in the
+    scalar loops.
+    """
+    pay_dt = np.array(payment_dates, dtype="datetime64[us]")
+    accrual_days = np.diff(pay_dt, prepend=np.datetime64(valuation_date, "us")) // _ONE_DAY
+    live = times > 0
+    accruals = np.maximum(accrual_days[live] / 365.0, 0.0)
+    return live, exp_cont_legs(notional, fixed_rate, accruals, times[live], market_rates[live])
+
+
+def _accruals(valuation_date: datetime, payment_dates: list[datetime], dc: str) -> _FloatArray:
+    """Non-negative accrual fractions, each period starting at the previous payment date."""
+    return np.maximum(year_fraction_array([valuation_date, *payment_dates[:-1]], payment_dates, dc), 0.0)
+
+
+def _use_vector_path(dc: str, disc_strategy: str) -> bool:
+    return _is_act365(dc) and disc_strategy.lower().strip() == "exp_cont"
+
+
+@dataclass(frozen=True, slots=True)
+class PaymentSchedule:
+    """Columnar swap schedule: one array per field, one entry per payment.
+
+    Numeric consumers (sums, risk, plotting) can use the arrays directly; ``to_records``
+    materializes the list-of-dicts form returned by ``price_swap``.
+    """
+    payment_dates: list[datetime]
+    days: _IntArray
+    fixed_payment: _FloatArray
+    floating_payment: _FloatArray
+    discount_factor: _FloatArray
+    pv_fixed: _FloatArray
+    pv_floating: _FloatArray
+
+    def __len__(self) -> int:
+        return len(self.payment_dates)
+
+    def to_records(self) -> list[dict[str, Any]]:
+        return [
+            {
+                "payment_date": payment_date.strftime("%Y-%m-%d"),
+                "days": days,
+                "fixed_payment": fp,
+                "floating_payment": flp,
+                "discount_factor": df,
+                "pv_fixed": pvf,
+                "pv_floating": pvfl,
+            }
+            for payment_date, days, fp, flp, df, pvf, pvfl in zip(
+                self.payment_dates,
+                self.days.tolist(),
+                self.fixed_payment.tolist(),
+                self.floating_payment.tolist(),
+                self.discount_factor.tolist(),
+                self.pv_fixed.tolist(),
+                self.pv_floating.tolist(),
+            )
+        ]
+
+
+def price_swap(notional: float, fixed_rate: float, maturity_date: datetime, yield_curve: pd.DataFrame, config: Mapping[str, Any] | None = None, valuation_date: datetime | None = None) -> tuple[float, list[dict[str, Any]]]:
     """Price a plain-vanilla fixed-for-floating swap and return (NPV, schedule).
 
     - notional: positive notional amount
@@ -106,36 +306,40 @@ def price_swap(notional: float, fixed_rate: float, maturity_date: datetime, yiel
     - config: optional mapping overriding config values
     - valuation_date: optional override; if None uses first curve date or today
     """
+    swap_value, schedule = price_swap_columns(notional, fixed_rate, maturity_date, yield_curve, config, valuation_date)
+    return swap_value, schedule.to_records()
+
+
+def price_swap_columns(notional: float, fixed_rate: float, maturity_date: datetime, yield_curve: pd.DataFrame, config: Mapping[str, Any] | None = None, valuation_date: datetime | None = None) -> tuple[float, PaymentSchedule]:
+    """Like price_swap, but return the schedule as a columnar PaymentSchedule."""
     valuation_date = valuation_date or (yield_curve.index[0] if len(yield_curve.index) else datetime.today())
     valuation_date = apply_valuation_time(valuation_date)
-    cfg_map = {**_DEFAULT_CFG, **(dict(config) if config is not None else {})}
-    freq = int(cfg_map.get("FIXED_FREQUENCY", 2))
-    dc = str(cfg_map.get("DAY_COUNT", "ACT/365F"))
-    disc = build_discount_function(str(cfg_map.get("DISCOUNTING_STRATEGY", "exp_cont")))
+    freq, dc, disc_strategy, _, disc_vec, policy, interp = _resolve_settings(config)
     payment_dates = generate_payment_schedule(valuation_date, maturity_date, freq)
+    times, pay_days, market_rates = _payment_rates(valuation_date, payment_dates, yield_curve, dc, policy, interp, disc_vec)
+
+    if _use_vector_path(dc, disc_strategy):
+        live, legs = _vector_legs(notional, fixed_rate, valuation_date, payment_dates, times, market_rates)
+        schedule = PaymentSchedule(
+            [d for d, keep in zip(payment_dates, live.tolist()) if keep],
+            pay_days[live],
+            *legs,
+        )
+        return float(schedule.pv_floating.sum() - schedule.pv_fixed.sum()), schedule
 
-    schedule: list[dict] = []
-    dates = np.array([(d - valuation_date).days for d in yield_curve.index])
-    rates = yield_curve["Rate"].values
-
-    policy = str(cfg_map.get("EXTRAPOLATION_POLICY", "clamp"))
-    interp = str(cfg_map.get("INTERP_STRATEGY", "linear_zero"))
-
+    # Scalar path: fill preallocated columns (rows 0..n-1 hold the live payments)
+    columns = np.zeros((5, len(payment_dates)))
+    live_dates: list[datetime] = []
+    live_days: list[int] = []
     total_pv_fixed = 0.0
     total_pv_floating = 0.0
-    prev_date = valuation_date
+    accruals = _accruals(valuation_date, payment_dates, dc)
+    discount_factors = disc_vec(market_rates, times)
 
-    for payment_date in payment_dates:
-        t = year_fraction(valuation_date, payment_date, dc)
+    for payment_date, t, maturity_days, market_rate, accrual, discount_factor in zip(payment_dates, times.tolist(), pay_days.tolist(), market_rates.tolist(), accruals.tolist(), discount_factors.tolist()):
         if t <= 0:
-            prev_date = payment_date
             continue
 
-        maturity_days = (payment_date - valuation_date).days
-        market_rate = _interp_market_rate(maturity_days, dates, rates, policy, interp, disc)
-        discount_factor = float(disc(market_rate, t))
-
-        accrual = max(year_fraction(prev_date, payment_date, dc), 0.0)
         fixed_payment = notional * fixed_rate * accrual
         pv_fixed = fixed_payment * discount_factor
         total_pv_fixed += pv_fixed
@@ -144,20 +348,12 @@ def price_swap(notional: float, fixed_rate: float, maturity_date: datetime, yiel
         pv_floating = floating_payment * discount_factor
         total_pv_floating += pv_floating
 
-        schedule.append(
-            {
-                "payment_date": payment_date.strftime("%Y-%m-%d"),
-                "days": maturity_days,
-                "fixed_payment": fixed_payment,
-                "floating_payment": floating_payment,
-                "discount_factor": discount_factor,
-                "pv_fixed": pv_fixed,
-                "pv_floating": pv_floating,
-            }
-        )
-
-        prev_date = payment_date
+        columns[:, len(live_dates)] = (fixed_payment, floating_payment, discount_factor, pv_fixed, pv_floating)
+        live_dates.append(payment_date)
+        live_days.append(maturity_days)
 
+    n = len(live_dates)
+    schedule = PaymentSchedule(live_dates, np.array(live_days, dtype=np.int64), *columns[:, :n])
     swap_value = total_pv_floating - total_pv_fixed
     return swap_value, schedule
 
@@ -166,35 +362,27 @@ def solve_par_rate(notional: float, maturity_date: datetime, yield_curve: pd.Dat
     """Solve the par fixed rate that makes the swap NPV zero for given inputs."""
     valuation_date = valuation_date or (yield_curve.index[0] if len(yield_curve.index) else datetime.today())
     valuation_date = apply_valuation_time(valuation_date)
-    cfg_map = {**_DEFAULT_CFG, **(dict(config) if config is not None else {})}
-    freq = int(cfg_map.get("FIXED_FREQUENCY", 2))
-    dc = str(cfg_map.get("DAY_COUNT", "ACT/365F"))
-    disc = build_discount_function(str(cfg_map.get("DISCOUNTING_STRATEGY", "exp_cont")))
-    policy = str(cfg_map.get("EXTRAPOLATION_POLICY", "clamp"))
-    interp = str(cfg_map.get("INTERP_STRATEGY", "linear_zero"))
+    freq, dc, disc_strategy, _, disc_vec, policy, interp = _resolve_settings(config)
     payment_dates = generate_payment_schedule(valuation_date, maturity_date, freq)
-
-    dates = np.array([(d - valuation_date).days for d in yield_curve.index])
-    rates = yield_curve["Rate"].values
-
-    pv_annuity = 0.0
-    pv_floating_leg = 0.0
-    prev_date = valuation_date
-
-    for payment_date in payment_dates:
-        t = year_fraction(valuation_date, payment_date, dc)
-        if t <= 0:
-            prev_date = payment_date
-            continue
-
-        maturity_days = (payment_date - valuation_date).days
-        market_rate = _interp_market_rate(maturity_days, dates, rates, policy, interp, disc)
-        discount_factor = float(disc(market_rate, t))
-
-        accrual = max(year_fraction(prev_date, payment_date, dc), 0.0)
-        pv_annuity += accrual * discount_factor
-        pv_floating_leg += notional * market_rate * accrual * discount_factor
-        prev_date = payment_date
+    times, pay_days, market_rates = _payment_rates(valuation_date, payment_dates, yield_curve, dc, policy, interp, disc_vec)
+
+    if _use_vector_path(dc, disc_strategy):
+        # With a unit fixed rate, the fixed leg PV is notional * annuity
+        _, legs = _vector_legs(notional, 1.0, valuation_date, payment_dates, times, market_rates)
+        pv_annuity = float(legs[3].sum()) / notional
+        pv_floating_leg = float(legs[4].sum())
+    else:
+        pv_annuity = 0.0
+        pv_floating_leg = 0.0
+        accruals = _accruals(valuation_date, payment_dates, dc)
+        discount_factors = disc_vec(market_rates, times)
+
+        for t, market_rate, accrual, discount_factor in zip(times.tolist(), market_rates.tolist(), accruals.tolist(), discount_factors.tolist()):
+            if t <= 0:
+                continue
+
+            pv_annuity += accrual * discount_factor
+            pv_floating_leg += notional * market_rate * accrual * discount_factor
 
     if pv_annuity == 0:
         return 0.0
@@ -1,14 +1,59 @@
 """Security middleware and utilities."""
 
+import secrets
 from flask import Flask, Response, request
 from typing import Optional
+from .error_handler import json_error_response
+from .json_utils import dumps as _dumps
+
+
+# Headers that do not depend on configuration; applied in one update per response
+_STATIC_SECURITY_HEADERS = (
+    ('X-Content-Type-Options', 'nosniff'),
+    ('X-Frame-Options', 'DENY'),
+    ('X-XSS-Protection', '1; mode=block'),
+    ('Referrer-Policy', 'strict-origin-when-cross-origin'),
+    # Permissions Policy (formerly Feature Policy)
+    ('Permissions-Policy', (
+        "geolocation=(), "
+        "microphone=(), "
+        "camera=(), "
+        "payment=(), "
+        "usb=(), "
+        "magnetometer=(), "
+        "gyroscope=(), "
+        "accelerometer=()"
+    )),
+)
+
+# Safe default CSP for production
+_DEFAULT_PRODUCTION_CSP = (
+    "default-src 'self'; "
+    "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
+    "style-src 'self' 'unsafe-inline'; "
+    "img-src 'self' data: https:; "
+    "font-src 'self' data:; "
+    "connect-src 'self'; "
+    "frame-ancestors 'none'; "
+    "base-uri 'self'; "
+    "form-action 'self'"
+)
+
+_HSTS_VALUE = 'max-age=31536000; includeSubDomains'
 
 
 class SecurityHeaders:
-    """Security headers middleware for Flask applications."""
+    """Security headers middleware for Flask applications.
+
+    The header set is resolved from ``config`` once, at construction.
+    """
     
     def __init__(self, app: Optional[Flask] = None, config: Optional[dict] = None):
         self.config = config or {}
+        csp = self.config.get('CONTENT_SECURITY_POLICY')
+        if not csp and self.config.get('ENV') == 'production':
+            csp = _DEFAULT_PRODUCTION_CSP
+        self._headers = _STATIC_SECURITY_HEADERS + ((('Content-Security-Policy', csp),) if csp else ())
         if app is not None:
             self.init_app(app)
     
@@ -18,69 +63,33 @@ class SecurityHeaders:
     
     def add_security_headers(self, response: Response) -> Response:
         """Add comprehensive security headers to response."""
-        # Basic security headers
-        response.headers['X-Content-Type-Options'] = 'nosniff'
-        response.headers['X-Frame-Options'] = 'DENY'
-        response.headers['X-XSS-Protection'] = '1; mode=block'
-        response.headers['Referrer-Policy'] = 'strict-origin-when-cross-origin'
-        
+        response.headers.update(self._headers)
         # HSTS for HTTPS
         if request.is_secure:
-            response.headers['Strict-Transport-Security'] = 'max-age=31536000; includeSubDomains'
-        
-        # Content Security Policy
-        csp = self.config.get('CONTENT_SECURITY_POLICY')
-        if csp:
-            response.headers['Content-Security-Policy'] = csp
-        else:
-            # Safe default CSP for production
-            if self.config.get('ENV') == 'production':
-                default_csp = (
-                    "default-src 'self'; "
-                    "script-src 'self' 'unsafe-inline' 'unsafe-eval'; "
-                    "style-src 'self' 'unsafe-inline'; "
-                    "img-src 'self' data: https:; "
-                    "font-src 'self' data:; "
-                    "connect-src 'self'; "
-                    "frame-ancestors 'none'; "
-                    "base-uri 'self'; "
-                    "form-action 'self'"
-                )
-                response.headers['Content-Security-Policy'] = default_csp
-        
-        # Permissions Policy (formerly Feature Policy)
-        response.headers['Permissions-Policy'] = (
-            "geolocation=(), "
-            "microphone=(), "
-            "camera=(), "
-            "payment=(), "
-            "usb=(), "
-            "magnetometer=(), "
-            "gyroscope=(), "
-            "accelerometer=()"
-        )
-        
+            response.headers['Strict-Transport-Security'] = _HSTS_VALUE
         return response
 
 
 def setup_cors(app: Flask, config: dict) -> None:
     """Setup CORS headers based on configuration."""
+    # Resolve the policy once; the per-request check is a set lookup
+    allowed_origins = frozenset(config.get('CORS_ALLOWED_ORIGINS') or ())
+    allow_any_origin = '*' in allowed_origins
+    allow_credentials = config.get('CORS_ALLOW_CREDENTIALS', False)
+    dev_allow_all = not allowed_origins and config.get('ENV') != 'production'
     
     @app.after_request
     def add_cors_headers(response: Response) -> Response:
         """Add CORS headers to response."""
-        allowed_origins = config.get('CORS_ALLOWED_ORIGINS', [])
-        allow_credentials = config.get('CORS_ALLOW_CREDENTIALS', False)
-        
         origin = request.headers.get('Origin')
         
         # Handle CORS for allowed origins
         if origin and allowed_origins:
-            if origin in allowed_origins or '*' in allowed_origins:
+            if allow_any_origin or origin in allowed_origins:
                 response.headers['Access-Control-Allow-Origin'] = origin
                 if allow_credentials:
                     response.headers['Access-Control-Allow-Credentials'] = 'true'
-        elif not allowed_origins and config.get('ENV') != 'production':
+        elif dev_allow_all:
             # Allow all origins in development if none specified
             response.headers['Access-Control-Allow-Origin'] = '*'
         
@@ -108,56 +117,44 @@ def validate_auth_credentials(config: dict) -> tuple[Optional[str], Optional[str
     return username, password
 
 
+# Rejection bodies are constant, so serialize them once at import
+_ERR_AUTH_NOT_CONFIGURED = _dumps({'error': {'type': 'service_unavailable', 'message': 'Authentication not configured'}})
+_ERR_AUTH_REQUIRED = _dumps({'error': {'type': 'unauthorized', 'message': 'Authentication required'}})
+_ERR_AUTH_INVALID = _dumps({'error': {'type': 'unauthorized', 'message': 'Invalid credentials'}})
+
+
 def require_auth(config: dict):
-    """Decorator to require authentication for routes."""
+    """Decorator to require authentication for routes.
+
+    Credentials are read from the environment once, when the decorator is applied.
+    """
     from functools import wraps
-    from flask import request, jsonify
-    import base64
+    
+    enabled = bool(config.get('ENABLE_AUTH', False))
+    username, password = validate_auth_credentials(config) if enabled else (None, None)
+    configured = bool(username and password)
+    expected_user = (username or "").encode("utf-8")
+    expected_pass = (password or "").encode("utf-8")
     
     def decorator(f):
         @wraps(f)
         def decorated_function(*args, **kwargs):
-            if not config.get('ENABLE_AUTH', False):
+            if not enabled:
                 return f(*args, **kwargs)
             
-            username, password = validate_auth_credentials(config)
-            
-            if not username or not password:
-                return jsonify({
-                    "error": {
-                        "type": "service_unavailable",
-                        "message": "Authentication not configured"
-                    }
-                }), 503
+            if not configured:
+                return json_error_response(_ERR_AUTH_NOT_CONFIGURED, 503), 503
             
+            # Werkzeug parses Basic credentials; a malformed header yields None
             auth = request.authorization
             if not auth:
-                # Try to parse Authorization header manually
-                auth_header = request.headers.get('Authorization', '')
-                if auth_header.startswith('Basic '):
-                    try:
-                        encoded = auth_header[6:]
-                        decoded = base64.b64decode(encoded).decode('utf-8')
-                        auth_username, auth_password = decoded.split(':', 1)
-                        if auth_username == username and auth_password == password:
-                            return f(*args, **kwargs)
-                    except Exception:
-                        pass
-                
-                return jsonify({
-                    "error": {
-                        "type": "unauthorized",
-                        "message": "Authentication required"
-                    }
-                }), 401
+                return json_error_response(_ERR_AUTH_REQUIRED, 401), 401
             
-            if auth.username != username or auth.password != password:
-                return jsonify({
-                    "error": {
-                        "type": "unauthorized",
-                        "message": "Invalid credentials"
-                    }
-                }), 401
+            # Constant-time comparisons, both always evaluated
+            user_ok = secrets.compare_digest((auth.username or "").encode("utf-8"), expected_user)
+            pass_ok = secrets.compare_digest((auth.password or "").encode("utf-8"), expected_pass)
+            if not (user_ok & pass_ok):
+                return json_error_response(_ERR_AUTH_INVALID, 401), 401
             
             return f(*args, **kwargs)
         
@@ -1,11 +1,12 @@
 from __future__ import annotations
 from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Callable, Protocol, Any, Mapping
 import os
 import pandas as pd
 import logging
 
-from .config import Config
+from .config import Config, get_config
 from . import parsing as parsing_mod
 from . import pricer as pricer_mod
 from .utils import ensure_in_data_dir
@@ -14,38 +15,116 @@ from .error_handler import ConfigurationError
 
 # Simple file-based cache for parsed yield curves to avoid recomputation
 from collections import OrderedDict
+from functools import lru_cache
 import time
-from threading import Lock
+from threading import Lock, Thread, current_thread, local
 
 logger = logging.getLogger(__name__)
 
-_curve_cache: "OrderedDict[str, tuple[float, pd.DataFrame, float]]" = OrderedDict()
-_cache_lock: Lock = Lock()
 # Cache policy (overridden by build_services via config)
 _CACHE_MAXSIZE: int = 4
 _CACHE_TTL_SECONDS: float = 300.0
 # Optional cache enable switch (overridden by build_services via config)
 _CACHE_ENABLED: bool = True
+# Seconds a file's stat signature is reused before stat-ing again (0 = every lookup)
+_STAT_COALESCE_SECONDS: float = 0.0
+# abs_path -> (stat_taken_at, (st_mtime_ns, st_size))
+_stat_seen: "dict[str, tuple[float, tuple[int, int]]]" = {}
+# Stale-while-revalidate: serve entries up to 2x TTL old; changed files reload on a background thread
+_CACHE_SWR_ENABLED: bool = False
+_refreshing: set[str] = set()
+_refresh_lock: Lock = Lock()
 
-# Cache observability counters (module-level; scraped by Flask metrics endpoint)
-_cache_hits: int = 0
-_cache_misses: int = 0
-_cache_evictions: int = 0
+# The cache is striped so concurrent lookups of different curves do not contend on one mutex.
+# Each shard is (Lock, OrderedDict of abs_path -> ((st_mtime_ns, st_size), DataFrame, cached_at))
+# with its own LRU bound. Striping only kicks in once every shard gets _MIN_SHARD_SLOTS entries:
+# with a handful of slots, hash collisions would evict curves while other shards sit empty, so
+# small caches stay a single exact LRU.
+_MAX_SHARDS = 16
+_MIN_SHARD_SLOTS = 8
+_CacheEntry = tuple[tuple[int, int], pd.DataFrame, float]
+_shards: list[tuple[Lock, OrderedDict[str, _CacheEntry]]] = []
+_shard_maxsize: int = 1
+
+
+
+class _EventCounter:
+    """Lock-free event counter: every thread bumps its own cell and reads sum the cells.
+
+    A cell is only ever written by its owning thread, so increments need no lock and are
+    never lost. Cells of finished threads are folded into ``_retired`` when a new thread
+    registers, so the cell list tracks live threads only.
+    """
+
+    __slots__ = ("_local", "_cells", "_retired", "_lock")
+
+    def __init__(self) -> None:
+        self._local = local()
+        self._cells: list[tuple[Thread, list[int]]] = []
+        self._retired = 0
+        self._lock = Lock()
+
+    def inc(self) -> None:
+        try:
+            cell: list[int] = self._local.cell
+        except AttributeError:
+            cell = self._register()
+        cell[0] += 1
+
+    def _register(self) -> list[int]:
+        cell = [0]
+        with self._lock:
+            live = []
+            for thread, other in self._cells:
+                if thread.is_alive():
+                    live.append((thread, other))
+                else:
+                    self._retired += other[0]
+            live.append((current_thread(), cell))
+            self._cells = live
+        self._local.cell = cell
+        return cell
+
+    def value(self) -> int:
+        with self._lock:
+            return self._retired + sum(cell[0] for _, cell in self._cells)
+
+
+# Cache observability counters, bumped outside the shard locks (scraped by Flask metrics endpoint)
+_cache_hits = _EventCounter()
+_cache_misses = _EventCounter()
+_cache_evictions = _EventCounter()
+
+
+def _configure_shards(maxsize: int) -> None:
+    """(Re)build the cache shards for maxsize; entries survive when the layout is unchanged."""
+    global _shards, _shard_maxsize
+    n = 1
+    while n * 2 <= _MAX_SHARDS and n * 2 * _MIN_SHARD_SLOTS <= maxsize:
+        n *= 2
+    _shard_maxsize = maxsize // n
+    if len(_shards) != n:
+        _shards = [(Lock(), OrderedDict()) for _ in range(n)]
+
+
+_configure_shards(_CACHE_MAXSIZE)
 
 
 def get_cache_metrics() -> dict[str, int]:
     """Get cache performance metrics."""
     return {
-        "hits": _cache_hits,
-        "misses": _cache_misses,
-        "evictions": _cache_evictions,
+        "hits": _cache_hits.value(),
+        "misses": _cache_misses.value(),
+        "evictions": _cache_evictions.value(),
     }
 
 
 def get_cache_policy() -> dict[str, float | int]:
     """Return current cache policy and size for observability."""
-    with _cache_lock:
-        size = len(_curve_cache)
+    size = 0
+    for lock, shard in _shards:
+        with lock:
+            size += len(shard)
     return {
         "size": int(size),
         "maxsize": int(_CACHE_MAXSIZE),
@@ -57,32 +136,109 @@ class CurveProvider(Protocol):
     def __call__(self, file_path: str, form_data: Any | None = None) -> pd.DataFrame: ...
 
 
-@performance_monitor("load_curve_cached", log_threshold_ms=50.0)
-def _cached_load_curve(file_path: str, form_data: Any | None = None) -> pd.DataFrame:
-    """Load curve with caching and performance monitoring."""
-    # If form-provided curve data, bypass cache since inputs aren't part of the key
-    if form_data is not None or not _CACHE_ENABLED:
-        # Still enforce path safety even when bypassing cache
+def _resolve_and_validate(file_path: str) -> str:
+    """Return the absolute path for file_path after the DATA_DIR traversal guard."""
+    if not os.path.isabs(file_path):
+        # Relative paths depend on the working directory, so they are not memoized
         abs_path = os.path.abspath(file_path)
-        try:
-            ensure_in_data_dir(abs_path)
-        except Exception as e:
-            logger.error(f"Path validation failed: {e}")
-            raise ConfigurationError(f"Invalid file path: {e}")
-        
-        return parsing_mod.load_yield_curve(file_path, form_data)
+        ensure_in_data_dir(abs_path)
+        return abs_path
+    # Keyed on the configured DATA_DIR, so a changed data directory re-runs the guard
+    return _validated_path(file_path, get_config().DATA_DIR)
 
+
+@lru_cache(maxsize=128)
+def _validated_path(file_path: str, data_dir: str) -> str:
+    # Only successful validations are cached; a rejected path raises again on every call
     abs_path = os.path.abspath(file_path)
-    
+    ensure_in_data_dir(abs_path)
+    return abs_path
+
+
+def _file_signature(abs_path: str, now: float) -> tuple[int, int]:
+    """Return (st_mtime_ns, st_size), reusing a recent stat within the coalesce window."""
+    window = _STAT_COALESCE_SECONDS
+    if window > 0:
+        seen = _stat_seen.get(abs_path)
+        if seen is not None and now - seen[0] < window:
+            return seen[1]
+    # Integer mtime plus size catches rewrites that land within the filesystem's timestamp resolution
+    st = os.stat(abs_path)
+    sig = (st.st_mtime_ns, st.st_size)
+    if window > 0:
+        if len(_stat_seen) >= 128:
+            _stat_seen.clear()
+        _stat_seen[abs_path] = (now, sig)
+    return sig
+
+
+def _store_curve(lock: Lock, cache: OrderedDict[str, _CacheEntry], abs_path: str, entry: _CacheEntry) -> None:
+    evicted: list[str] = []
+    with lock:
+        # Evict least-recently-used if over the shard's capacity after insert
+        cache[abs_path] = entry
+        while len(cache) > _shard_maxsize:
+            evicted.append(cache.popitem(last=False)[0])
+    for evicted_path in evicted:
+        _cache_evictions.inc()
+        logger.debug(f"Evicted cache entry for {evicted_path}")
+
+
+def _renew_curve(lock: Lock, cache: OrderedDict[str, _CacheEntry], abs_path: str, entry: _CacheEntry, now: float) -> None:
+    """Restart the TTL of an entry whose file is unchanged; skipped when the shard is contended."""
+    if lock.acquire(blocking=False):
+        try:
+            # Leave the entry alone if another thread replaced or evicted it meanwhile
+            if cache.get(abs_path) is entry:
+                cache[abs_path] = (entry[0], entry[1], now)
+        finally:
+            lock.release()
+
+
+def _schedule_refresh(file_path: str, abs_path: str) -> None:
+    """Reload abs_path on a daemon thread unless a refresh for it is already running."""
+    with _refresh_lock:
+        if abs_path in _refreshing:
+            return
+        _refreshing.add(abs_path)
+    Thread(target=_refresh_curve, args=(file_path, abs_path), name="curve-cache-refresh", daemon=True).start()
+
+
+def _refresh_curve(file_path: str, abs_path: str) -> None:
+    try:
+        now = time.time()
+        file_sig = _file_signature(abs_path, now)
+        df = parsing_mod.load_yield_curve(file_path)
+        shards = _shards
+        idx = hash(abs_path) & (len(shards) - 1)
+        lock, cache = shards[idx]
+        _store_curve(lock, cache, abs_path, (file_sig, df, now))
+        logger.debug(f"Refreshed cache entry for {abs_path}")
+    except Exception as e:
+        # The stale entry stops being served at 2x TTL; the next request then reloads inline
+        logger.warning(f"Background refresh failed for {abs_path}: {e}")
+    finally:
+        with _refresh_lock:
+            _refreshing.discard(abs_path)
+
+
+@performance_monitor("load_curve_cached", log_threshold_ms=50.0)
+def _cached_load_curve(file_path: str, form_data: Any | None = None) -> pd.DataFrame:
+    """Load curve with caching and performance monitoring."""
     # Enforce path traversal guard prior to any filesystem stat
     try:
-        ensure_in_data_dir(abs_path)
+        abs_path = _resolve_and_validate(file_path)
     except Exception as e:
         logger.error(f"Path validation failed: {e}")
         raise ConfigurationError(f"Invalid file path: {e}")
-    
+
+    # If form-provided curve data, bypass cache since inputs aren't part of the key
+    if form_data is not None or not _CACHE_ENABLED:
+        return parsing_mod.load_yield_curve(file_path, form_data)
+
+    now = time.time()
     try:
-        mtime = os.path.getmtime(abs_path)
+        file_sig = _file_signature(abs_path, now)
     except FileNotFoundError:
         logger.warning(f"Curve file not found: {abs_path}")
         # Delegate to parser to raise a proper error
@@ -91,47 +247,68 @@ def _cached_load_curve(file_path: str, form_data: Any | None = None) -> pd.DataF
         logger.error(f"Error accessing file {abs_path}: {e}")
         raise ConfigurationError(f"Cannot access curve file: {e}")
 
-    now = time.time()
-    with _cache_lock:
-        entry = _curve_cache.get(abs_path)
-        if entry:
-            cached_mtime, df, ts = entry
-            # Validate staleness by TTL and file mtime match
-            if cached_mtime == mtime and (now - ts) <= _CACHE_TTL_SECONDS:
-                # Mark as recently used (move to end)
-                _curve_cache.move_to_end(abs_path, last=True)
-                global _cache_hits
-                _cache_hits += 1
-                logger.debug(f"Cache hit for {abs_path}")
-                return df
+    shards = _shards
+    idx = hash(abs_path) & (len(shards) - 1)
+    lock, cache = shards[idx]
+    # Hit path reads without locking (dict lookups are atomic under the GIL)
+    entry = cache.get(abs_path)
+    if entry:
+        cached_sig, df, ts = entry
+        # Validate staleness by TTL and file signature match
+        age = now - ts
+        serve = False
+        if age <= _CACHE_TTL_SECONDS:
+            serve = cached_sig == file_sig
+        elif _CACHE_SWR_ENABLED and age <= 2 * _CACHE_TTL_SECONDS:
+            # Stale-while-revalidate: serve the expired frame; an unchanged file only needs
+            # its TTL restarted, a changed one is reloaded on a background thread
+            serve = True
+            if cached_sig == file_sig:
+                _renew_curve(lock, cache, abs_path, entry, now)
             else:
-                # Invalidate stale entry if present
+                _schedule_refresh(file_path, abs_path)
+        if serve:
+            # Refresh LRU order only when the shard is uncontended; never wait on a hit
+            if lock.acquire(blocking=False):
                 try:
-                    del _curve_cache[abs_path]
-                    logger.debug(f"Invalidated stale cache entry for {abs_path}")
+                    cache.move_to_end(abs_path, last=True)
                 except KeyError:
                     pass
-        
-        # Count miss under lock before releasing for IO
-        global _cache_misses
-        _cache_misses += 1
-        logger.debug(f"Cache miss for {abs_path}")
+                finally:
+                    lock.release()
+            _cache_hits.inc()
+            logger.debug(f"Cache hit for {abs_path}")
+            return df
+
+    hit: pd.DataFrame | None = None
+    with lock:
+        entry = cache.get(abs_path)
+        if entry:
+            cached_sig, df, ts = entry
+            # Another thread may have refreshed the entry since the unlocked read
+            if cached_sig == file_sig and (now - ts) <= _CACHE_TTL_SECONDS:
+                hit = df
+            else:
+                # Invalidate stale entry if present
+                del cache[abs_path]
+                logger.debug(f"Invalidated stale cache entry for {abs_path}")
+    if hit is not None:
+        _cache_hits.inc()
+        return hit
+
+    _cache_misses.inc()
+    logger.debug(f"Cache miss for {abs_path}")
 
     # Cache miss: load fresh outside of lock
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
     try:
         df = parsing_mod.load_yield_curve(file_path, form_data)
-        load_time = (time.time() - start_time) * 1000
+        load_time = (time.perf_counter_ns() - start_ns) / 1e6
         performance_tracker.record("curve_load", load_time)
         
-        with _cache_lock:
-            # Evict least-recently-used if over capacity after insert
-            _curve_cache[abs_path] = (mtime, df, now)
-            while len(_curve_cache) > _CACHE_MAXSIZE:
-                evicted_path, _ = _curve_cache.popitem(last=False)
-                global _cache_evictions
-                _cache_evictions += 1
-                logger.debug(f"Evicted cache entry for {evicted_path}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Caching curve {abs_path}: {len(df)} points, {int(df.memory_usage(index=True).sum())} bytes")
+        _store_curve(lock, cache, abs_path, (file_sig, df, now))
         
         return df
     except Exception as e:
@@ -161,7 +338,7 @@ def build_services(config: Config) -> Services:
         raise ConfigurationError(f"Invalid configuration: {e}")
     
     # Apply cache policy from config with validation
-    global _CACHE_MAXSIZE, _CACHE_TTL_SECONDS, _CACHE_ENABLED
+    global _CACHE_MAXSIZE, _CACHE_TTL_SECONDS, _CACHE_ENABLED, _STAT_COALESCE_SECONDS, _CACHE_SWR_ENABLED
     
     try:
         _CACHE_MAXSIZE = max(1, int(getattr(config, "CURVE_CACHE_MAXSIZE", 4)))
@@ -181,14 +358,26 @@ def build_services(config: Config) -> Services:
         logger.warning(f"Invalid CURVE_CACHE_ENABLED: {e}, using default True")
         _CACHE_ENABLED = True
 
-    logger.info(f"Cache configured: maxsize={_CACHE_MAXSIZE}, ttl={_CACHE_TTL_SECONDS}s, enabled={_CACHE_ENABLED}")
+    try:
+        _STAT_COALESCE_SECONDS = max(0.0, float(getattr(config, "CURVE_STAT_COALESCE_SECONDS", 0.0)))
+    except (ValueError, TypeError) as e:
+        logger.warning(f"Invalid CURVE_STAT_COALESCE_SECONDS: {e}, using default 0")
+        _STAT_COALESCE_SECONDS = 0.0
+    _stat_seen.clear()
+    _CACHE_SWR_ENABLED = bool(getattr(config, "CURVE_CACHE_SWR_ENABLED", False))
+
+    _configure_shards(_CACHE_MAXSIZE)
+
+    logger.info(f"Cache configured: maxsize={_CACHE_MAXSIZE}, ttl={_CACHE_TTL_SECONDS}s, enabled={_CACHE_ENABLED}, swr={_CACHE_SWR_ENABLED}")
+
+    # Wrap module functions to inject config mapping explicitly. Like the cache policy above,
+    # the mapping is captured once: later edits to the config object need a rebuild.
+    cfg_map: Mapping[str, Any] = MappingProxyType(config.model_dump())
 
-    # Wrap module functions to inject config mapping explicitly
     @performance_monitor("price_swap", log_threshold_ms=200.0)
     def _price_swap(notional: float, fixed_rate: float, maturity_date, yield_curve: pd.DataFrame, cfg_override: Mapping[str, Any] | None = None):
         try:
-            cfg_map = cfg_override if cfg_override is not None else config.model_dump()
-            return pricer_mod.price_swap(notional, fixed_rate, maturity_date, yield_curve, cfg_map)
+            return pricer_mod.price_swap(notional, fixed_rate, maturity_date, yield_curve, cfg_override if cfg_override is not None else cfg_map)
         except Exception as e:
             logger.error(f"Swap pricing failed: {e}")
             raise
@@ -196,7 +385,7 @@ def build_services(config: Config) -> Services:
     @performance_monitor("solve_par_rate", log_threshold_ms=100.0)
     def _solve_par_rate(notional: float, maturity_date, yield_curve: pd.DataFrame):
         try:
-            return pricer_mod.solve_par_rate(notional, maturity_date, yield_curve, config.model_dump())
+            return pricer_mod.solve_par_rate(notional, maturity_date, yield_curve, cfg_map)
         except Exception as e:
             logger.error(f"Par rate solving failed: {e}")
             raise
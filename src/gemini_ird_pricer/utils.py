@@ -1,10 +1,16 @@
 from __future__ import annotations
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 import glob
+import fnmatch
+import math
 import re
+import time
+from functools import lru_cache
+import numpy as np
+import numpy.typing as npt
 from .config import get_config
-from typing import Optional
+from typing import Callable, Optional, Sequence, Union
 
 
 def _is_leap_year(y: int) -> bool:
@@ -30,55 +36,186 @@ def year_fraction(start: datetime, end: datetime, day_count: str = "ACT/365F") -
     - ACT/365L uses 366 if the period includes Feb 29; otherwise 365.
     - For production-grade accuracy (ISDA), consider a dedicated finance date library.
     """
+    fn = _DC_DISPATCH.get(day_count)
+    if fn is None:
+        # Fallback to ACT/365F approximation for unknown conventions
+        fn = _DC_DISPATCH.get(day_count.upper().strip(), _yf_act365)
+    return fn(start, end)
+
+
+def _yf_act365(start: datetime, end: datetime) -> float:
+    return (end - start).days / 365.0
+
+
+def _yf_act365_25(start: datetime, end: datetime) -> float:
+    return (end - start).days / 365.25
+
+
+def _yf_act360(start: datetime, end: datetime) -> float:
+    return (end - start).days / 360.0
+
+
+def _yf_30_360(start: datetime, end: datetime) -> float:
+    # Simplified 30/360 US with Feb EOM adjustment: treat any February date as day 30
+    d1 = 30 if start.month == 2 else min(start.day, 30)
+    d2 = 30 if end.month == 2 else min(end.day, 30)
+    return ((end.year - start.year) * 360 + (end.month - start.month) * 30 + (d2 - d1)) / 360.0
+
+
+def _yf_act_act(start: datetime, end: datetime) -> float:
+    # Approximate ACT/ACT: prorate by each calendar year length in the span
+    if end <= start:
+        return 0.0
+    total = 0.0
+    cur = start
+    while cur < end:
+        next_day = cur.replace(month=12, day=31) + timedelta(days=1)
+        segment_end = end if end <= next_day else next_day
+        denom = 366.0 if _is_leap_year(cur.year) else 365.0
+        total += (segment_end - cur).days / denom
+        cur = segment_end
+    return total
+
+
+def _yf_act365l(start: datetime, end: datetime) -> float:
+    # Use 366 if the interval includes Feb 29 in any spanned year
+    if end <= start:
+        return 0.0
+    years = range(start.year, end.year + 1)
+    includes_feb29 = any(_is_leap_year(y) and _spans_feb29(start, end, y) for y in years)
+    denom = 366.0 if includes_feb29 else 365.0
+    return (end - start).days / denom
+
+
+# Normalized (upper-case, stripped) convention name -> year fraction function
+_DC_DISPATCH: dict[str, Callable[[datetime, datetime], float]] = {
+    "ACT/365F": _yf_act365,
+    "ACT/365": _yf_act365,
+    "ACT/365.25": _yf_act365_25,
+    "ACT/360": _yf_act360,
+    "30/360": _yf_30_360,
+    "ACT/ACT": _yf_act_act,
+    "ACT/ACT(ISDA)": _yf_act_act,
+    "ACT/365L": _yf_act365l,
+}
+
+
+_ONE_DAY = np.timedelta64(1, "D")
+
+_FloatArray = npt.NDArray[np.float64]
+_IntArray = npt.NDArray[np.int64]
+_DateArray = npt.NDArray[np.datetime64]
+_DatesLike = Union[datetime, Sequence[datetime], npt.ArrayLike]
+DiscountFunction = Callable[[float, float], float]
+DiscountFunctionVec = Callable[[_FloatArray, _FloatArray], _FloatArray]
+
+
+def _ymd(d: _DateArray) -> tuple[_IntArray, _IntArray, _IntArray]:
+    """Calendar (year, month, day) int arrays for a datetime64[D] array."""
+    months = d.astype("datetime64[M]")
+    return (
+        d.astype("datetime64[Y]").astype(np.int64) + 1970,
+        months.astype(np.int64) % 12 + 1,
+        (d - months).astype(np.int64) + 1,
+    )
+
+
+def _year_start(years: _IntArray) -> _DateArray:
+    # Jan 1 of each calendar year, as datetime64[us]
+    return (years - 1970).astype("datetime64[Y]").astype("datetime64[us]")
+
+
+def _is_leap_year_array(y: _IntArray) -> npt.NDArray[np.bool_]:
+    return np.asarray((y % 4 == 0) & ((y % 100 != 0) | (y % 400 == 0)), dtype=np.bool_)
+
+
+def year_fraction_array(starts: _DatesLike, ends: _DatesLike, day_count: str = "ACT/365F") -> _FloatArray:
+    """Vectorized year_fraction over broadcast arrays of start and end datetimes.
+
+    Element-wise identical to ``year_fraction`` (same conventions and approximations);
+    the convention is dispatched once for the whole batch.
+    """
+    start, end = np.broadcast_arrays(
+        np.asarray(starts, dtype="datetime64[us]"), np.asarray(ends, dtype="datetime64[us]")
+    )
+    days = (end - start) // _ONE_DAY
     s = day_count.upper().strip()
-    if s == "ACT/365F" or s == "ACT/365":
-        return (end - start).days / 365.0
     if s == "ACT/365.25":
-        return (end - start).days / 365.25
+        return np.asarray(days / 365.25, dtype=np.float64)
     if s == "ACT/360":
-        return (end - start).days / 360.0
+        return np.asarray(days / 360.0, dtype=np.float64)
     if s == "30/360":
-        # Simplified 30/360 US with Feb EOM adjustment: treat EOM Feb as day 30
-        y1, m1 = start.year, start.month
-        y2, m2 = end.year, end.month
-        from calendar import monthrange as _mr
-        d1 = min(start.day, 30)
-        d2 = min(end.day, 30)
-        # Treat any February date as day 30 for this simplified convention
-        if m2 == 2:
-            d2 = 30
-        if m1 == 2:
-            d1 = 30
-        return ((y2 - y1) * 360 + (m2 - m1) * 30 + (d2 - d1)) / 360.0
+        y1, m1, d1 = _ymd(start.astype("datetime64[D]"))
+        y2, m2, d2 = _ymd(end.astype("datetime64[D]"))
+        d1 = np.where(m1 == 2, 30, np.minimum(d1, 30))
+        d2 = np.where(m2 == 2, 30, np.minimum(d2, 30))
+        return np.asarray(((y2 - y1) * 360 + (m2 - m1) * 30 + (d2 - d1)) / 360.0, dtype=np.float64)
     if s == "ACT/ACT" or s == "ACT/ACT(ISDA)":
-        # Approximate ACT/ACT: prorate by each calendar year length in the span
-        if end <= start:
-            return 0.0
-        from datetime import date, timedelta as _td
-        total = 0.0
+        # Same segmentation as the scalar loop: calendar-year pieces anchored at start's time of day
+        total: _FloatArray = np.zeros(days.shape)
+        live = end > start
+        if not live.any():
+            return total
+        y0 = _ymd(start.astype("datetime64[D]"))[0]
+        time_of_day = start - start.astype("datetime64[D]").astype("datetime64[us]")
         cur = start
-        while cur < end:
-            year_end = cur.replace(month=12, day=31)
-            next_day = year_end + _td(days=1)
-            segment_end = end if end <= next_day else next_day
-            days = (segment_end - cur).days
-            denom = 366.0 if _is_leap_year(cur.year) else 365.0
-            total += days / denom
-            cur = segment_end
-        return total
+        k = 0
+        while True:
+            active = live & (cur < end)
+            if not active.any():
+                return total
+            year = y0 + k
+            next_start = _year_start(year + 1) + time_of_day
+            seg_end = np.minimum(end, next_start)
+            denom = np.where(_is_leap_year_array(year), 366.0, 365.0)
+            total = np.where(active, total + ((seg_end - cur) // _ONE_DAY) / denom, total)
+            cur = np.where(active, seg_end, cur)
+            k += 1
     if s == "ACT/365L":
-        # Use 366 if the interval includes Feb 29 in any spanned year
-        if end <= start:
-            return 0.0
-        years = range(start.year, end.year + 1)
-        includes_feb29 = any(_is_leap_year(y) and _spans_feb29(start, end, y) for y in years)
-        denom = 366.0 if includes_feb29 else 365.0
-        return (end - start).days / denom
-    # Fallback to ACT/365F approximation
-    return (end - start).days / 365.0
+        live = end > start
+        y_start = _ymd(start.astype("datetime64[D]"))[0]
+        y_end = _ymd(end.astype("datetime64[D]"))[0]
+        includes_feb29 = np.zeros(days.shape, dtype=bool)
+        for k in range(int((y_end - y_start).max(initial=0)) + 1):
+            year = y_start + k
+            feb29 = _year_start(year) + np.timedelta64(59, "D")
+            includes_feb29 |= _is_leap_year_array(year) & (year <= y_end) & (start <= feb29) & (feb29 <= end)
+        return np.asarray(np.where(live, days / np.where(includes_feb29, 366.0, 365.0), 0.0), dtype=np.float64)
+    # ACT/365F, ACT/365 and the fallback
+    return np.asarray(days / 365.0, dtype=np.float64)
+
+
+def _discount_exp_cont(r: float, t: float, _exp: Callable[[float], float] = math.exp) -> float:
+    return _exp(-r * t)
+
+
+def _discount_exp_cont_vec(r: _FloatArray, t: _FloatArray) -> _FloatArray:
+    return np.asarray(np.exp(-r * t), dtype=np.float64)
+
+
+def _discount_simple(r: float, t: float) -> float:
+    return 1.0 / (1.0 + r * t)
+
+
+def _discount_simple_vec(r: _FloatArray, t: _FloatArray) -> _FloatArray:
+    return np.asarray(1.0 / (1.0 + r * t), dtype=np.float64)
+
+
+def _discount_compounded(n: int) -> DiscountFunction:
+    def discount(r: float, t: float, _n: int = n) -> float:
+        growth: float = (1.0 + r / _n) ** (_n * t)
+        return 1.0 / growth
+    return discount
 
 
-def build_discount_function(strategy: str = "exp_cont"):
+def _discount_compounded_vec(n: int) -> DiscountFunctionVec:
+    def discount(r: _FloatArray, t: _FloatArray, _n: int = n) -> _FloatArray:
+        return np.asarray(1.0 / (1.0 + r / _n) ** (_n * t), dtype=np.float64)
+    return discount
+
+
+@lru_cache(maxsize=16)
+def build_discount_function(strategy: str = "exp_cont") -> DiscountFunction:
     """Return a discounting function D(rate, t) according to strategy.
 
     Supported strategies:
@@ -88,18 +225,33 @@ def build_discount_function(strategy: str = "exp_cont"):
     """
     st = (strategy or "exp_cont").lower().strip()
     if st == "simple":
-        return lambda r, t: 1.0 / (1.0 + r * t)
+        return _discount_simple
     if st.startswith("comp_"):
-        try:
-            n = int(st.split("_", 1)[1])
-            if n <= 0:
-                raise ValueError
-        except Exception:
-            n = 1
-        return lambda r, t, _n=n: 1.0 / (1.0 + r / _n) ** (_n * t)
+        return _discount_compounded(_compounding_periods(st))
     # default continuous
-    import math
-    return lambda r, t: math.exp(-r * t)
+    return _discount_exp_cont
+
+
+@lru_cache(maxsize=16)
+def build_discount_function_vec(strategy: str = "exp_cont") -> DiscountFunctionVec:
+    """Array counterpart of build_discount_function: D(rates, times) over NumPy arrays."""
+    st = (strategy or "exp_cont").lower().strip()
+    if st == "simple":
+        return _discount_simple_vec
+    if st.startswith("comp_"):
+        return _discount_compounded_vec(_compounding_periods(st))
+    return _discount_exp_cont_vec
+
+
+def _compounding_periods(st: str) -> int:
+    """Periods per year from a 'comp_n' strategy name; invalid or non-positive n means 1."""
+    try:
+        n = int(st.split("_", 1)[1])
+        if n <= 0:
+            raise ValueError
+    except Exception:
+        n = 1
+    return n
 
 
 def parse_valuation_date_from_filename(file_path: str) -> datetime:
@@ -114,9 +266,11 @@ def parse_valuation_date_from_filename(file_path: str) -> datetime:
         return datetime.today()
 
 
-def ensure_in_data_dir(file_path: str) -> None:
+def ensure_in_data_dir(file_path: str, data_dir: str | None = None) -> None:
     """Ensure the given path is inside the configured DATA_DIR to prevent path traversal.
 
+    ``data_dir`` overrides the configured DATA_DIR (e.g. the CLI's ``--data-dir``).
+
     During tests (when PYTEST_CURRENT_TEST is set), this guard is bypassed to allow
     reading fixture files from tests directories.
 
@@ -128,8 +282,19 @@ def ensure_in_data_dir(file_path: str) -> None:
     # Bypass during pytest to enable fixtures outside DATA_DIR
     if os.getenv("PYTEST_CURRENT_TEST"):
         return
-    cfg = get_config()
-    configured_dir = getattr(cfg, "DATA_DIR", "") or ""
+    if data_dir is None:
+        data_dir = getattr(get_config(), "DATA_DIR", "") or ""
+    base_dir, base_prefix = _data_dir_for(data_dir)
+
+    # Both sides are absolute and normalized, so a prefix test on a path boundary is commonpath
+    abs_path = os.path.normcase(os.path.abspath(file_path))
+    if abs_path != base_dir and not abs_path.startswith(base_prefix):
+        raise ValueError("Access to files outside the data directory is not allowed.")
+
+
+@lru_cache(maxsize=8)
+def _data_dir_for(configured_dir: str) -> tuple[str, str]:
+    # Resolved, normcased DATA_DIR and its "dir + os.sep" prefix, keyed on the configured value
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
     base_dir = os.path.abspath(os.path.join(project_root, configured_dir)) if not os.path.isabs(configured_dir) else os.path.abspath(configured_dir)
 
@@ -137,11 +302,8 @@ def ensure_in_data_dir(file_path: str) -> None:
     drive, _ = os.path.splitdrive(base_dir)
     if os.path.normpath(base_dir) == (drive + os.sep):
         raise ValueError("DATA_DIR cannot be a drive root; please configure a subdirectory.")
-
-    abs_path = os.path.abspath(file_path)
-    common = os.path.commonpath([abs_path, base_dir])
-    if common != base_dir:
-        raise ValueError("Access to files outside the data directory is not allowed.")
+    base_dir = os.path.normcase(base_dir)
+    return base_dir, base_dir + os.sep
 
 
 def apply_valuation_time(dt: datetime, time_str: Optional[str] = None) -> datetime:
@@ -151,30 +313,90 @@ def apply_valuation_time(dt: datetime, time_str: Optional[str] = None) -> dateti
     - time_str: optional override like "HH:MM:SS"; when None, use config.VALUATION_TIME
     This helps keep timezone/naive handling consistent by pinning a specific time of day.
     """
-    cfg = get_config()
-    t = (time_str or cfg.VALUATION_TIME or "00:00:00").strip()
+    hh, mm, ss = _parse_time_of_day(time_str or get_config().VALUATION_TIME or "00:00:00")
+    return dt.replace(hour=hh, minute=mm, second=ss, microsecond=0)
+
+
+@lru_cache(maxsize=16)
+def _parse_time_of_day(t: str) -> tuple[int, int, int]:
+    """Parse "HH:MM:SS" once per distinct value; malformed input means midnight."""
     try:
-        hh, mm, ss = [int(x) for x in t.split(":")]
+        hh, mm, ss = [int(x) for x in t.strip().split(":")]
     except Exception:
-        hh, mm, ss = 0, 0, 0
-    return dt.replace(hour=hh, minute=mm, second=ss, microsecond=0)
+        return 0, 0, 0
+    return hh, mm, ss
+
 
 
+# (directory, pattern) -> (dir mtime_ns, scan wall time, matching paths)
+_CURVE_LISTING_CACHE: dict[tuple[str, str], tuple[int, float, tuple[str, ...]]] = {}
+# A listing is only reused if the directory was already this old (seconds) when scanned,
+# so entries added within the same filesystem timestamp tick are not missed.
+_LISTING_SETTLE_SECONDS = 1.0
 
-def _pick_latest_by_date(files: list[str], pattern: str = r".*_(\d{8})\.csv$") -> str | None:
+
+@lru_cache(maxsize=32)
+def _compile_name_pattern(pattern: str):
+    """Compile a shell-style file name pattern once (case handling as in fnmatch.fnmatch)."""
+    return re.compile(fnmatch.translate(os.path.normcase(pattern))).match
+
+
+def list_curve_files(data_dir: str, pattern: str) -> list[str]:
+    """Return paths in data_dir whose names match pattern (like glob, without the re-scan).
+
+    The listing is cached per directory and invalidated when the directory's mtime changes.
+    Patterns containing a path separator fall back to an uncached glob.
+    """
+    return list(_scan_curve_files(data_dir, pattern))
+
+
+def _scan_curve_files(data_dir: str, pattern: str) -> tuple[str, ...]:
+    # Cached tuples are returned as-is (the same object while the directory is unchanged)
+    if os.sep in pattern or (os.altsep and os.altsep in pattern):
+        return tuple(glob.glob(os.path.join(data_dir, pattern)))
+    try:
+        mtime = os.stat(data_dir).st_mtime_ns
+    except OSError:
+        return ()
+    key = (data_dir, pattern)
+    hit = _CURVE_LISTING_CACHE.get(key)
+    if hit is not None and hit[0] == mtime and hit[1] - mtime / 1e9 > _LISTING_SETTLE_SECONDS:
+        return hit[2]
+    match = _compile_name_pattern(pattern)
+    skip_hidden = not pattern.startswith(".")
+    scanned_at = time.time()
+    with os.scandir(data_dir) as it:
+        files = tuple(
+            e.path
+            for e in it
+            if match(os.path.normcase(e.name)) and not (skip_hidden and e.name.startswith(".")) and e.is_file()
+        )
+    _CURVE_LISTING_CACHE[key] = (mtime, scanned_at, files)
+    return files
+
+
+_CURVE_DATE_RE = re.compile(r".*_(\d{8})\.csv$")
+
+
+def _pick_latest_by_date(files: "list[str] | tuple[str, ...]", pattern: str | None = None) -> str | None:
     """Pick the file with the latest YYYYMMDD token at the end; fallback to first."""
-    date_re = re.compile(pattern)
-    dated: list[tuple[str, str]] = []
+    match = (_CURVE_DATE_RE if pattern is None else re.compile(pattern)).match
+    best: tuple[str, str] | None = None
     for f in files:
-        m = date_re.match(os.path.basename(f))
-        if m:
-            dated.append((m.group(1), f))
-    if dated:
-        dated.sort(key=lambda x: x[0], reverse=True)
-        return dated[0][1]
+        m = match(os.path.basename(f))
+        if m and (best is None or m.group(1) > best[0]):
+            best = (m.group(1), f)
+    if best is not None:
+        return best[1]
     return files[0] if files else None
 
 
+@lru_cache(maxsize=8)
+def _latest_curve_file(files: tuple[str, ...]) -> str | None:
+    # Keyed on the cached listing, so the pick is reused until the directory changes
+    return _pick_latest_by_date(files)
+
+
 def find_curve_file(cfg) -> str:
     """Find a SwapRates CSV file using config.
     
@@ -187,19 +409,17 @@ def find_curve_file(cfg) -> str:
     data_dir = getattr(cfg, "DATA_DIR", None) or get_config().DATA_DIR
     pattern = getattr(cfg, "CURVE_GLOB", None) or get_config().CURVE_GLOB
 
-    primary = glob.glob(os.path.join(data_dir, pattern)) if data_dir else []
-    pick = _pick_latest_by_date(primary)
+    pick = _latest_curve_file(_scan_curve_files(data_dir, pattern)) if data_dir else None
     if pick:
         return pick
 
     # Fallback to project root (../../ from this file)
     project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), os.pardir, os.pardir))
-    fallback = glob.glob(os.path.join(project_root, pattern))
+    fallback = list_curve_files(project_root, pattern)
     if fallback:
         try:
             # Prefer most recently modified file to honor freshly created test fixtures
-            fallback.sort(key=lambda p: os.path.getmtime(p), reverse=True)
-            return fallback[0]
+            return max(fallback, key=os.path.getmtime)
         except Exception:
             # Fallback to date-token selection if mtime unavailable
             pick2 = _pick_latest_by_date(fallback)
@@ -1,6 +1,7 @@
 from __future__ import annotations
 from flask import Flask, render_template, request, jsonify
 from pydantic import ValidationError as PydanticValidationError
+from pydantic_core import ErrorDetails
 from .parsing import parse_notional, parse_maturity_date
 from .plotting import plot_yield_curve
 from .services import Services
@@ -221,18 +222,25 @@ def _load_curve_with_optional_overrides(file_path: str, svc: Services | None, da
         return _load(file_path, form)
 
 
+def _validation_errors(ve: PydanticValidationError) -> list[ErrorDetails]:
+    """Error list for a 400 response; an unparsable body is not echoed back as input."""
+    errors = ve.errors()
+    if any(err["type"] == "json_invalid" for err in errors):
+        return ve.errors(include_input=False)
+    return errors
+
+
 def _handle_api_price(services: Services | None, app: Flask):
     """Handle API price endpoint."""
     try:
         if not request.is_json:
             return _json_error(400, "Request body must be JSON.")
         
-        data = request.get_json(silent=True) or {}
-        
         try:
-            req = PriceRequest(**data)
+            # Parse and validate the raw body in one step (pydantic-core, no intermediate dict)
+            req = PriceRequest.model_validate_json(request.get_data() or b"{}")
         except PydanticValidationError as ve:
-            return _json_error(400, "Invalid request.", err_type="validation_error", details={"errors": ve.errors()})
+            return _json_error(400, "Invalid request.", err_type="validation_error", details={"errors": _validation_errors(ve)})
         
         # Parse and validate inputs
         notional = parse_notional(str(req.notional))
@@ -270,12 +278,11 @@ def _handle_api_solve(services: Services | None, app: Flask):
         if not request.is_json:
             return _json_error(400, "Request body must be JSON.")
         
-        data = request.get_json(silent=True) or {}
-        
         try:
-            req = SolveRequest(**data)
+            # Parse and validate the raw body in one step (pydantic-core, no intermediate dict)
+            req = SolveRequest.model_validate_json(request.get_data() or b"{}")
         except PydanticValidationError as ve:
-            return _json_error(400, "Invalid request.", err_type="validation_error", details={"errors": ve.errors()})
+            return _json_error(400, "Invalid request.", err_type="validation_error", details={"errors": _validation_errors(ve)})
         
         # Parse and validate inputs
         notional = parse_notional(str(req.notional))
@@ -73,3 +73,18 @@ def test_validation_error_bad_curve_point(app_client):
     body = resp.get_json()
     assert body["error"]["type"] == "validation_error"
     assert "details" in body["error"]
+
+
+@pytest.mark.parametrize("raw", ["not json", "[1, 2]", ""])
+def test_malformed_or_non_object_body_is_validation_error(app_client, raw):
+    resp = app_client.post("/api/solve", data=raw, headers={"Content-Type": "application/json"})
+    assert resp.status_code == 400
+    assert resp.get_json()["error"]["type"] == "validation_error"
+
+
+def test_malformed_body_is_not_echoed_in_validation_details(app_client):
+    resp = app_client.post("/api/price", data=b"{not json", headers={"Content-Type": "application/json"})
+    assert resp.status_code == 400
+    errors = resp.get_json()["error"]["details"]["errors"]
+    assert errors[0]["type"] == "json_invalid"
+    assert all("input" not in err for err in errors)
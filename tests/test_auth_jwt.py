@@ -0,0 +1,67 @@
+from __future__ import annotations
+from unittest.mock import patch
+
+import jwt
+
+from gemini_ird_pricer.auth import JWTAuth
+
+
+def test_validate_token_roundtrip_and_rejects_other_secret():
+    auth = JWTAuth("secret-a")
+    token = auth.generate_token("alice")
+    assert auth.validate_token(token)["user_id"] == "alice"
+    assert JWTAuth("secret-b").validate_token(token) is None
+    assert auth.validate_token("not-a-token") is None
+
+
+def test_validate_token_caches_verified_payload():
+    auth = JWTAuth("secret")
+    token = auth.generate_token("bob")
+    with patch("gemini_ird_pricer.auth.jwt.decode", wraps=jwt.decode) as dec:
+        for _ in range(5):
+            assert auth.validate_token(token)["user_id"] == "bob"
+    assert dec.call_count == 1
+
+
+def test_validate_token_cache_never_outlives_token_expiry():
+    auth = JWTAuth("secret", cache_ttl=60.0)
+    token = auth.generate_token("carol", expires_in=1)
+    payload = auth.validate_token(token)
+    assert payload is not None
+    (valid_until, _), = auth._verified.values()
+    assert valid_until <= payload["exp"]
+
+
+def test_require_jwt_auth_rejections_are_json():
+    from flask import Flask
+    from gemini_ird_pricer.auth import require_jwt_auth
+
+    app = Flask(__name__)
+    app.config["JWT_SECRET_KEY"] = "secret"
+
+    @app.route("/p")
+    @require_jwt_auth
+    def protected():
+        return "ok"
+
+    client = app.test_client()
+    resp = client.get("/p")
+    assert resp.status_code == 401
+    assert resp.get_json()["error"]["message"] == "JWT token required"
+    resp = client.get("/p", headers={"Authorization": "Bearer nope"})
+    assert resp.status_code == 401
+    assert resp.get_json()["error"]["message"] == "Invalid or expired token"
+    token = JWTAuth("secret").generate_token("dave")
+    assert client.get("/p", headers={"Authorization": f"Bearer {token}"}).data == b"ok"
+
+
+def test_validate_token_rejects_oversized_token_without_decoding():
+    auth = JWTAuth("secret")
+    with patch("gemini_ird_pricer.auth.jwt.decode") as dec:
+        assert auth.validate_token("a" * (JWTAuth.MAX_TOKEN_LENGTH + 1)) is None
+    dec.assert_not_called()
+
+
+def test_validate_token_requires_iat_claim():
+    token = jwt.encode({"user_id": "erin", "exp": 4102444800}, "secret", algorithm="HS256")
+    assert JWTAuth("secret").validate_token(token) is None
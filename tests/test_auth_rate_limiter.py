@@ -0,0 +1,47 @@
+from __future__ import annotations
+from unittest.mock import patch
+
+from gemini_ird_pricer.auth import RateLimiter
+
+
+def test_token_bucket_allows_limit_then_refills():
+    limiter = RateLimiter()
+    with patch("gemini_ird_pricer.auth.time.monotonic_ns", return_value=1000 * 10**9):
+        assert all(limiter.is_allowed("u", 3) for _ in range(3))
+        assert not limiter.is_allowed("u", 3)
+        # Independent identifiers have independent buckets
+        assert limiter.is_allowed("v", 3)
+    # One token refills every window_size / limit seconds
+    with patch("gemini_ird_pricer.auth.time.monotonic_ns", return_value=1020 * 10**9):
+        assert limiter.is_allowed("u", 3)
+        assert not limiter.is_allowed("u", 3)
+
+
+def test_idle_buckets_are_swept():
+    limiter = RateLimiter()
+    limiter._SWEEP_EVERY = 2
+    limiter._SHARDS = 1
+    limiter.shards = limiter.shards[:1]
+    with patch("gemini_ird_pricer.auth.time.monotonic_ns", return_value=0):
+        limiter.is_allowed("idle", 5)
+    with patch("gemini_ird_pricer.auth.time.monotonic_ns", return_value=1000 * 10**9):
+        limiter.is_allowed("active", 5)
+    buckets = limiter.shards[0].buckets
+    assert "idle" not in buckets
+    assert "active" in buckets
+
+
+def test_zero_limit_denies_every_request():
+    limiter = RateLimiter()
+    assert not limiter.is_allowed("u", 0)
+    assert not limiter.is_allowed("u", -1)
+
+
+def test_concurrent_requests_never_exceed_limit():
+    from concurrent.futures import ThreadPoolExecutor
+
+    limiter = RateLimiter()
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda _: limiter.is_allowed("shared", 50), range(400)))
+    # A few tokens may refill during the run; never more than that
+    assert 50 <= results.count(True) <= 51
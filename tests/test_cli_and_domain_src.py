@@ -51,6 +51,22 @@ def test_cli_main_fixed_and_par_rate(tmp_path, capsys, monkeypatch):
     assert "Par rate:" in out2
 
 
+
+def test_cli_data_dir_override_passes_path_guard(tmp_path, capsys, monkeypatch):
+    # Outside pytest's bypass the guard must check against --data-dir, not the configured DATA_DIR
+    monkeypatch.delenv("PYTEST_CURRENT_TEST", raising=False)
+    data_dir = tmp_path / "curves"
+    data_dir.mkdir(parents=True)
+    curve_path = data_dir / "SwapRates_20240115.csv"
+    with open(_fixture_path("SwapRates_20240115.csv"), "rb") as fsrc, open(curve_path, "wb") as fdst:
+        fdst.write(fsrc.read())
+
+    rc = cli_main(["--notional", "10m", "--maturity", "2y", "--data-dir", str(data_dir)])
+    captured = capsys.readouterr()
+    assert rc == 0, captured.out + captured.err
+    assert "Par Rate:" in captured.out
+
+
 def test_parsing_load_with_form_data_branch(tmp_path):
     # Create a minimal file path to provide valuation date token
     data_dir = tmp_path / "curves"
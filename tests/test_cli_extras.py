@@ -33,3 +33,28 @@ def test_cli_config_flag_prints_json():
     for key in essential_keys:
         assert key in out
     assert "log_linear_df" in out
+
+
+def test_cli_rejects_malformed_notional(capsys):
+    from gemini_ird_pricer.cli import main
+
+    assert main(["--notional", "100mm", "--maturity", "5y"]) == 1
+    assert "Invalid notional format" in capsys.readouterr().out
+
+
+def test_cli_data_dir_override_is_used(tmp_path, capsys):
+    import shutil
+    from gemini_ird_pricer.cli import main
+
+    src = os.path.join(os.path.dirname(__file__), "data", "SwapRates_20240115.csv")
+    shutil.copy(src, tmp_path / "SwapRates_20240115.csv")
+    assert main(["--notional", "10m", "--maturity", "5y", "--data-dir", str(tmp_path)]) == 0
+    assert "Par Rate:" in capsys.readouterr().out
+
+
+def test_cli_config_output_is_json(capsys):
+    import json
+    from gemini_ird_pricer.cli import main
+
+    assert main(["--config"]) == 0
+    assert "DATA_DIR" in json.loads(capsys.readouterr().out)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+import json
+import logging
+import threading
+
+import pytest
+
+from gemini_ird_pricer import create_app
+from gemini_ird_pricer.logging_utils import stop_queue_logging
+
+
+@pytest.fixture
+def restore_logging():
+    saved = {
+        name: (lg.handlers[:], lg.level, lg.propagate)
+        for name, lg in ((n, logging.getLogger(n)) for n in ("", "flask.access"))
+    }
+    yield
+    stop_queue_logging()
+    for name, (handlers, level, propagate) in saved.items():
+        lg = logging.getLogger(name)
+        lg.handlers, lg.level, lg.propagate = handlers, level, propagate
+
+
+def test_json_logs_are_written_by_background_listener_with_request_context(monkeypatch, capsys, restore_logging):
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    app = create_app()
+    assert app.extensions["log_listener"] is not None
+
+    @app.route("/_log_ctx")
+    def _log_ctx():
+        app.logger.info("inside %s", "handler")
+        return "ok"
+
+    app.test_client().get("/_log_ctx", headers={"X-Request-ID": "rid-json"}).close()
+    stop_queue_logging()  # drain the queue
+
+    lines = [json.loads(line) for line in capsys.readouterr().err.splitlines() if line.startswith("{")]
+    inside = next(rec for rec in lines if rec["msg"] == "inside handler")
+    assert inside["request_id"] == "rid-json"
+    assert inside["path"] == "/_log_ctx"
+    access = next(rec for rec in lines if rec["logger"] == "flask.access")
+    assert access["status"] == 200
+
+
+def test_apps_share_one_log_listener(monkeypatch, capsys, restore_logging):
+    monkeypatch.setenv("LOG_FORMAT", "json")
+    first = create_app()
+    first_handler = logging.getLogger().handlers[0]
+    threads = threading.active_count()
+    apps = [create_app() for _ in range(4)]
+    assert threading.active_count() == threads
+    assert all(a.extensions["log_listener"] is first.extensions["log_listener"] for a in apps)
+
+    # The first app's queue handler is still drained after the second app reconfigured logging
+    logger = logging.getLogger("test.first_app")
+    logger.addHandler(first_handler)
+    logger.propagate = False
+    try:
+        logger.warning("from the first app")
+    finally:
+        logger.removeHandler(first_handler)
+    stop_queue_logging(first.extensions["log_listener"])
+
+    lines = [json.loads(line) for line in capsys.readouterr().err.splitlines() if line.startswith("{")]
+    assert any(rec["msg"] == "from the first app" for rec in lines)
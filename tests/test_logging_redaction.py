@@ -37,3 +37,17 @@ def test_sensitive_headers_not_logged(client_and_caplog):
     text = "\n".join(r.getMessage() for r in caplog.records)
     assert "super_secret_token" not in text
     assert "sessionid=verysecret" not in text
+
+
+def test_sanitize_log_data_redacts_nested_without_mutating_input():
+    from gemini_ird_pricer.logging_utils import sanitize_log_data
+
+    clean = {"status": 200, "items": [{"id": 1}]}
+    payload = {"Authorization": "Bearer x", "body": {"notional": 1e6, "tenor": "5y"}, "clean": clean}
+    out = sanitize_log_data(payload)
+    assert out["Authorization"] == "***REDACTED***"
+    assert out["body"] == {"notional": "***REDACTED***", "tenor": "5y"}
+    assert payload["body"]["notional"] == 1e6
+    # Subtrees with nothing to redact are shared, not copied
+    assert out["clean"] is clean
+    assert sanitize_log_data(clean) is clean
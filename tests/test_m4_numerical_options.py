@@ -69,3 +69,16 @@ def test_interp_strategy_log_linear_df_produces_valid_prices(app_client_prod):
     # We just assert finite and not wildly divergent
     assert math.isfinite(v_lin) and math.isfinite(v_log)
     assert abs(v_lin - v_log) < 2e6  # loose bound to avoid flakiness on arbitrary curves
+
+
+@pytest.mark.parametrize("strategy", ["exp_cont", "simple", "comp_2", "comp_0"])
+def test_vectorized_discount_function_matches_scalar(strategy):
+    import numpy as np
+    from gemini_ird_pricer.utils import build_discount_function, build_discount_function_vec
+
+    rates = np.array([0.0, 0.025, 0.05, 0.11])
+    times = np.array([1e-9, 0.5, 7.0, 30.0])
+    scalar = build_discount_function(strategy)
+    expected = [scalar(float(r), float(t)) for r, t in zip(rates, times)]
+    got = build_discount_function_vec(strategy)(rates, times)
+    assert np.allclose(got, expected, rtol=1e-14, atol=0.0)
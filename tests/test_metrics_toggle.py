@@ -32,3 +32,16 @@ def test_metrics_endpoint_absent_when_disabled():
     resp = client.get("/metrics")
     # Route should not exist -> 404
     assert resp.status_code == 404
+
+
+def test_metrics_path_label_uses_route_rule():
+    app = _create_app()
+    app.testing = True
+    client = app.test_client()
+    # Request metrics are recorded when the response is closed (after the body is sent)
+    client.get("/live").close()
+    client.get("/no/such/page/123").close()
+    body = client.get("/metrics").get_data(as_text=True)
+    assert 'path="/live"' in body
+    assert 'path="__unknown__"' in body
+    assert "/no/such/page/123" not in body
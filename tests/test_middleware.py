@@ -0,0 +1,174 @@
+from __future__ import annotations
+import logging
+from flask import g
+from gemini_ird_pricer import create_app
+
+
+def test_request_id_and_trace_context_propagate():
+    app = create_app()
+    app.config["TESTING"] = True
+    seen = {}
+
+    @app.route("/_probe_ctx")
+    def _probe_ctx():
+        seen.update(request_id=g.request_id, trace_id=g.trace_id, span_id=g.span_id)
+        return "ok"
+
+    c = app.test_client()
+    resp = c.get("/_probe_ctx", headers={"X-Request-ID": "rid-1", "traceparent": "00-trace-span-01"})
+    assert resp.headers["X-Request-ID"] == "rid-1"
+    assert seen == {"request_id": "rid-1", "trace_id": "trace", "span_id": "span"}
+
+
+def test_request_id_generated_when_absent():
+    c = create_app().test_client()
+    first = c.get("/live").headers.get("X-Request-ID")
+    second = c.get("/live").headers.get("X-Request-ID")
+    assert first and second and first != second
+
+
+def test_probe_requests_skip_access_log():
+    import logging
+
+    class _Collect(logging.Handler):
+        def __init__(self):
+            super().__init__(logging.INFO)
+            self.messages = []
+
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+
+    c = create_app().test_client()
+    access = logging.getLogger("flask.access")
+    handler = _Collect()
+    access.addHandler(handler)
+    prev_level = access.level
+    access.setLevel(logging.INFO)
+    try:
+        resp = c.get("/live")
+        resp.close()
+        c.get("/no-such-page").close()
+    finally:
+        access.removeHandler(handler)
+        access.setLevel(prev_level)
+    assert resp.headers.get("X-Request-ID")
+    assert not any("/live" in m for m in handler.messages)
+    assert any("/no-such-page" in m for m in handler.messages)
+
+
+def test_access_log_skipped_when_info_disabled():
+    import logging
+    from unittest.mock import patch
+
+    c = create_app().test_client()
+    access = logging.getLogger("flask.access")
+    prev_level = access.level
+    access.setLevel(logging.WARNING)
+    try:
+        with patch.object(access, "info") as info:
+            resp = c.get("/no-such-page")
+            resp.close()
+    finally:
+        access.setLevel(prev_level)
+    assert resp.status_code == 404
+    info.assert_not_called()
+
+
+def test_access_log_written_after_streamed_body_is_consumed():
+    import logging
+    import pytest
+    from flask import Response
+
+    app = create_app()
+
+    @app.route("/_stream")
+    def _stream():
+        def body():
+            yield b"a"
+            yield b"b"
+        return Response(body())
+
+    @app.route("/_stream_fail")
+    def _stream_fail():
+        def body():
+            yield b"a"
+            raise RuntimeError("boom")
+        return Response(body())
+
+    class _Collect(logging.Handler):
+        def __init__(self):
+            super().__init__(logging.INFO)
+            self.messages = []
+
+        def emit(self, record):
+            self.messages.append(record.getMessage())
+
+    c = app.test_client()
+    access = logging.getLogger("flask.access")
+    handler = _Collect()
+    access.addHandler(handler)
+    prev_level = access.level
+    access.setLevel(logging.INFO)
+    try:
+        resp = c.get("/_stream")
+        assert not handler.messages
+        assert resp.get_data() == b"ab"
+        resp.close()
+        assert any("/_stream -> 200" in m for m in handler.messages)
+
+        resp = c.get("/_stream_fail")
+        with pytest.raises(RuntimeError):
+            resp.get_data()
+        resp.close()
+        assert any("/_stream_fail -> 500" in m for m in handler.messages)
+    finally:
+        access.removeHandler(handler)
+        access.setLevel(prev_level)
+
+
+class _CollectAccess(logging.Handler):
+    def __init__(self, name):
+        super().__init__(logging.INFO)
+        self.messages = []
+        self.logger = logging.getLogger(name)
+        self.logger.handlers = [self]
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+
+    def emit(self, record):
+        self.messages.append(record.getMessage())
+
+
+def test_app_exception_is_recorded_as_500_and_reraised():
+    import pytest
+    from gemini_ird_pricer.middleware import ObservabilityMiddleware
+
+    def failing_app(environ, start_response):
+        raise RuntimeError("boom")
+
+    collect = _CollectAccess("test.middleware.fail")
+    mw = ObservabilityMiddleware(failing_app, logger=collect.logger)
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/fail"}
+    with pytest.raises(RuntimeError):
+        mw(environ, lambda status, headers, exc_info=None: None)
+    assert any("/fail -> 500" in m for m in collect.messages)
+
+
+def test_file_wrapper_response_is_passed_through_and_observed_on_close():
+    import io
+    from wsgiref.util import FileWrapper
+    from gemini_ird_pricer.middleware import ObservabilityMiddleware
+
+    def file_app(environ, start_response):
+        start_response("200 OK", [("Content-Type", "application/octet-stream")])
+        return environ["wsgi.file_wrapper"](io.BytesIO(b"payload"))
+
+    collect = _CollectAccess("test.middleware.file")
+    mw = ObservabilityMiddleware(file_app, logger=collect.logger)
+    environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/file", "wsgi.file_wrapper": FileWrapper}
+    body = mw(environ, lambda status, headers, exc_info=None: None)
+    assert isinstance(body, FileWrapper)
+    assert b"".join(body) == b"payload"
+    assert not collect.messages
+    body.close()
+    assert any("/file -> 200" in m for m in collect.messages)
@@ -25,6 +25,36 @@ def test_parse_notional_variants():
         parse_notional("abc")
 
 
+def test_parse_notional_enforces_configured_cap():
+    from gemini_ird_pricer.error_handler import BusinessLogicError
+
+    with pytest.raises(BusinessLogicError, match="exceeds maximum"):
+        parse_notional("500b")
+
+
+def test_parse_limits_follow_config_reload(monkeypatch):
+    from gemini_ird_pricer.config import get_config
+    from gemini_ird_pricer.error_handler import BusinessLogicError
+
+    monkeypatch.setenv("NOTIONAL_MAX", "1000000")
+    with pytest.raises(BusinessLogicError, match="exceeds maximum"):
+        parse_notional("2m")
+    monkeypatch.delenv("NOTIONAL_MAX")
+    assert parse_notional("2m") == 2_000_000
+    assert get_config().NOTIONAL_MAX == 1e11
+
+
+def test_valuation_time_follows_environment(monkeypatch):
+    from gemini_ird_pricer.utils import apply_valuation_time
+
+    dt = datetime(2024, 1, 15, 9, 30)
+    monkeypatch.delenv("VALUATION_TIME", raising=False)
+    assert apply_valuation_time(dt) == datetime(2024, 1, 15)
+    monkeypatch.setenv("VALUATION_TIME", "13:37:00")
+    assert apply_valuation_time(dt) == datetime(2024, 1, 15, 13, 37)
+    assert apply_valuation_time(dt, "08:00:00") == datetime(2024, 1, 15, 8)
+
+
 def test_parse_maturity_date_variants(monkeypatch):
     # Fix 'today' to a known date by monkeypatching datetime.today via freezegun-like approach is heavy;
     # Instead, just validate parsing pathways and positivity checks
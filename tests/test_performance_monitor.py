@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from gemini_ird_pricer import parsing, performance, services
+
+
+def _double(x):
+    return 2 * x
+
+
+def test_optional_monitor_is_skipped_unless_instrumented(monkeypatch):
+    monkeypatch.setattr(performance, "_INSTRUMENT", False)
+    assert performance.performance_monitor("double", optional=True)(_double) is _double
+    monkeypatch.setattr(performance, "_INSTRUMENT", True)
+    wrapped = performance.performance_monitor("double", optional=True)(_double)
+    assert wrapped is not _double and wrapped(2) == 4
+
+
+def test_only_parsers_skip_monitoring_by_default():
+    # Decorators were applied at import with the real PERF_INSTRUMENT value
+    assert hasattr(services._cached_load_curve, "__wrapped__")
+    if not performance._INSTRUMENT:
+        assert not hasattr(parsing.parse_notional, "__wrapped__")
+        assert not hasattr(parsing.load_yield_curve, "__wrapped__")
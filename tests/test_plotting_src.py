@@ -18,3 +18,18 @@ def test_plot_yield_curve_returns_json_string():
     obj = json.loads(s)
     assert isinstance(obj, dict)
     assert "data" in obj and "layout" in obj
+
+
+def test_plot_yield_curve_reuses_json_for_unchanged_curve():
+    val = datetime(2024, 1, 15)
+    df = pd.DataFrame(
+        {"Rate": [0.04, 0.042, 0.045]},
+        index=pd.DatetimeIndex([val + timedelta(days=d) for d in (182, 365, 730)]),
+    )
+    first = plot_yield_curve(df)
+    assert plot_yield_curve(df) is first
+    assert json.loads(first)["data"][0]["y"] == [0.04, 0.042, 0.045]
+
+    # In-place rate edits must not serve the cached chart
+    df.loc[df.index[0], "Rate"] = 0.05
+    assert json.loads(plot_yield_curve(df))["data"][0]["y"][0] == 0.05
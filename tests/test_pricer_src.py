@@ -92,3 +92,57 @@ def test_solve_par_rate_produces_near_zero_npv():
     pv, _ = pricer_src.price_swap(notional, par, maturity, essential_curve)
 
     assert abs(pv) < 5.0  # $5 tolerance on $10mm notional
+
+
+def test_vector_fast_path_matches_scalar_loop(monkeypatch):
+    maturity = essential_curve.index[0] + timedelta(days=365 * 7 + 40)
+    pv_fast, sched_fast = pricer_src.price_swap(1_000_000, 0.045, maturity, essential_curve)
+    par_fast = pricer_src.solve_par_rate(1_000_000, maturity, essential_curve)
+
+    monkeypatch.setattr(pricer_src, "_use_vector_path", lambda dc, disc: False)
+    pv_slow, sched_slow = pricer_src.price_swap(1_000_000, 0.045, maturity, essential_curve)
+    par_slow = pricer_src.solve_par_rate(1_000_000, maturity, essential_curve)
+
+    assert math.isclose(pv_fast, pv_slow, rel_tol=1e-12, abs_tol=1e-6)
+    assert math.isclose(par_fast, par_slow, rel_tol=1e-12)
+    assert len(sched_fast) == len(sched_slow)
+    for fast, slow in zip(sched_fast, sched_slow):
+        assert fast["payment_date"] == slow["payment_date"]
+        assert fast["days"] == slow["days"] and isinstance(fast["days"], int)
+        for key in ("fixed_payment", "floating_payment", "discount_factor", "pv_fixed", "pv_floating"):
+            assert math.isclose(fast[key], slow[key], rel_tol=1e-12)
+
+
+def test_curve_day_offsets_are_cached_per_index():
+    valuation = datetime(2024, 1, 15, 9, 0)
+    index = essential_curve.index
+    days = pricer_src._curve_days(index, valuation)
+    assert days.tolist() == [(d - valuation).days for d in index]
+    assert pricer_src._curve_days(index, valuation) is days
+    # A different valuation date or index object is a separate entry
+    assert pricer_src._curve_days(index, datetime(2024, 1, 15)) is not days
+    assert pricer_src._curve_days(index.copy(deep=True), valuation) is not days
+
+
+def test_fused_leg_kernel_matches_numpy_fallback():
+    from gemini_ird_pricer import kernels
+
+    rng = np.random.default_rng(7)
+    accruals = rng.uniform(0.0, 0.6, 40)
+    times = np.cumsum(accruals)
+    rates = rng.uniform(-0.01, 0.08, 40)
+    # The loop is the Numba kernel body; run it as plain Python against the NumPy path
+    loop = kernels._exp_cont_legs_loop(1e6, 0.04, accruals, times, rates)
+    vec = kernels._exp_cont_legs_numpy(1e6, 0.04, accruals, times, rates)
+    assert loop.shape == vec.shape == (5, 40)
+    assert np.allclose(loop, vec, rtol=1e-15, atol=0.0)
+
+
+def test_price_swap_columns_matches_record_schedule():
+    maturity = essential_curve.index[0] + timedelta(days=365 * 4)
+    for cfg in (None, {"DAY_COUNT": "30/360"}):
+        npv_cols, cols = pricer_src.price_swap_columns(1_000_000, 0.045, maturity, essential_curve, cfg)
+        npv, records = pricer_src.price_swap(1_000_000, 0.045, maturity, essential_curve, cfg)
+        assert npv_cols == npv
+        assert len(cols) == len(records) and cols.to_records() == records
+        assert math.isclose(float(cols.pv_fixed.sum()), sum(r["pv_fixed"] for r in records), rel_tol=1e-12)
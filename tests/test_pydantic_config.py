@@ -4,7 +4,7 @@ import os
 import pytest
 from unittest.mock import patch
 from pydantic import ValidationError
-from src.gemini_ird_pricer.config import Config, ProductionConfig, get_config
+from src.gemini_ird_pricer.config import Config, ProductionConfig, clear_config_cache, get_config
 
 
 class TestPydanticConfig:
@@ -158,3 +158,48 @@ class TestPydanticConfig:
         # Should be able to get model dump
         config_dict = config.model_dump()
         assert config_dict["MAX_ITERATIONS"] == 8000
+
+
+def test_get_config_is_memoized_but_tracks_environment(monkeypatch):
+    monkeypatch.delenv("MAX_ITERATIONS", raising=False)
+    first = get_config("development")
+    assert get_config("development") is first
+    monkeypatch.setenv("MAX_ITERATIONS", "5000")
+    changed = get_config("development")
+    assert changed is not first
+    assert changed.MAX_ITERATIONS == 5000
+
+
+def test_clear_config_cache_reloads_instance():
+    first = get_config("development")
+    clear_config_cache()
+    assert get_config("development") is not first
+
+
+def test_get_config_instances_are_read_only():
+    shared = get_config("development")
+    with pytest.raises(AttributeError):
+        shared.DATA_DIR = "/tmp/elsewhere"
+    copied = shared.model_copy(update={"DATA_DIR": "/tmp/elsewhere"})
+    assert copied.DATA_DIR == "/tmp/elsewhere"
+    copied.MAX_ITERATIONS = 5000
+    assert copied.MAX_ITERATIONS == 5000
+    assert shared.model_copy().DATA_DIR == shared.DATA_DIR
+    with pytest.raises(AttributeError):
+        shared.DATA_DIR = "/tmp/elsewhere"
+    private = Config()
+    private.DATA_DIR = "/tmp/elsewhere"
+    assert private.DATA_DIR == "/tmp/elsewhere"
+
+
+def test_is_production_is_derived_from_env():
+    assert ProductionConfig().is_production
+    assert Config(ENV="Prod-EU").is_production
+    assert not Config(ENV="development").is_production
+    assert "is_production" not in Config().model_dump()
+
+
+def test_is_production_follows_copied_config():
+    base = Config(ENV="development")
+    assert base.model_copy(update={"ENV": "production"}).is_production
+    assert not ProductionConfig().model_copy(update={"ENV": "staging"}).is_production
@@ -0,0 +1,64 @@
+from __future__ import annotations
+import os
+import json
+from flask import Flask
+from gemini_ird_pricer.__init__ import create_app
+
+
+def _prepare_curve(tmp_path) -> str:
+    data_dir = tmp_path / "data" / "curves"
+    data_dir.mkdir(parents=True)
+    src = os.path.join(os.path.dirname(__file__), "data", "SwapRates_20240115.csv")
+    dst = data_dir / "SwapRates_20240115.csv"
+    with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+        fdst.write(fsrc.read())
+    return str(data_dir)
+
+
+def test_api_rate_limit_returns_429_after_limit(tmp_path, monkeypatch):
+    data_dir = _prepare_curve(tmp_path)
+    monkeypatch.setenv("ENABLE_RATE_LIMIT", "true")
+    monkeypatch.setenv("RATE_LIMIT_PER_MIN", "2")
+    app: Flask = create_app()
+    app.config.update({"TESTING": True, "DATA_DIR": data_dir})
+    client = app.test_client()
+
+    payload = {"notional": "1m", "maturity_date": "5y"}
+    statuses = [
+        client.post("/api/solve", data=json.dumps(payload), content_type="application/json").status_code
+        for _ in range(3)
+    ]
+    assert statuses[:2] == [200, 200]
+    assert statuses[2] == 429
+
+    resp = client.post("/api/solve", data=json.dumps(payload), content_type="application/json")
+    assert resp.status_code == 429
+    assert resp.headers.get("Retry-After") == "60"
+    assert resp.get_json()["error"]["type"] == "rate_limited"
+
+    # Limits are tracked per path
+    priced = client.post(
+        "/api/price",
+        data=json.dumps({**payload, "fixed_rate": 5.0}),
+        content_type="application/json",
+    )
+    assert priced.status_code == 200
+
+
+def test_api_rate_limit_is_exact_under_concurrency(tmp_path, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    data_dir = _prepare_curve(tmp_path)
+    monkeypatch.setenv("ENABLE_RATE_LIMIT", "true")
+    monkeypatch.setenv("RATE_LIMIT_PER_MIN", "5")
+    app: Flask = create_app()
+    app.config.update({"TESTING": True, "DATA_DIR": data_dir})
+    body = json.dumps({"notional": "1m", "maturity_date": "5y"})
+
+    def _post(_):
+        return app.test_client().post("/api/solve", data=body, content_type="application/json").status_code
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        statuses = list(pool.map(_post, range(20)))
+    assert statuses.count(200) == 5
+    assert statuses.count(429) == 15
@@ -31,3 +31,152 @@ def test_cache_metrics_increment_on_hit(tmp_path, monkeypatch):
 
     assert m2["hits"] >= m1["hits"] + 1
     assert df1.equals(df2)
+
+
+def test_cache_reloads_when_file_changes_within_same_mtime(tmp_path):
+    dst_dir = tmp_path / "curves"
+    dst_dir.mkdir()
+    dst = dst_dir / "SwapRates_20240115.csv"
+    dst.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n")
+    st = os.stat(dst)
+
+    svc = build_services(get_config())
+    df1 = svc.load_curve(str(dst))
+    # Rewrite with a different size but restore the original timestamp
+    dst.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n3,6.0\n")
+    os.utime(dst, ns=(st.st_atime_ns, st.st_mtime_ns))
+    df2 = svc.load_curve(str(dst))
+    assert len(df1) == 2
+    assert len(df2) == 3
+
+
+def test_sharded_cache_stays_within_maxsize(tmp_path):
+    from gemini_ird_pricer.services import get_cache_policy
+
+    cfg = get_config().model_copy(update={"CURVE_CACHE_MAXSIZE": 3})
+    svc = build_services(cfg)
+    before = get_cache_metrics()
+    for i in range(1, 8):
+        f = tmp_path / f"SwapRates_2099020{i}.csv"
+        f.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n")
+        svc.load_curve(str(f))
+    after = get_cache_metrics()
+    policy = get_cache_policy()
+    assert policy["maxsize"] == 3
+    assert 1 <= policy["size"] <= 3
+    assert after["evictions"] >= before["evictions"] + 4
+
+
+def test_small_cache_evicts_least_recently_used(tmp_path):
+    from gemini_ird_pricer import services
+
+    svc = build_services(get_config().model_copy(update={"CURVE_CACHE_MAXSIZE": 2}))
+    assert len(services._shards) == 1
+    paths = []
+    for name in ("a", "b", "c"):
+        f = tmp_path / f"SwapRates_{name}.csv"
+        f.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n")
+        paths.append(str(f))
+    a, b, c = paths
+
+    svc.load_curve(a)
+    svc.load_curve(b)
+    svc.load_curve(a)  # hit: b is now least recently used
+    svc.load_curve(c)  # evicts b
+    cached = services._shards[0][1]
+    assert list(cached) == [os.path.abspath(a), os.path.abspath(c)]
+
+    before = get_cache_metrics()
+    svc.load_curve(a)
+    assert get_cache_metrics()["hits"] == before["hits"] + 1
+    svc.load_curve(b)
+    assert get_cache_metrics()["misses"] == before["misses"] + 1
+
+
+def test_event_counter_is_exact_across_threads():
+    from concurrent.futures import ThreadPoolExecutor
+    from gemini_ird_pricer.services import _EventCounter
+
+    counter = _EventCounter()
+
+    def _bump(_):
+        for _ in range(1000):
+            counter.inc()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(_bump, range(16)))
+    # Counts from worker threads that have since exited are kept
+    counter.inc()
+    assert counter.value() == 16 * 1000 + 1
+
+
+def test_path_validation_is_memoized_per_data_dir(tmp_path, monkeypatch):
+    from gemini_ird_pricer import services
+
+    path = str(tmp_path / "SwapRates_20240115.csv")
+    assert services._resolve_and_validate(path) == path
+    info = services._validated_path.cache_info()
+    services._resolve_and_validate(path)
+    assert services._validated_path.cache_info().hits == info.hits + 1
+
+    # A different configured DATA_DIR re-runs the traversal guard
+    monkeypatch.setenv("DATA_DIR", str(tmp_path))
+    services._resolve_and_validate(path)
+    assert services._validated_path.cache_info().misses == info.misses + 1
+
+
+def test_stat_coalesce_window_reuses_file_signature(tmp_path):
+    dst = tmp_path / "SwapRates_20240115.csv"
+    dst.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n")
+
+    svc = build_services(get_config().model_copy(update={"CURVE_STAT_COALESCE_SECONDS": 60}))
+    try:
+        df1 = svc.load_curve(str(dst))
+        # Rewrite inside the window: the cached curve is served without a fresh stat
+        dst.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n3,6.0\n")
+        assert svc.load_curve(str(dst)) is df1
+    finally:
+        svc = build_services(get_config())
+    assert len(svc.load_curve(str(dst))) == 3
+
+
+def test_stale_while_revalidate_renews_unchanged_entry_without_reload(tmp_path):
+    import time
+    from gemini_ird_pricer import services
+
+    dst = tmp_path / "SwapRates_20240115.csv"
+    dst.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n")
+    svc = build_services(get_config().model_copy(update={"CURVE_CACHE_SWR_ENABLED": True, "CURVE_CACHE_TTL_SECONDS": 1}))
+    try:
+        df1 = svc.load_curve(str(dst))
+        time.sleep(1.1)
+        # Expired but unchanged: served as-is and its TTL restarted, with no background reload
+        assert svc.load_curve(str(dst)) is df1
+        assert not services._refreshing
+        time.sleep(0.5)
+        assert svc.load_curve(str(dst)) is df1
+    finally:
+        build_services(get_config())
+
+
+def test_stale_while_revalidate_serves_stale_and_reloads_changed_file(tmp_path):
+    import time
+    from gemini_ird_pricer import services
+
+    dst = tmp_path / "SwapRates_20240115.csv"
+    dst.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n")
+    svc = build_services(get_config().model_copy(update={"CURVE_CACHE_SWR_ENABLED": True, "CURVE_CACHE_TTL_SECONDS": 1}))
+    try:
+        df1 = svc.load_curve(str(dst))
+        time.sleep(1.1)
+        dst.write_text("Maturity (Years),Rate\n1,5.0\n2,5.5\n3,6.0\n")
+        # Expired and changed: the stale frame is returned while a reload runs in the background
+        assert svc.load_curve(str(dst)) is df1
+        deadline = time.time() + 5
+        while services._refreshing and time.time() < deadline:
+            time.sleep(0.01)
+        df2 = svc.load_curve(str(dst))
+        assert len(df1) == 2
+        assert len(df2) == 3
+    finally:
+        build_services(get_config())
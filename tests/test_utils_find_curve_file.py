@@ -39,3 +39,48 @@ def test_find_curve_file_fallbacks_to_project_root_when_no_primary_match(tmp_pat
             fallback_file.unlink()
         except FileNotFoundError:
             pass
+
+
+def test_list_curve_files_cache_picks_up_new_files(tmp_path):
+    from gemini_ird_pricer import utils
+
+    (tmp_path / "SwapRates_20240101.csv").write_text("1,2\n", encoding="utf-8")
+    (tmp_path / "other.csv").write_text("1,2\n", encoding="utf-8")
+    # Backdate the directory so the first listing is eligible for caching
+    os.utime(tmp_path, (0, 0))
+    first = utils.list_curve_files(str(tmp_path), "SwapRates_*.csv")
+    assert [Path(p).name for p in first] == ["SwapRates_20240101.csv"]
+    assert utils.list_curve_files(str(tmp_path), "SwapRates_*.csv") == first
+
+    (tmp_path / "SwapRates_20250101.csv").write_text("1,2\n", encoding="utf-8")
+    names = sorted(Path(p).name for p in utils.list_curve_files(str(tmp_path), "SwapRates_*.csv"))
+    assert names == ["SwapRates_20240101.csv", "SwapRates_20250101.csv"]
+
+
+def test_find_curve_file_reuses_pick_until_directory_changes(tmp_path):
+    from gemini_ird_pricer import utils
+
+    (tmp_path / "SwapRates_20240101.csv").write_text("1,2\n", encoding="utf-8")
+    os.utime(tmp_path, (0, 0))
+    cfg = _Cfg(str(tmp_path))
+    assert Path(find_curve_file(cfg)).name == "SwapRates_20240101.csv"
+    hits = utils._latest_curve_file.cache_info().hits
+    assert Path(find_curve_file(cfg)).name == "SwapRates_20240101.csv"
+    assert utils._latest_curve_file.cache_info().hits == hits + 1
+
+    (tmp_path / "SwapRates_20250101.csv").write_text("1,2\n", encoding="utf-8")
+    assert Path(find_curve_file(cfg)).name == "SwapRates_20250101.csv"
+
+
+def test_ensure_in_data_dir_prefix_check(tmp_path, monkeypatch):
+    import pytest
+    from gemini_ird_pricer.utils import ensure_in_data_dir
+
+    data_dir = tmp_path / "curves"
+    monkeypatch.setenv("DATA_DIR", str(data_dir))
+    monkeypatch.delenv("PYTEST_CURRENT_TEST")
+    ensure_in_data_dir(str(data_dir))
+    ensure_in_data_dir(str(data_dir / "SwapRates_20240101.csv"))
+    for outside in (tmp_path / "curves_old" / "x.csv", data_dir / ".." / "x.csv", tmp_path):
+        with pytest.raises(ValueError, match="outside the data directory"):
+            ensure_in_data_dir(str(outside))
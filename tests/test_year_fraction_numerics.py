@@ -2,7 +2,9 @@ from __future__ import annotations
 from datetime import datetime
 import math
 
-from gemini_ird_pricer.utils import year_fraction
+import pytest
+
+from gemini_ird_pricer.utils import year_fraction, year_fraction_array
 
 
 def test_act_act_exact_one_year_boundary():
@@ -33,3 +35,26 @@ def test_30_360_simple_case():
     # Using 30/360 US simplified: both days clamped to 30
     expected = ((0) * 360 + (1) * 30 + (30 - 30)) / 360.0  # 30 days / 360 = 1/12
     assert abs(year_fraction(start, end, "30/360") - (30 / 360.0)) < 1e-12
+
+
+@pytest.mark.parametrize(
+    "day_count", ["ACT/365F", "ACT/365.25", "ACT/360", "30/360", "ACT/ACT", "ACT/365L"]
+)
+def test_year_fraction_array_matches_scalar(day_count):
+    starts = [
+        datetime(2019, 7, 1),
+        datetime(2020, 2, 28, 17, 30),
+        datetime(2023, 12, 31),
+        datetime(2024, 3, 1),
+    ]
+    ends = [
+        datetime(2020, 7, 1),
+        datetime(2024, 2, 29),
+        datetime(2023, 6, 30),
+        datetime(2054, 1, 31, 6),
+    ]
+    got = year_fraction_array(starts, ends, day_count)
+    expected = [
+        year_fraction(s, e, day_count) for s, e in zip(starts, ends, strict=True)
+    ]
+    assert got.tolist() == expected